@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 좌석 점유율/수요 분석 — analytics.py  (python analytics.py [--from YYYY-MM-DD] [--to YYYY-MM-DD] [--csv DIR] [DIR])
+
+상영마다 영화 레코드의 좌석 마스크(예매된 좌석 = 1, 예매 레코드 좌석의 합과 같음)에서 예매 좌석 수를 세어 집계합니다.
+  • 상영별   : 예매 좌석 / 예매 가능 좌석(상영관 좌석 - 막힌 좌석), 매진 여부
+  • 제목별 / 요일별 / 시간대별(시작 시각의 시) : 상영 수, 매진 수, 예매 좌석 합, 예매 가능 좌석 합, 점유율
+  • 좌석별   : 상영관마다 각 좌석이 예매된 상영 수 — 콘솔에는 상영관 배치 모양의 히트맵(예매 비율 %)
+읽는 데이터: 검사를 통과한 데이터 파일(날짜 색인으로 기간만 순회)과 기간에 걸친 달의 보관 파티션(archive.py,
+영화 파티션만 읽음) — 여러 해 치 기록도 한 번에 분석합니다.
+집계 방법:
+  • 그룹 카운터는 array('Q') — 그룹 이름은 처음 나올 때 번호를 매기고 번호로 카운터를 올림
+  • 좌석 카운터는 상영관마다 비트 단위 세로 카운터(bit-sliced) — 마스크 하나를 더할 때 좌석 수와 무관하게
+    log2(상영 수)번 이하의 정수 연산으로 모든 좌석을 한꺼번에 올리고, 끝에 좌석별 array('Q')로 펼침
+--csv DIR을 주면 showings.csv, titles.csv, weekdays.csv, slots.csv, seats.csv를 씀 (UTF-8 BOM — 표 계산 프로그램 호환).
+SQLite 저장소(kucinema.db)는 분석을 지원하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+import time
+import unicodedata
+from array import array
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from archive import ARCHIVE_DIR, open_repository, read_manifest, read_partition_movies
+from repository import CinemaRepository, movie_hall
+from seatmask import ROW_LABELS, Hall
+
+WEEKDAYS = ("월", "화", "수", "목", "금", "토", "일")
+GROUP_HEADER = ("상영 수", "매진", "예매 좌석", "예매 가능 좌석", "점유율(%)")
+
+
+# ---------------------------------------------------------------
+# 카운터
+# ---------------------------------------------------------------
+class GroupCounter:
+    """그룹(제목/요일/시간대)별 상영 수, 매진 수, 예매 좌석 합, 예매 가능 좌석 합 — 그룹 번호로 색인하는 array('Q')"""
+
+    __slots__ = ("names", "index", "showings", "sold_out", "booked", "capacity")
+
+    def __init__(self, names=()) -> None:
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.showings = array("Q")
+        self.sold_out = array("Q")
+        self.booked = array("Q")
+        self.capacity = array("Q")
+        for name in names:
+            self.slot(name)
+
+    def slot(self, name: str) -> int:
+        """그룹 번호 (처음 나온 이름이면 카운터를 하나 늘림)"""
+        i = self.index.get(name)
+        if i is None:
+            i = self.index[name] = len(self.names)
+            self.names.append(name)
+            for counter in (self.showings, self.sold_out, self.booked, self.capacity):
+                counter.append(0)
+        return i
+
+    def add(self, name: str, booked: int, capacity: int) -> None:
+        i = self.slot(name)
+        self.showings[i] += 1
+        self.sold_out[i] += booked == capacity
+        self.booked[i] += booked
+        self.capacity[i] += capacity
+
+    def rows(self) -> List[Tuple[str, int, int, int, int, float]]:
+        """[(이름, 상영 수, 매진, 예매 좌석, 예매 가능 좌석, 점유율 %)] — 상영이 없는 그룹도 포함 (이름을 매긴 순서)"""
+        return [(name, self.showings[i], self.sold_out[i], self.booked[i], self.capacity[i],
+                 occupancy(self.booked[i], self.capacity[i]))
+                for i, name in enumerate(self.names)]
+
+
+class SeatHeat:
+    """
+    상영관 하나의 좌석별 예매 횟수 — 비트 단위 세로 카운터.
+    planes[k]의 좌석 비트는 그 좌석 카운터의 2^k 자리이므로, 마스크를 더하는 것은 자리마다 XOR/AND 한 번(반가산기).
+    """
+
+    __slots__ = ("hall", "planes", "showings")
+
+    def __init__(self, hall: Hall) -> None:
+        self.hall = hall
+        self.planes: List[int] = []
+        self.showings = 0
+
+    def add(self, mask: int) -> None:
+        self.showings += 1
+        planes = self.planes
+        carry = mask
+        for k, plane in enumerate(planes):
+            if not carry:
+                return
+            planes[k] = plane ^ carry
+            carry &= plane
+        if carry:
+            planes.append(carry)
+
+    def counts(self) -> array:
+        """좌석 비트 번호 → 예매된 상영 수"""
+        counts = array("Q", bytes(8 * self.hall.count))
+        for k, plane in enumerate(self.planes):
+            weight = 1 << k
+            while plane:
+                low = plane & -plane
+                counts[low.bit_length() - 1] += weight
+                plane ^= low
+        return counts
+
+
+def occupancy(booked: int, capacity: int) -> float:
+    """점유율 % (예매 가능 좌석이 없으면 0)"""
+    return 100.0 * booked / capacity if capacity else 0.0
+
+
+def time_slot(time_str: str) -> str:
+    """상영 시간 HH:MM-HH:MM → 시간대 HH:00 (시작 시각의 시)"""
+    return f"{time_str[:2]}:00"
+
+
+# ---------------------------------------------------------------
+# 집계
+# ---------------------------------------------------------------
+class Report:
+    """기간 안의 상영을 한 번 훑어 만든 집계 결과"""
+
+    def __init__(self) -> None:
+        self.showings: List[Tuple[str, str, str, str, str, str, int, int]] = []   # (고유번호, 날짜, 요일, 시간, 제목, 상영관, 예매, 가능)
+        self.titles = GroupCounter()
+        self.weekdays = GroupCounter(WEEKDAYS)
+        self.slots = GroupCounter()
+        self.seats: Dict[str | None, SeatHeat] = {}
+        self._weekday_of: Dict[str, str] = {}
+
+    def add(self, movie: dict, hall: Hall) -> None:
+        mask = movie["seats"]
+        booked = mask.bit_count()
+        capacity = hall.count - hall.blocked.bit_count()
+        day = movie["date"]
+        weekday = self._weekday_of.get(day)
+        if weekday is None:
+            weekday = self._weekday_of[day] = WEEKDAYS[date.fromisoformat(day).weekday()]
+        self.showings.append((movie["id"], day, weekday, movie["time"], movie["title"], hall.id or "", booked, capacity))
+        self.titles.add(movie["title"], booked, capacity)
+        self.weekdays.add(weekday, booked, capacity)
+        self.slots.add(time_slot(movie["time"]), booked, capacity)
+        heat = self.seats.get(hall.id)
+        if heat is None:
+            heat = self.seats[hall.id] = SeatHeat(hall)
+        heat.add(mask)
+
+    def total(self) -> Tuple[int, int, int, int]:
+        """(상영 수, 매진, 예매 좌석, 예매 가능 좌석)"""
+        w = self.weekdays
+        return sum(w.showings), sum(w.sold_out), sum(w.booked), sum(w.capacity)
+
+
+def iter_showings(repo: CinemaRepository, archive_dir: Path, first: str | None,
+                  last: str | None) -> Iterator[Tuple[dict, Hall]]:
+    """
+    기간 [first, last](None이면 열림) 안의 (영화 레코드, 상영관).
+    보관 파티션은 기간에 걸친 달만 달 순서로 읽고, 데이터 파일은 날짜 색인에서 first부터 last까지만 순회.
+    """
+    lo, hi = first or "", last or "9999-99-99"
+    halls = repo.halls
+    for month in sorted(read_manifest(archive_dir)):
+        if lo[:7] <= month <= hi[:7]:
+            for movie in read_partition_movies(archive_dir, month):
+                if lo <= movie["date"] <= hi:
+                    yield movie, movie_hall(movie, halls)
+    for movie in repo.iter_movies_from(lo):
+        if movie["date"] > hi:
+            break
+        yield movie, movie_hall(movie, halls)
+
+
+def analyze(repo: CinemaRepository, archive_dir: Path, first: str | None = None, last: str | None = None) -> Report:
+    report = Report()
+    for movie, hall in iter_showings(repo, archive_dir, first, last):
+        report.add(movie, hall)
+    return report
+
+
+# ---------------------------------------------------------------
+# 출력
+# ---------------------------------------------------------------
+def _pad(text: str, width: int, right: bool = False) -> str:
+    """터미널 표시 폭(한글 등 전각 문자는 2칸) 기준으로 width칸에 맞춤"""
+    shown = sum(2 if unicodedata.east_asian_width(ch) in "WF" else 1 for ch in text)
+    fill = " " * max(0, width - shown)
+    return fill + text if right else text + fill
+
+
+def _group_table(title: str, rows, order_by_occupancy: bool) -> None:
+    rows = [r for r in rows if r[1]]
+    if order_by_occupancy:
+        rows.sort(key=lambda r: (-r[5], r[0]))
+    widths = (8, 6, 10, 15, 10)
+    print(f"\n[{title}]")
+    print(_pad("", 24) + "".join(_pad(h, w, True) for h, w in zip(GROUP_HEADER, widths)))
+    for name, showings, sold_out, booked, capacity, rate in rows:
+        cells = (str(showings), str(sold_out), str(booked), str(capacity), f"{rate:.1f}")
+        print(_pad(name, 24) + "".join(_pad(c, w, True) for c, w in zip(cells, widths)))
+
+
+def _heatmap(heat: SeatHeat) -> None:
+    hall = heat.hall
+    counts = heat.counts()
+    name = hall.id or "기본 상영관"
+    print(f"\n[좌석별 예매 비율(%) — {name}, 상영 {heat.showings}개, × = 막힌 좌석]")
+    print("    " + "".join(f"{c:>4}" for c in range(1, hall.cols + 1)))
+    for r in range(hall.rows):
+        cells = []
+        for c in range(hall.cols):
+            bit = r * hall.cols + c
+            if hall.blocked >> bit & 1:
+                cells.append(f"{'×':>4}")
+            else:
+                cells.append(f"{round(100 * counts[bit] / heat.showings):>4}")
+        print(f"{ROW_LABELS[r]:<4}" + "".join(cells))
+
+
+def print_report(report: Report, top: int) -> None:
+    showings, sold_out, booked, capacity = report.total()
+    print(f"상영 {showings}개, 매진 {sold_out}개, 예매 좌석 {booked}/{capacity} — 점유율 "
+          f"{occupancy(booked, capacity):.1f}%")
+    if not showings:
+        return
+    ranked = sorted(report.showings, key=lambda s: (-occupancy(s[6], s[7]), s[0]))
+    print(f"\n[점유율 상위 상영 {min(top, len(ranked))}개]")
+    for mid, day, weekday, time_str, title, hall_id, b, cap in ranked[:top]:
+        hall = f" | {hall_id}" if hall_id else ""
+        print(f"{day}({weekday}) {time_str} | {title}{hall} | {b}/{cap} ({occupancy(b, cap):.1f}%)")
+    _group_table("제목별", report.titles.rows(), True)
+    _group_table("요일별", report.weekdays.rows(), False)
+    _group_table("시간대별", sorted(report.slots.rows()), False)
+    for hall_id in sorted(report.seats, key=lambda h: h or ""):
+        _heatmap(report.seats[hall_id])
+
+
+def write_csv(report: Report, out_dir: Path) -> List[Path]:
+    """집계 결과를 CSV 다섯 개로 씀. return: 쓴 파일 경로"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+
+    def write(name: str, header, rows) -> None:
+        path = out_dir / name
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(header)
+            w.writerows(rows)
+        written.append(path)
+
+    write("showings.csv", ("고유번호", "날짜", "요일", "시간", "제목", "상영관", "예매 좌석", "예매 가능 좌석", "점유율(%)"),
+          (s + (f"{occupancy(s[6], s[7]):.2f}",) for s in sorted(report.showings)))
+    for name, label, counter in (("titles.csv", "제목", report.titles), ("weekdays.csv", "요일", report.weekdays),
+                                 ("slots.csv", "시간대", report.slots)):
+        rows = counter.rows() if counter is report.weekdays else sorted(counter.rows())
+        write(name, (label,) + GROUP_HEADER, (r[:5] + (f"{r[5]:.2f}",) for r in rows))
+
+    seat_rows = []
+    for hall_id in sorted(report.seats, key=lambda h: h or ""):
+        heat = report.seats[hall_id]
+        hall = heat.hall
+        for bit, count in enumerate(heat.counts()):
+            blocked = hall.blocked >> bit & 1
+            rate = "" if blocked else f"{100 * count / heat.showings:.2f}"
+            seat_rows.append((hall.id or "", hall.names[bit], bit // hall.cols + 1, bit % hall.cols + 1,
+                              "Y" if blocked else "N", count, heat.showings, rate))
+    write("seats.csv", ("상영관", "좌석", "행", "열", "막힌 좌석", "예매된 상영 수", "상영 수", "예매 비율(%)"), seat_rows)
+    return written
+
+
+# ---------------------------------------------------------------
+# 명령행
+# ---------------------------------------------------------------
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="analytics.py", description="KUCinema 좌석 점유율/수요 분석")
+    parser.add_argument("--from", dest="first", metavar="YYYY-MM-DD", help="분석 시작 날짜 (포함, 기본: 처음부터)")
+    parser.add_argument("--to", dest="last", metavar="YYYY-MM-DD", help="분석 끝 날짜 (포함, 기본: 끝까지)")
+    parser.add_argument("--csv", type=Path, metavar="DIR", help="CSV 파일을 쓸 폴더")
+    parser.add_argument("--top", type=int, default=10, help="점유율 상위 상영 몇 개를 출력할지")
+    parser.add_argument("data_dir", nargs="?", type=Path, default=Path.cwd(), help="데이터 디렉터리 (기본: 현재 경로)")
+    args = parser.parse_args(argv)
+    from cinema import DATABASE_FILE, is_valid_date_string
+
+    if (args.data_dir / DATABASE_FILE).exists():
+        print(f"!!! 오류: SQLite 저장소({DATABASE_FILE})는 분석을 지원하지 않습니다.")
+        return 1
+    for value in (args.first, args.last):
+        if value is not None and not is_valid_date_string(value):
+            print(f"!!! 오류: 올바른 날짜가 아닙니다: {value}")
+            return 1
+    if args.first and args.last and args.first > args.last:
+        print(f"!!! 오류: 시작 날짜가 끝 날짜보다 늦습니다: {args.first} > {args.last}")
+        return 1
+    try:
+        repo = open_repository(args.data_dir)
+        started = time.perf_counter()
+        report = analyze(repo, args.data_dir / ARCHIVE_DIR, args.first, args.last)
+        elapsed = time.perf_counter() - started
+    except (OSError, ValueError, EOFError) as e:
+        print(f"!!! 오류: {e}")
+        return 1
+    print_report(report, max(0, args.top))
+    if args.csv is not None:
+        try:
+            paths = write_csv(report, args.csv)
+        except OSError as e:
+            print(f"!!! 오류: {e}")
+            return 1
+        print(f"\nCSV {len(paths)}개를 썼습니다: {args.csv}")
+    print(f"\n집계 시간 {elapsed * 1000:.0f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 지난 상영 보관소 — archive.py  (python archive.py seal|restore|history ...)
+
+영화/예매 데이터 파일에는 지난 상영이 계속 쌓이므로, 상영 날짜가 속한 달(YYYY-MM)이 지난 상영은
+그 예매와 함께 월별 보관 파티션으로 옮겨 작업 집합(시작 검사와 메뉴 1~4가 읽는 데이터)을 작게 유지합니다.
+  • 파티션   : archive/movie-schedule-YYYY-MM.txt.gz, archive/booking-info-YYYY-MM.txt.gz
+               gzip으로 압축한 영화/예매 데이터 파일 (행 형식은 같음, 영화는 고유번호 오름차순, 예매는 살아 있는 예매만)
+  • 목록     : archive/manifest.txt — 파티션마다 한 행 <YYYY-MM>/<영화 수>/<예매 수>/<sha256>/<지문>/<지문>
+               sha256은 두 압축 파일 바이트의 해시, 지문은 마지막으로 확인한 각 파일의 <크기>:<mtime_ns>
+  • 봉인     : 콘솔에서 날짜를 입력하면(6.1) 그 날짜가 속한 달보다 앞선 달의 상영을 옮김 (seal_before).
+               영화 데이터 파일은 비어 있을 수 없으므로 상영이 모두 지났으면 마지막 달은 남김.
+               같은 달 파티션이 이미 있으면 합쳐서 다시 씀. 일괄 처리/서버 모드는 python archive.py seal YYYY-MM-DD
+  • 검사     : 시작 시 목록의 지문과 같은 파티션은 읽지 않음. 목록에 없거나 바뀐 파티션만 한 번 검사하고
+               해시와 지문을 기록 (cinema.verify_archive — 데이터 파일과 같은 규칙)
+  • 조회     : 메뉴 1~4는 보관된 상영을 읽지 않음. python archive.py history [--student 학번] [--month YYYY-MM]
+  • 되돌리기 : python archive.py restore YYYY-MM (잘못 입력한 날짜로 봉인된 달을 데이터 파일로 되돌림)
+파티션을 먼저 쓰고 데이터 파일에서 빼므로, 도중에 멈추면 같은 상영이 양쪽에 남을 수 있으며 다음 봉인이 합칩니다.
+SQLite 저장소(kucinema.db)는 보관을 지원하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from repository import CinemaRepository, format_booking_line, format_movie_line, movie_hall, parse_booking_line, \
+    parse_movie_line
+from seatmask import Hall
+
+ARCHIVE_DIR = "archive"   # 데이터 디렉터리 안의 보관 폴더 (cinema.ARCHIVE_DIR와 같음)
+MANIFEST_FILE = "manifest.txt"
+MOVIE_PREFIX = "movie-schedule-"
+BOOKING_PREFIX = "booking-info-"
+SUFFIX = ".txt.gz"
+
+
+# ---------------------------------------------------------------
+# 파티션 파일
+# ---------------------------------------------------------------
+def month_of(date_str: str) -> str:
+    """YYYY-MM-DD → 파티션 이름 YYYY-MM"""
+    return date_str[:7]
+
+
+def partition_paths(archive_dir: Path, month: str) -> Tuple[Path, Path]:
+    """(영화 파티션, 예매 파티션) 경로"""
+    return archive_dir / f"{MOVIE_PREFIX}{month}{SUFFIX}", archive_dir / f"{BOOKING_PREFIX}{month}{SUFFIX}"
+
+
+def partition_stamp(paths: Tuple[Path, Path]) -> Tuple[Tuple[int, int], ...]:
+    """파티션 두 파일의 (크기, mtime_ns) — 바뀌지 않았으면 해시를 다시 계산하지 않음"""
+    stamps = []
+    for path in paths:
+        st = path.stat()
+        stamps.append((st.st_size, st.st_mtime_ns))
+    return tuple(stamps)
+
+
+def partition_checksum(paths: Tuple[Path, Path]) -> str:
+    """파티션 두 파일(압축된 바이트)의 sha256"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def read_partition_lines(archive_dir: Path, month: str) -> Tuple[List[str], List[str]]:
+    """파티션의 (영화 레코드 행, 예매 레코드 행). 압축이 깨졌으면 OSError/EOFError/UnicodeDecodeError"""
+    movie_path, booking_path = partition_paths(archive_dir, month)
+    return (gzip.decompress(movie_path.read_bytes()).decode("utf-8").splitlines(),
+            gzip.decompress(booking_path.read_bytes()).decode("utf-8").splitlines())
+
+
+def read_partition(archive_dir: Path, month: str) -> Tuple[List[dict], List[dict]]:
+    """검사를 통과한 파티션의 (영화 레코드, 예매 레코드)"""
+    movie_lines, booking_lines = read_partition_lines(archive_dir, month)
+    return ([parse_movie_line(line) for line in movie_lines if line],
+            [parse_booking_line(line) for line in booking_lines if line])
+
+
+def read_partition_movies(archive_dir: Path, month: str) -> List[dict]:
+    """검사를 통과한 파티션의 영화 레코드만 (예매 파티션은 읽지 않음 — 영화 좌석 벡터가 예매 합과 같음)"""
+    lines = gzip.decompress(partition_paths(archive_dir, month)[0].read_bytes()).decode("utf-8").splitlines()
+    return [parse_movie_line(line) for line in lines if line]
+
+
+def _write_gzip(path: Path, lines: List[str]) -> None:
+    """행들을 gzip으로 압축해 원자적으로 씀 (mtime=0 — 내용이 같으면 바이트도 같음)"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(gzip.compress("\n".join(lines).encode("utf-8"), mtime=0))
+    os.replace(tmp_path, path)
+
+
+def write_partition(archive_dir: Path, month: str, movies: List[dict], bookings: List[dict],
+                    halls: Dict[str, Hall]) -> dict:
+    """파티션 두 파일을 씀. return: 목록 항목 (영화/예매 수, 해시, 지문)"""
+    archive_dir.mkdir(exist_ok=True)
+    counts = {m["id"]: movie_hall(m, halls).count for m in movies}
+    paths = partition_paths(archive_dir, month)
+    _write_gzip(paths[0], [format_movie_line(m, counts[m["id"]]) for m in movies])
+    _write_gzip(paths[1], [format_booking_line(b, counts[b["movie_id"]]) for b in bookings])
+    return manifest_entry(len(movies), len(bookings), partition_checksum(paths), partition_stamp(paths))
+
+
+def list_partitions(archive_dir: Path, entries: Dict[str, dict]) -> List[str]:
+    """목록에 있거나 폴더에 파일이 있는 파티션 이름 (오름차순)"""
+    months = set(entries)
+    for prefix in (MOVIE_PREFIX, BOOKING_PREFIX):
+        for path in archive_dir.glob(f"{prefix}*{SUFFIX}"):
+            months.add(path.name[len(prefix):-len(SUFFIX)])
+    return sorted(months)
+
+
+# ---------------------------------------------------------------
+# 목록 (manifest.txt)
+# ---------------------------------------------------------------
+def manifest_entry(movies: int, bookings: int, sha256: str, stamp: Tuple[Tuple[int, int], ...]) -> dict:
+    return {"movies": movies, "bookings": bookings, "sha256": sha256, "stamp": stamp}
+
+
+def read_manifest(archive_dir: Path) -> Dict[str, dict]:
+    """{파티션 이름: 목록 항목}. 형식이 맞지 않는 행은 무시 (해당 파티션은 다시 검사됨)"""
+    entries: Dict[str, dict] = {}
+    try:
+        lines = (archive_dir / MANIFEST_FILE).read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return entries
+    for line in lines:
+        parts = line.split("/")
+        if len(parts) != 6:
+            continue
+        try:
+            stamp = tuple(tuple(int(x) for x in p.split(":")) for p in parts[4:])
+            entries[parts[0]] = manifest_entry(int(parts[1]), int(parts[2]), parts[3], stamp)
+        except ValueError:
+            continue
+    return entries
+
+
+def write_manifest(archive_dir: Path, entries: Dict[str, dict]) -> None:
+    """목록을 원자적으로 다시 씀 (파티션 이름 오름차순)"""
+    lines = []
+    for month in sorted(entries):
+        e = entries[month]
+        stamp = "/".join(f"{size}:{mtime}" for size, mtime in e["stamp"])
+        lines.append(f"{month}/{e['movies']}/{e['bookings']}/{e['sha256']}/{stamp}")
+    tmp_path = archive_dir / (MANIFEST_FILE + ".tmp")
+    tmp_path.write_text("".join(line + "\n" for line in lines), encoding="utf-8", newline="\n")
+    os.replace(tmp_path, archive_dir / MANIFEST_FILE)
+
+
+# ---------------------------------------------------------------
+# 봉인 / 되돌리기
+# ---------------------------------------------------------------
+def seal_before(repo: CinemaRepository, date_str: str, archive_dir: Path) -> List[str]:
+    """
+    date_str이 속한 달보다 앞선 달에 상영하는 영화와 그 예매를 월별 파티션으로 옮김 (모두 지났으면 마지막 달은 남김).
+    이미 같은 달 파티션이 있으면 고유번호(영화)와 (학번, 고유번호, 좌석)(예매)으로 합침.
+    return: 봉인한 파티션 이름 (옮길 상영이 없으면 빈 리스트, 파일을 건드리지 않음)
+    """
+    cutoff = month_of(date_str) + "-01"
+    with repo.transaction():
+        past = repo.movies_before(cutoff)
+        if past and len(past) == len(repo.movies):
+            # 영화 데이터 파일에는 레코드가 하나 이상 있어야 하므로 상영이 모두 지났으면 마지막 달은 남김
+            last = month_of(past[-1]["date"])
+            past = [m for m in past if month_of(m["date"]) != last]
+        if not past:
+            return []
+        entries = read_manifest(archive_dir)
+        grouped: Dict[str, List[dict]] = {}
+        for movie in past:
+            grouped.setdefault(month_of(movie["date"]), []).append(movie)
+        for month, movies in grouped.items():
+            bookings = [b for m in movies for b in repo.bookings_for_movie(m["id"])]
+            if month in entries:
+                old_movies, old_bookings = read_partition(archive_dir, month)
+                by_id = {m["id"]: m for m in old_movies}
+                by_id.update((m["id"], m) for m in movies)
+                movies = list(by_id.values())
+                seen = {(b["sid"], b["movie_id"], b["seats"]) for b in bookings}
+                bookings = [b for b in old_bookings if (b["sid"], b["movie_id"], b["seats"]) not in seen] + bookings
+            movies = sorted(movies, key=lambda m: m["id"])
+            bookings = sorted(bookings, key=lambda b: b["movie_id"])
+            entries[month] = write_partition(archive_dir, month, movies, bookings, repo.halls)
+        write_manifest(archive_dir, entries)
+        repo.detach_movies([m["id"] for m in past])
+    return sorted(grouped)
+
+
+def restore(repo: CinemaRepository, month: str, archive_dir: Path) -> Tuple[int, int]:
+    """
+    파티션 하나를 데이터 파일로 되돌리고 파티션과 목록 항목을 지움.
+    return: (되돌린 영화 수, 예매 수). 파티션이 없으면 FileNotFoundError, 되돌릴 수 없으면 ValueError
+    """
+    with repo.transaction():
+        entries = read_manifest(archive_dir)
+        paths = partition_paths(archive_dir, month)
+        if month not in entries or not all(p.exists() for p in paths):
+            raise FileNotFoundError(f"보관 파티션이 없습니다: {month}")
+        movies, bookings = read_partition(archive_dir, month)
+        repo.attach_movies(movies, bookings)
+        for path in paths:
+            path.unlink()
+        del entries[month]
+        write_manifest(archive_dir, entries)
+    return len(movies), len(bookings)
+
+
+# ---------------------------------------------------------------
+# 지난 상영/예매 조회 (보관 파티션만 읽음)
+# ---------------------------------------------------------------
+def print_history(archive_dir: Path, halls: Dict[str, Hall], student_id: str | None = None,
+                  month: str | None = None) -> int:
+    """
+    보관된 상영(학번을 주면 그 학생의 예매)을 파티션 순서대로 출력. return: 출력한 항목 수
+    """
+    entries = read_manifest(archive_dir)
+    shown = 0
+    for name in sorted(entries):
+        if month is not None and name != month:
+            continue
+        movies, bookings = read_partition(archive_dir, name)
+        by_id = {m["id"]: m for m in movies}
+        if student_id is None:
+            booked: Dict[str, int] = {}
+            for b in bookings:
+                booked[b["movie_id"]] = booked.get(b["movie_id"], 0) | b["seats"]
+            print(f"[{name}] 상영 {len(movies)}개, 예매 {len(bookings)}건")
+            for m in movies:
+                hall = movie_hall(m, halls)
+                print(f"{m['date']} {m['time']} | {m['title']} | 예매 좌석 {booked.get(m['id'], 0).bit_count()}/"
+                      f"{hall.count - hall.blocked.bit_count()}")
+            shown += len(movies)
+            continue
+        mine = sorted((b for b in bookings if b["sid"] == student_id), key=lambda b: b["movie_id"])
+        if not mine:
+            continue
+        print(f"[{name}] {student_id} 님의 지난 예매 {len(mine)}건")
+        for b in mine:
+            m = by_id[b["movie_id"]]
+            seats = ", ".join(movie_hall(m, halls).mask_to_seats(b["seats"]))
+            print(f"{m['date']} {m['time']} | {m['title']} | 좌석: {seats}")
+        shown += len(mine)
+    return shown
+
+
+# ---------------------------------------------------------------
+# 명령행
+# ---------------------------------------------------------------
+def open_repository(data_dir: Path) -> CinemaRepository:
+    """데이터 디렉터리의 데이터 파일과 보관 파티션을 시작 시와 같은 규칙으로 검사(위배 시 같은 오류 출력 후 종료)한 저장소"""
+    from cinema import BOOKING_FILE, JOURNAL_FILE, MOVIE_FILE, STUDENT_FILE, run_startup_checks, verify_archive
+    import binstore
+    from locking import FileLock, LOCK_FILE
+
+    binary = (data_dir / binstore.MOVIE_BIN_FILE).exists()
+    movie_path = data_dir / (binstore.MOVIE_BIN_FILE if binary else MOVIE_FILE)
+    booking_path = data_dir / (binstore.BOOKING_BIN_FILE if binary else BOOKING_FILE)
+    student_path = data_dir / STUDENT_FILE
+    for path in (movie_path, student_path, booking_path):
+        if not path.exists():
+            raise FileNotFoundError(f"데이터 파일이 없습니다: {path}")
+
+    lock = FileLock(data_dir / LOCK_FILE)
+    repo = CinemaRepository(movie_path, student_path, booking_path, data_dir / JOURNAL_FILE, lock)
+    with lock:
+        repo.adopt(*run_startup_checks(movie_path, student_path, booking_path, data_dir / JOURNAL_FILE))
+        verify_archive(data_dir / ARCHIVE_DIR, repo.students, repo.halls)
+    return repo
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="archive.py", description="KUCinema 지난 상영 보관 파티션 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+    seal = sub.add_parser("seal", help="날짜가 속한 달보다 앞선 달의 상영을 보관 파티션으로 옮김")
+    seal.add_argument("date", help="기준 날짜 YYYY-MM-DD")
+    back = sub.add_parser("restore", help="보관 파티션 하나를 데이터 파일로 되돌림")
+    back.add_argument("month", help="파티션 이름 YYYY-MM")
+    history = sub.add_parser("history", help="보관된 상영(또는 학생의 지난 예매) 조회")
+    history.add_argument("--student", metavar="학번")
+    history.add_argument("--month", metavar="YYYY-MM")
+    for p in (seal, back, history):
+        p.add_argument("data_dir", nargs="?", type=Path, default=Path.cwd(), help="데이터 디렉터리 (기본: 현재 경로)")
+    args = parser.parse_args(argv)
+    from cinema import DATABASE_FILE, is_valid_date_string
+
+    if (args.data_dir / DATABASE_FILE).exists():
+        print(f"!!! 오류: SQLite 저장소({DATABASE_FILE})는 보관을 지원하지 않습니다.")
+        return 1
+    if args.command == "seal" and not is_valid_date_string(args.date):
+        print(f"!!! 오류: 올바른 날짜가 아닙니다: {args.date}")
+        return 1
+    archive_dir = args.data_dir / ARCHIVE_DIR
+    try:
+        repo = open_repository(args.data_dir)
+        if args.command == "seal":
+            months = seal_before(repo, args.date, archive_dir)
+            print(f"보관한 달: {', '.join(months)}" if months else "보관할 지난 상영이 없습니다.")
+        elif args.command == "restore":
+            movies, bookings = restore(repo, args.month, archive_dir)
+            print(f"{args.month}의 영화 레코드 {movies}개, 예매 레코드 {bookings}개를 되돌렸습니다.")
+        elif print_history(archive_dir, repo.halls, args.student, args.month) == 0:
+            print("보관된 내역이 없습니다.")
+    except (OSError, ValueError) as e:
+        print(f"!!! 오류: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
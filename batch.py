@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 일괄 처리 모드 — batch.py  (python KUCinema.py --batch FILE)
+
+프롬프트 대신 명령 파일(FILE이 '-'이면 표준 입력)을 한 줄에 하나씩 실행합니다.
+  date YYYY-MM-DD          : 내부 현재 날짜 설정 (6.1과 같은 검증) — book/cancel보다 먼저 필요
+  login <학번> <비밀번호>   : 기존 회원은 비밀번호 확인, 신규 회원은 가입 (6.2)
+  book <학번> <영화고유번호> <좌석,좌석,...>
+                           : 예매 (6.4) — 로그인한 학번만, 현재 날짜 다음 날 이후 상영만,
+                             한 번에 1~4석, 한 상영당 보유 좌석 최대 MAX_SEATS_PER_SHOWING석, 빈 좌석만 (좌석 이름은 상영의 상영관 배치, 막힌 좌석 불가)
+  cancel <학번> <영화고유번호>
+                           : 해당 상영의 학생 예매를 모두 취소 (6.6) — 현재 날짜 이후 상영만
+빈 행과 '#'으로 시작하는 행은 건너뜁니다.
+
+규칙에 맞지 않는 명령은 행 번호와 이유를 출력하고 건너뛰며, 나머지 명령은 계속 실행합니다.
+명령마다 변경분 검사를 하지 않고, 모든 명령을 적용한 뒤 데이터 파일 전체를 한 번 검사합니다.
+마지막에 처리량(명령/초)과 명령 종류별 지연 시간을 출력합니다.
+종료 코드: 모든 명령 성공 0, 실패한 명령이 있으면 1 (무결성 위배 시에는 보고를 출력한 뒤 검사 함수의 종료 코드 1로 종료)
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from contextlib import nullcontext
+from typing import Dict, List
+
+import core
+from cinema import RE_DATE, RE_STUDENT_ID, RE_PASSWORD, info, error, is_valid_date_string, run_full_check
+from repository import CinemaRepository, SeatConflictError, QuotaExceededError, MAX_SEATS_PER_SHOWING
+
+
+class BatchCommandError(Exception):
+    """명령이 문법/업무 규칙에 맞지 않아 적용되지 않음 (메시지 = 이유)"""
+
+
+class BatchSession:
+    """일괄 처리 한 번의 상태 — 현재 날짜와 로그인한 학번들"""
+
+    def __init__(self, repo: CinemaRepository) -> None:
+        self.repo = repo
+        self.current_date: str | None = None
+        self.logged_in: set[str] = set()
+
+    # -----------------------------------------------------------
+    # 공통 검사
+    # -----------------------------------------------------------
+    def _require_date(self) -> str:
+        if self.current_date is None:
+            raise BatchCommandError("현재 날짜가 설정되지 않았습니다. date 명령을 먼저 실행하세요.")
+        return self.current_date
+
+    def _require_login(self, sid: str) -> None:
+        if not RE_STUDENT_ID.fullmatch(sid):
+            raise BatchCommandError("학번의 형식이 올바르지 않습니다.")
+        if sid not in self.logged_in:
+            raise BatchCommandError(f"{sid} 님은 로그인되어 있지 않습니다.")
+
+    def _require_future_movie(self, movie_id: str) -> dict:
+        current = self._require_date()
+        movie = self.repo.get_movie(movie_id)
+        if movie is None:
+            raise BatchCommandError("존재하지 않는 영화 고유번호입니다.")
+        if not movie["date"] > current:
+            raise BatchCommandError("예매/취소할 수 없는 날짜의 상영입니다.")
+        return movie
+
+    # -----------------------------------------------------------
+    # 명령
+    # -----------------------------------------------------------
+    def cmd_date(self, args: List[str]) -> None:
+        if len(args) != 1:
+            raise BatchCommandError("사용법: date YYYY-MM-DD")
+        if not RE_DATE.fullmatch(args[0]):
+            raise BatchCommandError("날짜 형식이 맞지 않습니다.")
+        if not is_valid_date_string(args[0]):
+            raise BatchCommandError("존재하지 않는 날짜입니다.")
+        self.current_date = args[0]
+        core.CURRENT_DATE_STR = args[0]
+
+    def cmd_login(self, args: List[str]) -> None:
+        if len(args) != 2:
+            raise BatchCommandError("사용법: login <학번> <비밀번호>")
+        sid, pw = args
+        if not RE_STUDENT_ID.fullmatch(sid):
+            raise BatchCommandError("학번의 형식이 올바르지 않습니다.")
+        if not RE_PASSWORD.fullmatch(pw):
+            raise BatchCommandError("비밀번호의 형식이 올바르지 않습니다.")
+        expected = self.repo.students.get(sid)
+        if expected is None:
+            if not self.repo.add_student(sid, pw):
+                raise BatchCommandError("이미 가입된 학번입니다.")
+        elif pw != expected:
+            raise BatchCommandError("비밀번호가 올바르지 않습니다.")
+        self.logged_in.add(sid)
+
+    def cmd_book(self, args: List[str]) -> None:
+        if len(args) != 3:
+            raise BatchCommandError("사용법: book <학번> <영화고유번호> <좌석,좌석,...>")
+        sid, movie_id, seat_arg = args
+        self._require_login(sid)
+        self._require_future_movie(movie_id)
+        hall = self.repo.hall_of(movie_id)
+
+        names = seat_arg.split(",")
+        for name in names:
+            if name not in hall.index:
+                raise BatchCommandError(f"올바르지 않은 좌석 번호입니다: {name}")
+            if hall.blocked & hall.seat_bit(name):
+                raise BatchCommandError(f"예매할 수 없는 좌석입니다: {name}")
+        if len(set(names)) != len(names):
+            raise BatchCommandError("같은 좌석이 중복 선택되었습니다.")
+        if not 1 <= len(names) <= 4:
+            raise BatchCommandError("인원 수는 1~4명이어야 합니다.")
+
+        try:
+            self.repo.add_booking(sid, movie_id, hall.seats_to_mask(names))
+        except SeatConflictError:
+            raise BatchCommandError("이미 예매된 좌석이 포함되어 있습니다.")
+        except QuotaExceededError as e:
+            raise BatchCommandError(
+                f"한 상영당 최대 {MAX_SEATS_PER_SHOWING}석까지 예매할 수 있습니다 (추가 가능 {e.remaining}석).")
+
+    def cmd_cancel(self, args: List[str]) -> None:
+        if len(args) != 2:
+            raise BatchCommandError("사용법: cancel <학번> <영화고유번호>")
+        sid, movie_id = args
+        self._require_login(sid)
+        self._require_future_movie(movie_id)
+
+        targets = [b for b in self.repo.bookings_of(sid) if b["movie_id"] == movie_id]
+        if not targets:
+            raise BatchCommandError("취소할 예매 내역이 없습니다.")
+        for b in targets:
+            self.repo.cancel_booking(sid, movie_id, b["seats"])
+
+    COMMANDS = {"date": cmd_date, "login": cmd_login, "book": cmd_book, "cancel": cmd_cancel}
+
+    def execute(self, line: str) -> str:
+        """명령 한 줄 실행. 명령 이름을 반환하며, 적용하지 못하면 BatchCommandError"""
+        name, *args = line.split()
+        handler = self.COMMANDS.get(name)
+        if handler is None:
+            raise BatchCommandError(f"알 수 없는 명령입니다: {name}")
+        handler(self, args)
+        return name
+
+
+# ---------------------------------------------------------------
+# 실행 및 보고
+# ---------------------------------------------------------------
+def _print_report(latencies: Dict[str, List[float]], ok: int, failed: int, elapsed: float) -> None:
+    total = ok + failed
+    rate = total / elapsed if elapsed > 0 else 0.0
+    info(f"일괄 처리 결과: 명령 {total}개 (성공 {ok}, 실패 {failed}), {elapsed:.3f}초, {rate:.1f} 명령/초")
+    # 한글 머리글은 화면에서 두 칸을 차지하므로 그만큼 폭을 줄여 숫자 열과 맞춤
+    info(f"{'명령':<8}| {'개수':>5} | {'평균(ms)':>7} | {'중앙(ms)':>7} | {'p95(ms)':>9} | {'최대(ms)':>7}")
+    for name, samples in latencies.items():
+        ms = sorted(s * 1000 for s in samples)
+        p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+        info(f"{name:<10}| {len(ms):>7} | {statistics.fmean(ms):>9.3f} | {statistics.median(ms):>9.3f} | "
+             f"{p95:>9.3f} | {ms[-1]:>9.3f}")
+
+
+def run_batch(path: str, repo: CinemaRepository) -> int:
+    """
+    명령 파일을 실행하고 전체 검사 후 결과를 출력. 종료 코드를 반환.
+    무결성 위배면 보고를 출력한 뒤 검사 함수의 SystemExit을 그대로 다시 발생 (종료 전 정리를 하지 않도록)
+    """
+    try:
+        stream = nullcontext(sys.stdin) if path == "-" else open(path, encoding="utf-8")
+    except OSError as e:
+        error(f"명령 파일을 열 수 없습니다: {path} ({e})")
+        return 1
+
+    session = BatchSession(repo)
+    latencies: Dict[str, List[float]] = {}
+    ok = failed = 0
+    started = time.perf_counter()
+    # 일괄 처리 동안 잠금을 잡고 있어 명령마다 다른 키오스크의 변경을 확인하지 않음
+    with stream as lines, repo.transaction():
+        for lineno, raw in enumerate(lines, start=1):
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            t0 = time.perf_counter()
+            try:
+                name = session.execute(line)
+            except BatchCommandError as e:
+                error(f"{lineno}행 '{line}' — {e}")
+                failed += 1
+                continue
+            latencies.setdefault(name, []).append(time.perf_counter() - t0)
+            ok += 1
+
+    # 모든 명령을 적용하고 트랜잭션을 닫은 뒤 한 번만 전체 무결성 검사 (검사는 스스로 잠금을 잡음)
+    violation = None
+    try:
+        run_full_check(repo)
+    except SystemExit as e:
+        violation = e
+    elapsed = time.perf_counter() - started
+
+    _print_report(latencies, ok, failed, elapsed)
+    if violation is not None:
+        raise violation
+    return 0 if failed == 0 else 1
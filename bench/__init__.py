@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 성능/부하 측정 도구 모음 — bench 패키지
+
+프로젝트 폴더에서 python -m bench.<모듈> 형태로 실행합니다.
+  • contention     : 여러 프로세스가 한 상영을 동시에 예매해도 좌석이 중복 판매되지 않는지 확인
+  • cancel_listing : 상영표 크기에 따른 예매 취소 목록 생성 시간 (해시 조인 vs 예전 중첩 검색)
+  • generate       : 무결성 검사를 통과하는 합성 데이터 파일 생성 (크기 지정)
+  • harness        : 시작 검사/목록/예매/내역/취소 시간을 터미널 없이 측정해 JSON으로 출력
+  • importtime     : 시작 시 모듈 가져오기 시간이 예산 안인지, 메뉴/모드 모듈을 필요할 때만 가져오는지 확인
+  • startup_cases  : 손으로 만든 데이터 폴더로 시작 검사가 기대한 대로 거절/통과하는지 확인 (회귀 사례)
+  • server_load    : 서버 모드(--serve)에 여러 클라이언트가 동시에 접속해 예매/조회할 때의 요청 지연 시간과 처리량
+"""
+
+import sys
+from pathlib import Path
+
+# python -m bench.xxx 로 실행할 때 프로젝트 최상위 모듈(repository, seatmask 등)을 찾을 수 있도록 함
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+예매 취소 목록 생성 시간 측정 — python -m bench.cancel_listing [--sizes 1000,10000,100000]
+
+상영표 크기(영화 레코드 수)를 늘려 가며, 예매 9건을 가진 학생의 취소 목록 첫 페이지를 만드는 시간을 잽니다.
+취소 선택(menu3.select_cancelation)과 같은 경로 — 학생별 영화 고유번호순 색인을 이분 탐색해 개수를 세고
+(count_upcoming_bookings) 페이지 위치부터 필요한 만큼만 조인(upcoming_bookings) — 이므로
+상영표가 커져도 시간이 거의 일정해야 합니다.
+비교용으로 예전 방식(예매마다 상영표 전체 행에서 부분 문자열 검색)의 시간도 함께 출력합니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import core
+from paging import PAGE_SIZE
+from repository import CinemaRepository, format_movie_line
+import menu3
+
+STUDENT_ID = "00"
+SLOTS = ["10:00-12:00", "13:00-15:00", "16:00-18:00", "19:00-21:00"]
+
+
+def synthetic_repo(n_movies: int, n_bookings: int = 9) -> CinemaRepository:
+    """파일 없이 메모리에만 상영 n_movies개와 학생 한 명의 예매 n_bookings개를 가진 저장소 구성"""
+    repo = CinemaRepository(Path("movie-schedule.txt"), Path("student-info.txt"),
+                            Path("booking-info.txt"), Path("seat-journal.txt"))
+    movies = {}
+    day = date(2000, 1, 1)
+    i = 0
+    while i < n_movies:
+        for slot in SLOTS:
+            if i >= n_movies:
+                break
+            mid = f"{day:%Y%m%d}{slot[0:2]}{slot[3:5]}"
+            movies[mid] = {"id": mid, "title": f"영화{i}", "date": f"{day:%Y-%m-%d}", "time": slot, "seats": 0}
+            i += 1
+        day += timedelta(days=1)
+
+    # 학생의 예매는 상영표의 뒤쪽(미래)에 고르게 배치
+    ids = list(movies)
+    bookings = []
+    step = max(1, len(ids) // (2 * n_bookings)) if n_bookings else 1
+    for k in range(n_bookings):
+        mid = ids[-1 - k * step]
+        booking = {"sid": STUDENT_ID, "movie_id": mid, "seats": 1 << k}
+        movies[mid]["seats"] |= booking["seats"]
+        bookings.append(booking)
+    repo._set_state(movies, {STUDENT_ID: "0000"}, bookings)
+    return repo
+
+
+def cancel_listing_page(student_id: str) -> list[dict]:
+    """select_cancelation이 첫 페이지를 보일 때 하는 조회 (취소 가능 예매 수 + 첫 페이지 항목)"""
+    today = core.CURRENT_DATE_STR
+    if core.REPO.count_upcoming_bookings(student_id, today) == 0:
+        return []
+    return [menu3.cancelable_entry(record, movie)
+            for record, movie in core.REPO.upcoming_bookings(student_id, today, PAGE_SIZE)]
+
+
+def legacy_listing(student_id: str, booking_lines: list[str], movie_lines: list[str]) -> list[dict]:
+    """예전 select_cancelation의 중첩 부분 문자열 검색 (예매 수 × 상영표 행 수)"""
+    found = []
+    for line in booking_lines:
+        sid, movie_id, vec = line.split("/", 2)
+        if sid != student_id or movie_id[0:4] + "-" + movie_id[4:6] + "-" + movie_id[6:8] <= core.CURRENT_DATE_STR:
+            continue
+        for mline in movie_lines:
+            if movie_id in mline:
+                found.append({"movie_id": movie_id, "line": mline})
+                break
+    return found
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="예매 취소 목록 생성 시간 측정")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="상영표 크기 목록 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    core.CURRENT_DATE_STR = "2000-01-01"
+    print(f"{'상영 수':>10} | {'색인 조회(ms)':>14} | {'예전 방식(ms)':>14}")
+    for n in (int(x) for x in args.sizes.split(",")):
+        repo = synthetic_repo(n)
+        core.REPO = repo
+        movie_lines = [format_movie_line(m) for m in repo.movies.values()]
+        booking_lines = [f"{b['sid']}/{b['movie_id']}/[]" for b in repo.bookings]
+
+        new = _best_of(lambda: cancel_listing_page(STUDENT_ID), args.repeat)
+        old = _best_of(lambda: legacy_listing(STUDENT_ID, booking_lines, movie_lines), max(1, args.repeat // 10))
+        print(f"{n:>10} | {new * 1000:>14.3f} | {old * 1000:>14.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
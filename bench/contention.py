@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+다중 프로세스 예매 경합 검사 — python -m bench.contention [--workers N] [--attempts N]
+
+임시 데이터 디렉터리에 상영 하나를 만들고, 여러 프로세스가 동시에 출발해 각자 CinemaRepository로
+무작위 좌석 1~4개 예매와 자신의 예매 취소를 반복합니다. 종료 후 파일을 다시 읽어
+  • 서로 다른 예매 레코드가 같은 좌석을 갖지 않는지
+  • 예매 레코드 좌석 합이 영화 좌석 유무 벡터와 같은지
+  • (성공한 예매 좌석 수 - 성공한 취소 좌석 수)가 파일의 예매 레코드 좌석 수와 같은지
+    (압축이 같은 학생의 같은 상영 예매를 합치므로 레코드 수가 아닌 좌석 수로 비교)
+를 확인하고, 위배가 있으면 종료 코드 1로 끝납니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from repository import CinemaRepository, SeatConflictError, QuotaExceededError
+from seatmask import SEAT_COUNT, format_mask
+
+MOVIE_ID = "202512221430"
+STUDENTS = [f"{i:02d}" for i in range(100)]
+
+
+def _paths(data_dir: Path):
+    return (
+        data_dir / "movie-schedule.txt",
+        data_dir / "student-info.txt",
+        data_dir / "booking-info.txt",
+        data_dir / "seat-journal.txt",
+    )
+
+
+def prepare(data_dir: Path) -> None:
+    movie_path, student_path, booking_path, _ = _paths(data_dir)
+    movie_path.write_text(f"{MOVIE_ID}/경합테스트/2025-12-22/14:30-16:30/{format_mask(0)}", encoding="utf-8")
+    student_path.write_text("\n".join(f"{sid}/0000" for sid in STUDENTS), encoding="utf-8")
+    booking_path.write_text("", encoding="utf-8")
+
+
+def _free_indexes(repo: CinemaRepository) -> list[int]:
+    seats = repo.get_movie(MOVIE_ID)["seats"]
+    return [i for i in range(SEAT_COUNT) if not seats >> i & 1]
+
+
+def worker(data_dir: str, seed: int, attempts: int, barrier) -> tuple[int, int, int, int]:
+    """예매/취소를 attempts번 시도하고 (예매 성공 수, 충돌 거절 수, 취소 성공 수, 남은 예매 좌석 수)를 반환"""
+    rng = random.Random(seed)
+    repo = CinemaRepository.load(*_paths(Path(data_dir)))
+    mine: list[dict] = []
+    booked = conflicts = canceled = held = 0
+    barrier.wait()
+    for _ in range(attempts):
+        # 세션이 좌석표를 본 시점의 상태(낡을 수 있음)에서 빈 좌석을 고름
+        free = _free_indexes(repo)
+        if mine and (not free or rng.random() < 0.3):
+            b = mine.pop(rng.randrange(len(mine)))
+            if repo.cancel_booking(b["sid"], MOVIE_ID, b["seats"]) is not None:
+                canceled += 1
+                held -= b["seats"].bit_count()
+            continue
+        if not free:
+            repo.refresh()
+            continue
+        mask = 0
+        for i in rng.sample(free, min(len(free), rng.randint(1, 4))):
+            mask |= 1 << i
+        try:
+            mine.append(repo.add_booking(rng.choice(STUDENTS), MOVIE_ID, mask))
+            booked += 1
+            held += mask.bit_count()
+        except SeatConflictError:
+            conflicts += 1
+        except QuotaExceededError:
+            pass  # 학생별 한 상영 최대 좌석 수 초과 — 경합과 무관
+    return booked, conflicts, canceled, held
+
+
+def verify(data_dir: Path, expected_seats: int) -> list[str]:
+    repo = CinemaRepository.load(*_paths(data_dir))
+    repo.checkpoint()
+    repo.reload()
+    problems = []
+    union = 0
+    for b in repo.bookings:
+        if union & b["seats"]:
+            problems.append(f"중복 판매된 좌석: {format_mask(union & b['seats'])}")
+        union |= b["seats"]
+    if union != repo.get_movie(MOVIE_ID)["seats"]:
+        problems.append("예매 레코드 좌석 합과 영화 좌석 유무 벡터가 다릅니다.")
+    if union.bit_count() != expected_seats:
+        problems.append(f"남아 있어야 할 예매 좌석 {expected_seats}개, 파일의 예매 레코드 좌석 {union.bit_count()}개")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="다중 프로세스 예매 경합 검사")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--attempts", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    failed = False
+    manager = multiprocessing.Manager()
+    for rnd in range(args.rounds):
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            prepare(data_dir)
+            barrier = manager.Barrier(args.workers)
+            with ProcessPoolExecutor(max_workers=args.workers) as pool:
+                results = list(pool.map(worker, [tmp] * args.workers,
+                                        [rnd * 1000 + w for w in range(args.workers)],
+                                        [args.attempts] * args.workers,
+                                        [barrier] * args.workers))
+            booked = sum(r[0] for r in results)
+            conflicts = sum(r[1] for r in results)
+            canceled = sum(r[2] for r in results)
+            problems = verify(data_dir, sum(r[3] for r in results))
+            status = "OK" if not problems else "실패"
+            print(f"[{rnd + 1}/{args.rounds}] 예매 {booked}건, 취소 {canceled}건, 충돌 거절 {conflicts}건 — {status}")
+            for p in problems:
+                print(f"  - {p}")
+            failed = failed or bool(problems)
+    manager.shutdown()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+합성 데이터 생성기 — python -m bench.generate DIR [--movies N] [--students N] [--bookings N]
+
+시작 시 무결성 검사를 통과하는 세 데이터 파일을 원하는 크기로 DIR에 만듭니다.
+  • movie-schedule.txt : 고유번호 오름차순, 하루 상영 최대 9개(10개 이상 금지 규칙), 고유번호 = 날짜+시작 시각
+  • student-info.txt   : 학번 00~99 중 앞에서부터 N명 (학번이 2자리이므로 최대 100명)
+  • booking-info.txt   : 1~4석 예매, 예매끼리 좌석이 겹치지 않고 영화별 예매 좌석 합 = 좌석 유무 벡터,
+                         한 학생이 한 상영에서 보유한 좌석은 최대 MAX_SEATS_PER_SHOWING석
+같은 --seed면 같은 파일이 만들어지므로 커밋 간 비교에 쓸 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+from repository import MAX_SEATS_PER_SHOWING
+from seatmask import SEAT_COUNT, FULL_MASK, format_mask
+
+SLOTS = [f"{h:02d}:00-{h + 1:02d}:50" for h in range(6, 24, 2)]   # 하루 9회 상영
+TITLES = ["겨울왕국", "스파이더맨", "인사이드아웃", "쥬라기월드", "슈퍼마리오", "라푼젤", "어벤져스",
+          "토이스토리", "코코", "해리포터", "닥터스트레인지", "아이언맨", "슈렉", "Inception", "Up"]
+
+
+def generate(data_dir: Path, n_movies: int, n_students: int, n_bookings: int,
+             start: date = date(2030, 1, 1), seed: int = 0) -> dict:
+    """
+    DIR에 세 데이터 파일을 씀.
+    return: 생성 정보 {"movies", "students", "bookings", "first_date", "last_date"}
+    """
+    if not 0 < n_students <= 100:
+        raise ValueError("학생 수는 1~100명이어야 합니다 (학번 2자리).")
+    rng = random.Random(seed)
+
+    movies = []   # [고유번호, 제목, 날짜, 시간]
+    day = start
+    while len(movies) < n_movies:
+        for slot in SLOTS:
+            if len(movies) >= n_movies:
+                break
+            movies.append((f"{day:%Y%m%d}{slot[0:2]}{slot[3:5]}", rng.choice(TITLES), f"{day:%Y-%m-%d}", slot))
+        day += timedelta(days=1)
+
+    students = [f"{i:02d}" for i in range(n_students)]
+    taken = [0] * len(movies)           # 영화별 예매된 좌석 마스크
+    held: dict[tuple[int, int], int] = {}   # (학생 번호, 영화 번호) → 보유 좌석 수
+    open_movies = list(range(len(movies)))  # 아직 예매할 수 있는 영화
+    bookings = []
+
+    while len(bookings) < n_bookings:
+        if not open_movies:
+            raise ValueError(f"예매 {n_bookings}건을 배치할 좌석이 부족합니다 (배치 {len(bookings)}건).")
+        k = rng.randrange(len(open_movies))
+        mi = open_movies[k]
+        free = [i for i in range(SEAT_COUNT) if not taken[mi] >> i & 1]
+
+        # 이 상영에 좌석을 더 가질 수 있는 학생 선택 (몇 번 무작위로 시도 후 전체 탐색)
+        si = None
+        for _ in range(8):
+            cand = rng.randrange(n_students)
+            if held.get((cand, mi), 0) < MAX_SEATS_PER_SHOWING:
+                si = cand
+                break
+        if si is None:
+            spare = [s for s in range(n_students) if held.get((s, mi), 0) < MAX_SEATS_PER_SHOWING]
+            si = rng.choice(spare) if spare else None
+        if si is None or not free:
+            open_movies[k] = open_movies[-1]
+            open_movies.pop()
+            continue
+
+        count = min(rng.randint(1, 4), len(free), MAX_SEATS_PER_SHOWING - held.get((si, mi), 0))
+        mask = 0
+        for i in rng.sample(free, count):
+            mask |= 1 << i
+        taken[mi] |= mask
+        held[(si, mi)] = held.get((si, mi), 0) + count
+        bookings.append(f"{students[si]}/{movies[mi][0]}/{format_mask(mask)}")
+        if taken[mi] == FULL_MASK:
+            open_movies[k] = open_movies[-1]
+            open_movies.pop()
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / "movie-schedule.txt").write_text(
+        "\n".join(f"{mid}/{title}/{d}/{t}/{format_mask(taken[i])}" for i, (mid, title, d, t) in enumerate(movies)),
+        encoding="utf-8", newline="\n")
+    (data_dir / "student-info.txt").write_text(
+        "\n".join(f"{sid}/{rng.randrange(10000):04d}" for sid in students), encoding="utf-8", newline="\n")
+    (data_dir / "booking-info.txt").write_text("\n".join(bookings), encoding="utf-8", newline="\n")
+    for stale in ("seat-journal.txt", ".kucinema.cache"):
+        (data_dir / stale).unlink(missing_ok=True)
+
+    return {
+        "movies": len(movies),
+        "students": n_students,
+        "bookings": len(bookings),
+        "first_date": movies[0][2] if movies else None,
+        "last_date": movies[-1][2] if movies else None,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="KUCinema 합성 데이터 생성")
+    parser.add_argument("dir", type=Path, help="데이터 파일을 만들 디렉터리")
+    parser.add_argument("--movies", type=int, default=20000)
+    parser.add_argument("--students", type=int, default=100)
+    parser.add_argument("--bookings", type=int, default=100000)
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2030, 1, 1), help="첫 상영 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        info = generate(args.dir, args.movies, args.students, args.bookings, args.start, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"영화 {info['movies']}개 ({info['first_date']} ~ {info['last_date']}), "
+          f"학생 {info['students']}명, 예매 {info['bookings']}건 → {args.dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 성능 측정 하니스 — python -m bench.harness [--movies N] [--bookings N] [--out result.json]
+
+bench.generate로 임시 디렉터리에 합성 데이터를 만든 뒤, 터미널 없이(input을 스크립트로 대체,
+출력은 버림) 아래 동작의 시간을 같은 프로세스 안에서 잽니다.
+  • startup_cold / startup_warm : cinema.main()이 날짜 프롬프트에 닿기까지 (검증 상태 캐시 없음/있음)
+  • select_date / select_movie  : 예매 가능한 날짜 목록, 한 날짜의 상영 목록 (첫 번째 항목 선택)
+  • finalize_booking            : 예매 확정 (저장소 반영 + 파일 기록 + 변경분 검사)
+  • menu2                       : 예매 내역 조회
+  • confirm_cancelation         : 예매 취소 확정 ('Y' 후 다시 나온 취소 목록에서 '0')
+--binary를 주면 합성 데이터를 이진 형식(binstore.py)으로, --sqlite를 주면 SQLite 저장소(sqlstore.py)로 바꾼 뒤 같은 항목을 잽니다.
+결과는 JSON(밀리초 단위 최소/중앙/평균/p95/최대와 실행 환경 정보)으로 출력하므로 커밋 간 비교에 씁니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import binstore
+import sqlstore
+from bench.generate import generate
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class EndOfScript(Exception):
+    """스크립트로 준비한 입력이 바닥남 — 측정 대상이 입력을 더 기다리는 지점"""
+
+
+@contextlib.contextmanager
+def scripted(*answers: str):
+    """input()을 주어진 답으로 차례로 대체하고 출력은 버림"""
+    queue = list(answers)
+
+    def fake_input(prompt: str = "") -> str:
+        if not queue:
+            raise EndOfScript(prompt)
+        return queue.pop(0)
+
+    real_input = builtins.input
+    builtins.input = fake_input
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = real_input
+
+
+def summarize(samples: list[float]) -> dict:
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "n": len(ms),
+        "min_ms": round(ms[0], 4),
+        "median_ms": round(statistics.median(ms), 4),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 4),
+        "max_ms": round(ms[-1], 4),
+    }
+
+
+def timed(fn, *answers: str) -> float:
+    with scripted(*answers):
+        t0 = time.perf_counter()
+        try:
+            fn()
+        except EndOfScript:
+            pass
+        return time.perf_counter() - t0
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(args) -> dict:
+    import cinema
+    import core
+    import menu1
+    import menu2
+    import menu3
+    import seatmask
+
+    results: dict[str, dict] = {}
+    main_argv = ["--jobs", str(args.jobs)]
+    cache = Path(cinema.CACHE_FILE)
+
+    # 1) 시작 — 날짜 프롬프트에서 입력이 바닥나 멈춤
+    cold = []
+    for _ in range(args.repeat):
+        cache.unlink(missing_ok=True)
+        cold.append(timed(lambda: cinema.main(main_argv)))
+    results["startup_cold"] = summarize(cold)
+    results["startup_warm"] = summarize([timed(lambda: cinema.main(main_argv)) for _ in range(args.repeat)])
+
+    repo = core.REPO
+    movies = list(repo.iter_movies())
+    core.CURRENT_DATE_STR = movies[len(movies) // 2]["date"]   # 상영표의 절반은 지난 상영
+    student = "00"
+    core.LOGGED_IN_SID = student
+
+    # 2) 목록
+    results["select_date"] = summarize([timed(menu1.select_date, "1") for _ in range(args.repeat)])
+    first_date = repo.upcoming_dates(core.CURRENT_DATE_STR, 1)[0]
+    results["select_movie"] = summarize([timed(lambda: menu1.select_movie(first_date), "1")
+                                         for _ in range(args.repeat)])
+
+    # 3) 예매 확정 — 미래 상영마다 빈 좌석 하나, 학생의 보유 한도 안에서
+    booked = []
+    samples = []
+    for movie in repo.iter_movies_from(core.CURRENT_DATE_STR, inclusive=False):
+        if len(booked) >= args.ops:
+            break
+        free = seatmask.mask_to_seats(~movie["seats"] & seatmask.FULL_MASK)
+        if not free or repo.remaining_quota(student, movie["id"]) == 0:
+            continue
+        samples.append(timed(lambda: menu1.finalize_booking(dict(movie), free[:1], student)))
+        booked.append(movie["id"])
+    results["finalize_booking"] = summarize(samples)
+
+    # 4) 예매 내역 조회
+    results["menu2"] = summarize([timed(menu2.menu2) for _ in range(args.repeat)])
+
+    # 5) 예매 취소 확정 — 위에서 예매한 것을 하나씩 취소
+    samples = []
+    today = core.CURRENT_DATE_STR
+    for movie_id in booked:
+        # 취소 목록과 같은 경로(select_cancelation의 페이지 조회)로 대상 항목을 만듦
+        upcoming = repo.upcoming_bookings(student, today, repo.count_upcoming_bookings(student, today))
+        target = next(menu3.cancelable_entry(b, m) for b, m in upcoming if b["movie_id"] == movie_id)
+        samples.append(timed(lambda: menu3.confirm_cancelation(target), "Y", "0"))
+    results["confirm_cancelation"] = summarize(samples)
+
+    cinema.shutdown()
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="KUCinema 성능 측정 (JSON 출력)")
+    parser.add_argument("--movies", type=int, default=20000)
+    parser.add_argument("--students", type=int, default=100)
+    parser.add_argument("--bookings", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="시작/목록/조회 측정 반복 횟수")
+    parser.add_argument("--ops", type=int, default=50, help="예매/취소 측정 횟수")
+    parser.add_argument("--jobs", type=int, default=1, help="KUCinema.py --jobs 값")
+    parser.add_argument("--binary", action="store_true", help="이진 데이터 형식(.bin)으로 변환해 측정")
+    parser.add_argument("--sqlite", action="store_true", help="SQLite 저장소(kucinema.db)로 가져와 측정")
+    parser.add_argument("--out", type=Path, help="결과 JSON 파일 (생략 시 표준 출력)")
+    args = parser.parse_args(argv)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        data = generate(Path(tmp), args.movies, args.students, args.bookings, seed=args.seed)
+        if args.binary:
+            binstore.convert(Path(tmp), "binary")
+        if args.sqlite:
+            sqlstore.import_files(Path(tmp))
+        os.chdir(tmp)   # KUCinema의 홈 경로 = 현재 디렉터리
+        try:
+            results = run_benchmarks(args)
+        finally:
+            os.chdir(cwd)
+
+    report = {
+        "meta": {
+            "revision": _git_revision(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "data": data,
+            "seed": args.seed,
+            "jobs": args.jobs,
+            "format": "sqlite" if args.sqlite else "binary" if args.binary else "text",
+        },
+        "results": results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+시작 시 모듈 가져오기 시간 예산 확인 — python -m bench.importtime [--budget-ms N] [--repeat K]
+
+`python -X importtime -c "import KUCinema"`를 --repeat번 실행해 KUCinema(실행 스크립트)가 가져오는
+모듈 전체의 누적 시간 중 가장 짧은 값을 예산과 비교하고, 아래를 확인합니다. 하나라도 어기면 종료 코드 1.
+  • 예산      : 누적 시간 ≤ --budget-ms
+  • 지연 모듈 : 시작 경로에서 메뉴/일괄 처리/서버/SQLite 모듈, 병렬 검사 프로세스 풀, cProfile 등을 가져오지 않음
+  • 실제 세션 : 합성 데이터로 날짜 → 로그인 → 메뉴 2/3/4 → 종료까지 실행했을 때 프로그램 본체(cinema)는 한 번만
+                가져오고 KUCinema를 모듈로 다시 가져오지 않으며, 메뉴 모듈은 고른 것만 가져옴
+바이트코드 캐시는 임시 디렉터리(PYTHONPYCACHEPREFIX)에 만들고 한 번 데운 뒤 측정하므로,
+컴파일 시간은 포함되지 않고 프로젝트 폴더에 __pycache__가 생기지 않습니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+from bench.generate import generate
+from bench.harness import ROOT
+
+ENTRY = "KUCinema"
+CORE_MODULE = "cinema"
+
+# 시작 경로(날짜 프롬프트까지)에서 가져오면 안 되는 모듈 — 필요한 모드/메뉴에서만 가져옴
+DEFERRED = ("menu1", "menu2", "menu3", "menu4", "paging", "batch", "server", "sqlstore", "sqlite3", "archive", "analytics", "importer",
+            "gzip", "asyncio", "concurrent.futures", "multiprocessing", "cProfile", "statistics")
+
+# 실제 세션 입력: 날짜, 학번, 확인, 비밀번호(합성 데이터의 00번), 메뉴 2 → 3(목록에서 0) → 4 → 종료
+SESSION_MENUS = ("menu2", "menu3", "menu4")
+
+
+def _env(pycache: str) -> dict:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = pycache
+    return env
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """-X importtime 출력 → [(모듈, 자체 μs, 누적 μs)] (가져온 순서, 이름 앞 들여쓰기 제거)"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue   # 머리글 행
+        rows.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return rows
+
+
+def measure_startup(env: dict, repeat: int) -> tuple[float, list[tuple[str, int, int]]]:
+    """import KUCinema를 repeat번 측정 → (가장 짧은 누적 시간 ms, 그 실행의 행)"""
+    cmd = [sys.executable, "-X", "importtime", "-c", f"import {ENTRY}"]
+    subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, check=True)   # 바이트코드 캐시 데우기
+    best_ms, best_rows = float("inf"), []
+    for _ in range(repeat):
+        proc = subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+        rows = parse_importtime(proc.stderr)
+        total = next(cum for name, _, cum in rows if name == ENTRY) / 1000
+        if total < best_ms:
+            best_ms, best_rows = total, rows
+    return best_ms, best_rows
+
+
+def run_session(env: dict) -> tuple[int, list[str]]:
+    """합성 데이터로 콘솔 세션 하나를 실행 → (종료 코드, 가져온 모듈 이름 목록)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        start = date(2030, 1, 1)
+        generate(Path(tmp), 50, 10, 30, start=start)
+        password = (Path(tmp) / "student-info.txt").read_text(encoding="utf-8").splitlines()[0].split("/")[1]
+        lines = [f"{start - timedelta(days=1):%Y-%m-%d}", "00", "Y", password, "2", "3", "0", "4", "0"]
+        proc = subprocess.run([sys.executable, "-X", "importtime", str(ROOT / f"{ENTRY}.py")], cwd=tmp, env=env,
+                              input="\n".join(lines) + "\n", capture_output=True, text=True, encoding="utf-8")
+    return proc.returncode, [name for name, _, _ in parse_importtime(proc.stderr)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="KUCinema 시작 시 모듈 가져오기 시간 예산 확인")
+    parser.add_argument("--budget-ms", type=float, default=60.0, help="import KUCinema 누적 시간 예산 (ms)")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 횟수 (가장 짧은 값을 사용)")
+    parser.add_argument("--top", type=int, default=10, help="자체 시간이 긴 모듈 몇 개를 출력할지")
+    args = parser.parse_args(argv)
+
+    failed = []
+    with tempfile.TemporaryDirectory() as pycache:
+        env = _env(pycache)
+        total_ms, rows = measure_startup(env, max(1, args.repeat))
+        status = "통과" if total_ms <= args.budget_ms else "초과"
+        print(f"import {ENTRY}: {total_ms:.1f} ms (예산 {args.budget_ms:.1f} ms) — {status}")
+        if total_ms > args.budget_ms:
+            failed.append(f"가져오기 시간 {total_ms:.1f} ms > 예산 {args.budget_ms:.1f} ms")
+        for name, self_us, cum_us in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+            print(f"  {name:<24} 자체 {self_us / 1000:>7.2f} ms   누적 {cum_us / 1000:>7.2f} ms")
+
+        imported = {name for name, _, _ in rows}
+        early = [m for m in DEFERRED if m in imported]
+        if early:
+            failed.append(f"시작 경로에서 가져온 지연 대상 모듈: {', '.join(early)}")
+
+        code, session = run_session(env)
+        if code != 0:
+            failed.append(f"세션 종료 코드 {code}")
+        if ENTRY in session:
+            failed.append(f"세션 중 {ENTRY}를 모듈로 다시 가져옴 (프로그램 본체가 두 번 실행됨)")
+        if session.count(CORE_MODULE) != 1:
+            failed.append(f"세션 중 {CORE_MODULE} 가져오기 {session.count(CORE_MODULE)}회 (1회여야 함)")
+        menus = sorted(m for m in session if m.startswith("menu"))
+        if menus != sorted(SESSION_MENUS):
+            failed.append(f"세션 중 가져온 메뉴 모듈 {menus} (고른 메뉴 {list(SESSION_MENUS)}만이어야 함)")
+        print(f"세션: 종료 코드 {code}, 가져온 메뉴 {menus}, {CORE_MODULE} {session.count(CORE_MODULE)}회")
+
+    for f in failed:
+        print(f"  - {f}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+서버 모드 부하 측정 — python -m bench.server_load [--clients N] [--ops N] [--out result.json]
+
+bench.generate로 임시 디렉터리에 합성 데이터를 만들고 `KUCinema.py --serve 127.0.0.1:0`을 별도 프로세스로 띄운 뒤,
+클라이언트 N개가 동시에 접속(모두 접속한 다음 시작)해 로그인 후 아래 흐름을 --ops번 반복합니다.
+  • 예매 : 주 프롬프트 '1' → 날짜 → 영화 → 인원 1 → 좌석표에서 빈 좌석 하나 (충돌/한도 초과 시 '0'으로 복귀)
+  • 조회 : 주 프롬프트 '2' (예매 내역)
+요청 지연 시간 = 한 행을 보낸 뒤 다음 프롬프트까지 받는 데 걸린 시간. 단계별 통계와 처리량을 JSON으로 출력합니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import re
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import sqlstore
+from bench.generate import SLOTS, generate
+from bench.harness import ROOT, _git_revision, summarize
+
+MENU_END = "0) 종료\n"
+DATE_PROMPT = "원하는 날짜의 번호를 입력해주세요 : "
+RE_BOARD_ROW = re.compile(r"^\s+([A-E])((?:\s[□■]){5})\s*$", re.M)
+
+
+class Client:
+    """키오스크 하나 — 행을 보내고 다음 프롬프트까지 읽으며 단계별 지연 시간을 기록"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, samples: dict) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.samples = samples
+
+    async def ask(self, line: str | None, step: str | None = None) -> str:
+        t0 = time.perf_counter()
+        if line is not None:
+            self.writer.write((line + "\n").encode("utf-8"))
+        buf = b""
+        while True:
+            chunk = await self.reader.read(65536)
+            if not chunk:
+                raise ConnectionError("서버가 연결을 닫았습니다.")
+            buf += chunk
+            text = buf.decode("utf-8", "ignore")
+            if text.endswith(": ") or text.endswith(MENU_END):
+                break
+        if step is not None:
+            self.samples.setdefault(step, []).append(time.perf_counter() - t0)
+        return text
+
+    async def quit(self) -> None:
+        """주 프롬프트에서 '0' — 서버가 세션을 끝내고 연결을 닫을 때까지 읽음"""
+        self.writer.write(b"0\n")
+        while await self.reader.read(65536):
+            pass
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def free_seats(board: str) -> list[str]:
+    seats = []
+    for row, cells in RE_BOARD_ROW.findall(board):
+        seats.extend(f"{row}{i}" for i, c in enumerate(cells.split(), start=1) if c == "□")
+    return seats
+
+
+async def book_once(client: Client, n: int, k: int, counts: dict) -> bool:
+    """예매 흐름 한 번. 좌석표가 가득 차 더 진행할 수 없으면 False (연결 종료)"""
+    await client.ask("1", "menu1")
+    await client.ask(str((n + k) % 9 + 1), "select_date")
+    reply = await client.ask(str((n * 7 + k) % len(SLOTS) + 1), "select_movie")
+    if reply.endswith(DATE_PROMPT):               # 한도 초과 → 날짜 목록으로 돌아옴
+        counts["quota"] += 1
+        await client.ask("0", "back")
+        return True
+    board = await client.ask("1", "input_people")
+    free = free_seats(board)
+    if not free:
+        counts["full"] += 1
+        return False
+    reply = await client.ask(free[n % len(free)], "finalize_booking")
+    if reply.endswith(DATE_PROMPT):               # 그사이 다른 세션이 먼저 예매 → 처음부터
+        counts["conflict"] += 1
+        await client.ask("0", "back")
+    else:
+        counts["booked"] += 1
+    return True
+
+
+async def run_clients(port: int, passwords: dict, args, current_date: str) -> dict:
+    samples: dict[str, list[float]] = {}
+    counts = {"booked": 0, "conflict": 0, "quota": 0, "full": 0, "errors": 0}
+    sids = sorted(passwords)
+    connected = asyncio.Barrier(args.clients)   # 모두 접속한 뒤 동시에 시작
+
+    async def one(n: int) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=1 << 20)
+        client = Client(reader, writer, samples)
+        try:
+            await client.ask(None, "connect")
+            await connected.wait()
+            sid = sids[n % len(sids)]
+            await client.ask(current_date, "date")
+            await client.ask(sid, "student_id")
+            await client.ask("Y", "login_intent")
+            await client.ask(passwords[sid], "password")
+            for k in range(args.ops):
+                if not await book_once(client, n, k, counts):
+                    return
+                await client.ask("2", "menu2")
+            await client.quit()
+        except (ConnectionError, OSError):
+            counts["errors"] += 1
+        finally:
+            client.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(n) for n in range(args.clients)))
+    elapsed = time.perf_counter() - started
+    requests = sum(len(v) for v in samples.values())
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "requests": requests,
+        "requests_per_s": round(requests / elapsed, 1) if elapsed > 0 else None,
+        "outcomes": counts,
+        "steps": {step: summarize(v) for step, v in samples.items()},
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="KUCinema 서버 모드 부하 측정 (JSON 출력)")
+    parser.add_argument("--clients", type=int, default=200, help="동시 접속 세션 수")
+    parser.add_argument("--ops", type=int, default=5, help="세션마다 예매+조회 반복 횟수")
+    parser.add_argument("--movies", type=int, default=2000)
+    parser.add_argument("--students", type=int, default=100)
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--full-check", action="store_true", help="서버를 --full-check로 실행")
+    parser.add_argument("--sqlite", action="store_true", help="SQLite 저장소(kucinema.db)로 가져와 실행")
+    parser.add_argument("--out", type=Path, help="결과 JSON 파일 (생략 시 표준 출력)")
+    args = parser.parse_args(argv)
+
+    start = date(2030, 1, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        data = generate(Path(tmp), args.movies, args.students, args.bookings, start=start, seed=args.seed)
+        passwords = dict(line.split("/") for line in
+                         (Path(tmp) / "student-info.txt").read_text(encoding="utf-8").splitlines())
+        if args.sqlite:
+            sqlstore.import_files(Path(tmp))
+        cmd = [sys.executable, str(ROOT / "KUCinema.py"), "--serve", "127.0.0.1:0"]
+        if args.full_check:
+            cmd.append("--full-check")
+        server = subprocess.Popen(cmd, cwd=tmp, stdout=subprocess.PIPE, text=True, encoding="utf-8")
+        try:
+            banner = server.stdout.readline()
+            m = re.search(r":(\d+)에서", banner)
+            if m is None:
+                print(f"서버를 시작하지 못했습니다: {banner.strip()}", file=sys.stderr)
+                return 1
+            results = asyncio.run(run_clients(int(m.group(1)), passwords, args,
+                                              f"{start - timedelta(days=1):%Y-%m-%d}"))
+        finally:
+            server.send_signal(signal.SIGINT)
+            tail = server.communicate(timeout=60)[0]
+        results["server"] = tail.strip().splitlines()[-1:] if tail.strip() else []
+        results["server_exit"] = server.returncode
+
+    report = {
+        "meta": {
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "data": data,
+            "clients": args.clients,
+            "ops": args.ops,
+            "full_check": args.full_check,
+            "store": "sqlite" if args.sqlite else "files",
+        },
+        "results": results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+시작 검사 회귀 사례 — python -m bench.startup_cases [--jobs N]
+
+손으로 만든 작은 데이터 폴더마다 KUCinema.py를 실행해, 시작 검사가 기대한 대로 거절(오류 문구와 종료 코드 1)하거나
+통과(날짜 프롬프트까지 진행, 필요하면 경고 후 예매 데이터 파일 정리)하는지 확인합니다.
+--jobs N(기본 1과 2 모두)으로 분할 검사 경로도 같은 결과인지 확인합니다. 하나라도 다르면 종료 코드 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from bench.harness import ROOT
+
+EMPTY = "[" + ",".join("0" * 25) + "]"
+
+
+def _vec(*bits: int) -> str:
+    return "[" + ",".join("1" if i in bits else "0" for i in range(25)) + "]"
+
+
+SEMANTIC_ERROR = ["!!! 오류:  데이터 파일", "{booking}가 올바르지 않습니다!", "의미 규칙이 위반되었습니다. 프로그램을 종료합니다."]
+ZERO_WARNING = "..! 경고: 예매 데이터 파일에 무의미한 예매 레코드가 존재합니다. 해당 예매 레코드를 삭제합니다."
+DATE_PROMPT = "현재 날짜를 입력하세요 (YYYY-MM-DD) : "
+
+# (이름, 영화 행, 예매 행, 기대 결과)
+#   기대 결과: ("reject", 출력 행) 또는 ("start", 출력 첫 행들, 실행 뒤 예매 행)
+CASES = [
+    ("좌석이 모두 0인 예매뿐인데 영화 좌석 유무 벡터에 예매 좌석이 있음",
+     [f"203001010600/가/2030-01-01/06:00-07:50/{_vec(1)}"],
+     [f"00/203001010600/{EMPTY}"],
+     ("reject", SEMANTIC_ERROR)),
+    ("좌석이 모두 0인 예매와 좌석 합이 맞는 예매",
+     [f"203001010600/가/2030-01-01/06:00-07:50/{_vec(1)}"],
+     [f"00/203001010600/{EMPTY}", f"00/203001010600/{_vec(1)}"],
+     ("start", [ZERO_WARNING], [f"00/203001010600/{_vec(1)}"])),
+    ("좌석이 모두 0인 예매뿐이고 영화 좌석 유무 벡터도 비어 있음",
+     [f"203001010600/가/2030-01-01/06:00-07:50/{EMPTY}"],
+     [f"00/203001010600/{EMPTY}"],
+     ("start", [ZERO_WARNING], [])),
+    ("취소된 예매만 남았는데 영화 좌석 유무 벡터가 비어 있음",
+     [f"203001010600/가/2030-01-01/06:00-07:50/{EMPTY}"],
+     [f"00/203001010600/{_vec(1)}", f"-00/203001010600/{_vec(1)}"],
+     ("start", [], [f"00/203001010600/{_vec(1)}", f"-00/203001010600/{_vec(1)}"])),
+    ("대상이 없는 취소 표시",
+     [f"203001010600/가/2030-01-01/06:00-07:50/{EMPTY}"],
+     [f"-00/203001010600/{_vec(1)}"],
+     ("reject", ["!!! 오류: 데이터 파일", "{booking}가 올바르지 않습니다!",
+                 "의미 규칙이 위반되었습니다. 프로그램을 종료합니다.", f"-00/203001010600/{_vec(1)}"])),
+]
+
+
+def run_case(movies: list[str], bookings: list[str], jobs: int) -> tuple[int, list[str], list[str]]:
+    """데이터 폴더를 만들어 KUCinema.py를 실행 → (종료 코드, 출력 행, 실행 뒤 예매 행)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data = Path(tmp)
+        (data / "movie-schedule.txt").write_text("\n".join(movies) + "\n", encoding="utf-8")
+        (data / "student-info.txt").write_text("00/1234\n", encoding="utf-8")
+        (data / "booking-info.txt").write_text("".join(b + "\n" for b in bookings), encoding="utf-8")
+        args = [sys.executable, str(ROOT / "KUCinema.py")] + (["--jobs", str(jobs)] if jobs > 1 else [])
+        proc = subprocess.run(args, cwd=data, input="", capture_output=True, text=True, encoding="utf-8")
+        lines = proc.stdout.replace(str(data / "booking-info.txt"), "{booking}").splitlines()
+        after = (data / "booking-info.txt").read_text(encoding="utf-8").splitlines()
+    return proc.returncode, lines, after
+
+
+def check(expected: tuple, code: int, lines: list[str], after: list[str]) -> str | None:
+    """기대 결과와 다르면 이유, 같으면 None"""
+    if expected[0] == "reject":
+        if code != 1 or lines != expected[1]:
+            return f"거절되어야 함 (종료 코드 {code}, 출력 {lines})"
+        return None
+    head, bookings = expected[1], expected[2]
+    if lines[:len(head)] != head or len(lines) <= len(head) or not lines[len(head)].startswith(DATE_PROMPT):
+        return f"날짜 프롬프트까지 진행해야 함 (출력 {lines})"
+    if after != bookings:
+        return f"실행 뒤 예매 데이터 파일 {after} (기대 {bookings})"
+    return None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="KUCinema 시작 검사 회귀 사례")
+    parser.add_argument("--jobs", type=int, nargs="*", default=[1, 2], help="확인할 --jobs 값들")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for name, movies, bookings, expected in CASES:
+        for jobs in args.jobs:
+            problem = check(expected, *run_case(movies, bookings, jobs))
+            print(f"[{'OK' if problem is None else '실패'}] {name} (--jobs {jobs})")
+            if problem is not None:
+                print(f"  - {problem}")
+                failed += 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
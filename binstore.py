@@ -0,0 +1,459 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 이진 데이터 형식 — binstore.py  (python binstore.py to-binary|to-text [DIR])
+
+텍스트 데이터 파일은 좌석 벡터를 약 52자의 문자열로 저장하므로 읽을 때마다 행을 나누고 벡터를 해석해야 합니다.
+홈 경로에 movie-schedule.bin이 있으면 프로그램은 텍스트 대신 아래 고정 크기 레코드 형식을 사용합니다.
+  • movie-schedule.bin : 머리말(매직 'KUCM', 버전, 레코드 수) + 영화 레코드 24바이트 × N + 제목 문자열 표
+      영화 레코드 = 고유번호(int64) / 날짜(uint32, 서기 1년 1월 1일부터의 일수) /
+                    시작·종료 시각(uint16 × 2, 0시부터의 분) / 제목 번호(uint32, 문자열 표 색인) / 좌석 유무 마스크(uint32)
+      문자열 표   = 개수(uint32) + (길이(uint16) + UTF-8 바이트) × 개수 — 같은 제목은 한 번만 저장
+  • booking-info.bin   : 머리말(매직 'KUCB', 버전) + 예매 레코드 16바이트 × N (레코드 수 = 파일 크기로 계산)
+      예매 레코드 = 영화 고유번호(int64) / 좌석 예약 마스크(uint32) / 학번(uint16) / 취소 표시(uint8, 1이면 tombstone) + 채움 1바이트
+  • 학생 데이터 파일과 좌석 변경 저널은 두 형식 모두 텍스트 그대로 사용합니다.
+예매 추가와 취소(취소 표시 레코드)는 레코드 하나(16바이트)를 파일 끝에 붙이며, 나머지 쓰기는 텍스트와 같이 임시 파일 작성 후 교체합니다.
+
+텍스트 파일은 교환 형식으로 남습니다. 변환기는 레코드를 한 행(한 레코드)씩 흘려 보내며 변환하고,
+좌석 변경 저널에 남은 변경분을 결과에 반영합니다(원본과 저널은 그대로 두며, 저널은 다시 적용해도 결과가 같음).
+  python binstore.py to-binary [DIR] : movie-schedule.txt, booking-info.txt → .bin (이후 프로그램은 이진 형식으로 동작)
+  python binstore.py to-text   [DIR] : .bin → .txt (내보내기, 이진 파일은 그대로 사용됨)
+텍스트 형식으로 되돌아가려면 to-text 후 .bin 파일을 지우면 됩니다.
+좌석 마스크가 4바이트이므로 기본 상영관(25석)만 표현합니다 — 상영관을 지정한 상영 행(6필드)은 변환할 수 없습니다.
+변환기는 표현할 수 없는 행만 거부하며, 규칙(오름차순, 제목 문자, 좌석 합 등) 검사는 프로그램 시작 시 무결성 검사가 담당합니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import struct
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from journal import SeatJournal, apply_delta, find_invalid_journal_lines
+from locking import FileLock, LOCK_FILE
+from seatmask import FULL_MASK, SEAT_COUNT, format_mask, parse_mask
+
+SUFFIX = ".bin"
+MOVIE_TEXT_FILE = "movie-schedule.txt"
+BOOKING_TEXT_FILE = "booking-info.txt"
+MOVIE_BIN_FILE = "movie-schedule.bin"
+BOOKING_BIN_FILE = "booking-info.bin"
+JOURNAL_FILE = "seat-journal.txt"
+
+_VERSION = 1
+_MOVIE_MAGIC = b"KUCM"
+_BOOKING_MAGIC = b"KUCB"
+_MOVIE_HEADER = struct.Struct("<4sHxxI")     # 매직, 버전, 레코드 수
+_BOOKING_HEADER = struct.Struct("<4sHxx")    # 매직, 버전
+_MOVIE_RECORD = struct.Struct("<qIHHII")     # 고유번호, 날짜, 시작, 종료, 제목 번호, 좌석
+_BOOKING_RECORD = struct.Struct("<qIHBx")    # 영화 고유번호, 좌석, 학번, 취소 표시 (처음 형식의 채움 바이트 = 0)
+_COUNT = struct.Struct("<I")
+_LENGTH = struct.Struct("<H")
+_MAX_MOVIE_ID = 10 ** 12 - 1
+_BLOCK_RECORDS = 4096                         # 변환 시 한 번에 읽는 레코드 수
+
+
+class FormatError(ValueError):
+    """이진 파일 구조가 깨졌거나, 변환할 텍스트 행을 이진 레코드로 표현할 수 없는 경우"""
+
+
+def is_binary(path: Path) -> bool:
+    return path.suffix == SUFFIX
+
+
+# ---------------------------------------------------------------
+# 필드 변환
+# ---------------------------------------------------------------
+def _pack_time(tstr: str) -> Tuple[int, int] | None:
+    """'HH:MM-HH:MM' → (시작 분, 종료 분). 분 자리가 00~59가 아니면 되돌릴 수 없으므로 None"""
+    if len(tstr) != 11 or tstr[2] != ":" or tstr[5] != "-" or tstr[8] != ":":
+        return None
+    fields = (tstr[0:2], tstr[3:5], tstr[6:8], tstr[9:11])
+    if not all(f.isascii() and f.isdigit() for f in fields):
+        return None
+    sh, sm, eh, em = map(int, fields)
+    if sm > 59 or em > 59:
+        return None
+    return sh * 60 + sm, eh * 60 + em
+
+
+def _format_time(start: int, end: int) -> str:
+    return f"{start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}"
+
+
+def _pack_date(dstr: str) -> int | None:
+    digits = dstr[0:4] + dstr[5:7] + dstr[8:10]
+    if len(dstr) != 10 or dstr[4] != "-" or dstr[7] != "-" or not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return date.fromisoformat(dstr).toordinal()
+    except ValueError:
+        return None
+
+
+def _movie_id_number(mid: str) -> int | None:
+    if len(mid) != 12 or not (mid.isascii() and mid.isdigit()):
+        return None
+    return int(mid)
+
+
+# ---------------------------------------------------------------
+# 영화 파일
+# ---------------------------------------------------------------
+def _read_titles(f, path: Path, count: int) -> List[str]:
+    f.seek(_MOVIE_HEADER.size + count * _MOVIE_RECORD.size)
+    raw = f.read(_COUNT.size)
+    if len(raw) != _COUNT.size:
+        raise FormatError(f"{path}: 제목 문자열 표가 없습니다.")
+    titles = []
+    for _ in range(_COUNT.unpack(raw)[0]):
+        raw = f.read(_LENGTH.size)
+        if len(raw) != _LENGTH.size:
+            raise FormatError(f"{path}: 제목 문자열 표가 잘렸습니다.")
+        length = _LENGTH.unpack(raw)[0]
+        data = f.read(length)
+        if len(data) != length:
+            raise FormatError(f"{path}: 제목 문자열 표가 잘렸습니다.")
+        try:
+            titles.append(data.decode("utf-8"))
+        except UnicodeDecodeError:
+            raise FormatError(f"{path}: 제목 문자열 표에 UTF-8이 아닌 제목이 있습니다.") from None
+    if f.read(1):
+        raise FormatError(f"{path}: 제목 문자열 표 뒤에 알 수 없는 데이터가 있습니다.")
+    return titles
+
+
+def _open_movies(f, path: Path) -> Tuple[int, List[str]]:
+    """머리말과 제목 문자열 표를 읽음. return: (레코드 수, 제목 목록) — 파일 위치는 첫 레코드"""
+    head = f.read(_MOVIE_HEADER.size)
+    if len(head) != _MOVIE_HEADER.size:
+        raise FormatError(f"{path}: 머리말이 잘렸습니다.")
+    magic, version, count = _MOVIE_HEADER.unpack(head)
+    if magic != _MOVIE_MAGIC or version != _VERSION:
+        raise FormatError(f"{path}: 영화 이진 파일이 아니거나 지원하지 않는 버전입니다.")
+    titles = _read_titles(f, path, count)
+    f.seek(_MOVIE_HEADER.size)
+    return count, titles
+
+
+def _iter_movie_blocks(f, path: Path, count: int, titles: List[str]) -> Iterator[List[dict]]:
+    """레코드를 _BLOCK_RECORDS개씩 영화 레코드(dict)로 변환해 반환 — 날짜/시간 문자열은 값마다 한 번만 만듦"""
+    dates: Dict[int, str] = {}
+    times: Dict[Tuple[int, int], str] = {}
+    left = count
+    while left:
+        n = min(left, _BLOCK_RECORDS)
+        data = f.read(n * _MOVIE_RECORD.size)
+        if len(data) != n * _MOVIE_RECORD.size:
+            raise FormatError(f"{path}: 영화 레코드가 잘렸습니다.")
+        block = []
+        for mid, day, start, end, title_no, seats in _MOVIE_RECORD.iter_unpack(data):
+            if not 0 <= mid <= _MAX_MOVIE_ID or title_no >= len(titles) or seats > FULL_MASK:
+                raise FormatError(f"{path}: {count - left + len(block) + 1}번째 영화 레코드가 올바르지 않습니다.")
+            dstr = dates.get(day)
+            if dstr is None:
+                try:
+                    dstr = dates[day] = date.fromordinal(day).isoformat()
+                except ValueError:
+                    raise FormatError(f"{path}: {count - left + len(block) + 1}번째 영화 레코드의 날짜가 올바르지 않습니다.") from None
+            tstr = times.get((start, end))
+            if tstr is None:
+                tstr = times[(start, end)] = _format_time(start, end)
+            block.append({"id": f"{mid:012d}", "title": titles[title_no], "date": dstr, "time": tstr, "seats": seats})
+        left -= n
+        yield block
+
+
+def read_movies(path: Path) -> List[dict]:
+    """영화 이진 파일의 레코드를 파일 순서대로 반환. 구조가 깨졌으면 FormatError"""
+    with path.open("rb") as f:
+        count, titles = _open_movies(f, path)
+        return [movie for block in _iter_movie_blocks(f, path, count, titles) for movie in block]
+
+
+class _MovieWriter:
+    """영화 레코드를 하나씩 받아 이진 파일을 씀 — 레코드 수와 제목 문자열 표는 끝에서 채움"""
+
+    def __init__(self, f) -> None:
+        self.f = f
+        self.count = 0
+        self.titles: Dict[str, int] = {}
+        f.write(_MOVIE_HEADER.pack(_MOVIE_MAGIC, _VERSION, 0))
+
+    def add(self, mid: int, day: int, start: int, end: int, title: str, seats: int) -> None:
+        title_no = self.titles.setdefault(title, len(self.titles))
+        self.f.write(_MOVIE_RECORD.pack(mid, day, start, end, title_no, seats))
+        self.count += 1
+
+    def finish(self) -> None:
+        self.f.write(_COUNT.pack(len(self.titles)))
+        for title in self.titles:   # 딕셔너리 순서 = 제목 번호 순서
+            data = title.encode("utf-8")
+            if len(data) > 0xFFFF:
+                raise FormatError(f"제목이 너무 깁니다: {title[:20]}...")
+            self.f.write(_LENGTH.pack(len(data)) + data)
+        self.f.seek(0)
+        self.f.write(_MOVIE_HEADER.pack(_MOVIE_MAGIC, _VERSION, self.count))
+
+
+def _pack_movie(movie: dict) -> Tuple[int, int, int, int, str, int]:
+    """메모리의 영화 레코드 → _MovieWriter.add 인자 (검사를 통과한 레코드 전제)"""
+    start, end = _pack_time(movie["time"])
+    return int(movie["id"]), _pack_date(movie["date"]), start, end, movie["title"], movie["seats"]
+
+
+def write_movies(path: Path, movies) -> None:
+    """영화 레코드들로 영화 이진 파일을 원자적으로 다시 씀 (임시 파일 작성 후 교체)"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        writer = _MovieWriter(f)
+        for movie in movies:
+            writer.add(*_pack_movie(movie))
+        writer.finish()
+    os.replace(tmp_path, path)
+
+
+# ---------------------------------------------------------------
+# 예매 파일
+# ---------------------------------------------------------------
+def _booking_header() -> bytes:
+    return _BOOKING_HEADER.pack(_BOOKING_MAGIC, _VERSION)
+
+
+def _check_booking_header(f, path: Path) -> int:
+    """머리말을 확인하고 레코드 수를 반환. 파일 위치는 첫 레코드"""
+    size = f.seek(0, os.SEEK_END)
+    f.seek(0)
+    head = f.read(_BOOKING_HEADER.size)
+    if len(head) != _BOOKING_HEADER.size or head != _booking_header():
+        raise FormatError(f"{path}: 예매 이진 파일이 아니거나 지원하지 않는 버전입니다.")
+    count, rest = divmod(size - _BOOKING_HEADER.size, _BOOKING_RECORD.size)
+    if rest:
+        raise FormatError(f"{path}: 마지막 예매 레코드가 잘렸습니다 ({rest}바이트).")
+    return count
+
+
+def _iter_booking_blocks(f, path: Path, count: int) -> Iterator[List[dict]]:
+    movie_ids: Dict[int, str] = {}
+    sids = [f"{n:02d}" for n in range(100)]
+    done = 0
+    while done < count:
+        n = min(count - done, _BLOCK_RECORDS)
+        block = []
+        for mid, seats, sid, tombstone in _BOOKING_RECORD.iter_unpack(f.read(n * _BOOKING_RECORD.size)):
+            if not 0 <= mid <= _MAX_MOVIE_ID or seats > FULL_MASK or sid >= 100 or tombstone > 1:
+                raise FormatError(f"{path}: {done + len(block) + 1}번째 예매 레코드가 올바르지 않습니다.")
+            mid_str = movie_ids.get(mid)
+            if mid_str is None:
+                mid_str = movie_ids[mid] = f"{mid:012d}"
+            if tombstone:
+                block.append({"sid": sids[sid], "movie_id": mid_str, "seats": seats, "tombstone": True})
+            else:
+                block.append({"sid": sids[sid], "movie_id": mid_str, "seats": seats})
+        done += n
+        yield block
+
+
+def read_bookings(path: Path) -> List[dict]:
+    """예매 이진 파일의 레코드(취소 표시 포함)를 파일 순서대로 반환. 구조가 깨졌으면 FormatError"""
+    with path.open("rb") as f:
+        count = _check_booking_header(f, path)
+        return [b for block in _iter_booking_blocks(f, path, count) for b in block]
+
+
+def count_bookings(path: Path) -> int:
+    """예매 이진 파일의 레코드 수 (파일 크기로 계산)"""
+    return max(0, path.stat().st_size - _BOOKING_HEADER.size) // _BOOKING_RECORD.size
+
+
+def _pack_booking(booking: dict) -> bytes:
+    return _BOOKING_RECORD.pack(int(booking["movie_id"]), booking["seats"], int(booking["sid"]),
+                                1 if booking.get("tombstone") else 0)
+
+
+def append_bookings(path: Path, bookings) -> None:
+    """예매 레코드들을 한 번의 쓰기로 파일 끝에 추가 (빈 파일이면 머리말부터)"""
+    with path.open("ab") as f:
+        records = b"".join(_pack_booking(b) for b in bookings)
+        if f.tell() == 0:
+            records = _booking_header() + records
+        f.write(records)
+
+
+def write_bookings(path: Path, bookings) -> None:
+    """예매 레코드들로 예매 이진 파일을 원자적으로 다시 씀"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(_booking_header() + b"".join(_pack_booking(b) for b in bookings))
+    os.replace(tmp_path, path)
+
+
+# ---------------------------------------------------------------
+# 스트리밍 변환 (텍스트 ↔ 이진)
+# ---------------------------------------------------------------
+class _AnyMovie:
+    """저널의 형식만 검사할 때 쓰는 '모든 고유번호가 기본 상영관 좌석 수인' 매핑 (이진 형식은 기본 상영관만 지원)"""
+
+    def get(self, movie_id: str, default: int | None = None) -> int:
+        return SEAT_COUNT
+
+
+def _journal_deltas(journal_path: Path) -> Dict[str, List[Tuple[str, int]]]:
+    """좌석 변경 저널 → {영화 고유번호: [(연산, 마스크), ...]} (기록 순서)"""
+    journal = SeatJournal(journal_path)
+    if journal.size() == 0:
+        return {}
+    bads = find_invalid_journal_lines(journal, _AnyMovie())
+    if bads:
+        raise FormatError(f"{journal_path}: 형식에 맞지 않는 행이 있습니다: {bads[0]}")
+    deltas: Dict[str, List[Tuple[str, int]]] = {}
+    for mid, op, mask in journal.entries():
+        deltas.setdefault(mid, []).append((op, mask))
+    return deltas
+
+
+def _replayed(seats: int, deltas: List[Tuple[str, int]] | None) -> int:
+    for op, mask in deltas or ():
+        seats = apply_delta(seats, op, mask)
+    return seats
+
+
+def _iter_text_lines(path: Path) -> Iterator[Tuple[int, str]]:
+    """(행 번호, 행) — read_text().splitlines()와 같은 행 구분 (마지막 줄바꿈 뒤는 행이 아님)"""
+    with path.open(encoding="utf-8", newline="") as f:
+        for no, line in enumerate(f, start=1):
+            yield no, line.rstrip("\r\n")
+
+
+class _TextWriter:
+    """행 사이에만 줄바꿈을 넣어 텍스트 파일을 씀 (write_movie_file/_write_bookings와 같은 모양)"""
+
+    def __init__(self, f) -> None:
+        self.f = f
+        self.first = True
+
+    def line(self, text: str) -> None:
+        self.f.write(text if self.first else "\n" + text)
+        self.first = False
+
+
+def movies_to_binary(src: Path, dst: Path, journal_path: Path) -> int:
+    """movie-schedule.txt → movie-schedule.bin (행 단위 스트리밍). return: 레코드 수"""
+    deltas = _journal_deltas(journal_path)
+    tmp_path = dst.with_name(dst.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        writer = _MovieWriter(f)
+        for no, line in _iter_text_lines(src):
+            parts = line.split("/")
+            packed = None
+            if len(parts) == 5:
+                mid, title, dstr, tstr, vec = parts
+                number, day, span, seats = _movie_id_number(mid), _pack_date(dstr), _pack_time(tstr), parse_mask(vec)
+                if None not in (number, day, span, seats):
+                    packed = (number, day, *span, title, _replayed(seats, deltas.get(mid)))
+            if packed is None:
+                raise FormatError(f"{src}:{no}행을 이진 레코드로 표현할 수 없습니다: {line}")
+            writer.add(*packed)
+        writer.finish()
+    os.replace(tmp_path, dst)
+    return writer.count
+
+
+def movies_to_text(src: Path, dst: Path, journal_path: Path) -> int:
+    """movie-schedule.bin → movie-schedule.txt (레코드 묶음 단위 스트리밍). return: 레코드 수"""
+    deltas = _journal_deltas(journal_path)
+    tmp_path = dst.with_name(dst.name + ".tmp")
+    with src.open("rb") as f, tmp_path.open("w", encoding="utf-8", newline="\n") as out:
+        count, titles = _open_movies(f, src)
+        writer = _TextWriter(out)
+        for block in _iter_movie_blocks(f, src, count, titles):
+            for m in block:
+                seats = _replayed(m["seats"], deltas.get(m["id"]))
+                writer.line(f"{m['id']}/{m['title']}/{m['date']}/{m['time']}/{format_mask(seats)}")
+    os.replace(tmp_path, dst)
+    return count
+
+
+def bookings_to_binary(src: Path, dst: Path) -> int:
+    """booking-info.txt → booking-info.bin (행 단위 스트리밍). return: 레코드 수"""
+    tmp_path = dst.with_name(dst.name + ".tmp")
+    count = 0
+    with tmp_path.open("wb") as f:
+        f.write(_booking_header())
+        for no, line in _iter_text_lines(src):
+            tombstone = line.startswith("-")
+            parts = (line[1:] if tombstone else line).split("/")
+            record = None
+            if len(parts) == 3 and len(parts[0]) == 2 and parts[0].isascii() and parts[0].isdigit():
+                mid, seats = _movie_id_number(parts[1]), parse_mask(parts[2])
+                if mid is not None and seats is not None:
+                    record = _BOOKING_RECORD.pack(mid, seats, int(parts[0]), tombstone)
+            if record is None:
+                raise FormatError(f"{src}:{no}행을 이진 레코드로 표현할 수 없습니다: {line}")
+            f.write(record)
+            count += 1
+    os.replace(tmp_path, dst)
+    return count
+
+
+def bookings_to_text(src: Path, dst: Path) -> int:
+    """booking-info.bin → booking-info.txt (레코드 묶음 단위 스트리밍). return: 레코드 수"""
+    tmp_path = dst.with_name(dst.name + ".tmp")
+    with src.open("rb") as f, tmp_path.open("w", encoding="utf-8", newline="\n") as out:
+        count = _check_booking_header(f, src)
+        writer = _TextWriter(out)
+        for block in _iter_booking_blocks(f, src, count):
+            for b in block:
+                mark = "-" if "tombstone" in b else ""
+                writer.line(f"{mark}{b['sid']}/{b['movie_id']}/{format_mask(b['seats'])}")
+    os.replace(tmp_path, dst)
+    return count
+
+
+def convert(data_dir: Path, target: str) -> Tuple[int, int]:
+    """
+    데이터 디렉터리의 영화/예매 데이터 파일을 target('binary' 또는 'text') 형식으로 변환.
+    실행 중인 키오스크와 겹치지 않도록 데이터 파일 잠금 안에서 수행. return: (영화 레코드 수, 예매 레코드 수)
+    """
+    names = {"binary": ((MOVIE_TEXT_FILE, MOVIE_BIN_FILE), (BOOKING_TEXT_FILE, BOOKING_BIN_FILE)),
+             "text": ((MOVIE_BIN_FILE, MOVIE_TEXT_FILE), (BOOKING_BIN_FILE, BOOKING_TEXT_FILE))}
+    (movie_src, movie_dst), (booking_src, booking_dst) = names[target]
+    journal_path = data_dir / JOURNAL_FILE
+    with FileLock(data_dir / LOCK_FILE):
+        if target == "binary":
+            movies = movies_to_binary(data_dir / movie_src, data_dir / movie_dst, journal_path)
+        else:
+            movies = movies_to_text(data_dir / movie_src, data_dir / movie_dst, journal_path)
+        src = data_dir / booking_src
+        if not src.exists():
+            bookings = 0   # 예매 파일이 아직 없으면 빈 파일로 시작 (프로그램 시작 시 생성하는 것과 같음)
+            if target == "binary":
+                write_bookings(data_dir / booking_dst, [])
+            else:
+                (data_dir / booking_dst).write_text("", encoding="utf-8", newline="\n")
+        elif target == "binary":
+            bookings = bookings_to_binary(src, data_dir / booking_dst)
+        else:
+            bookings = bookings_to_text(src, data_dir / booking_dst)
+    return movies, bookings
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="binstore.py", description="KUCinema 데이터 파일 형식 변환 (텍스트 ↔ 이진)")
+    parser.add_argument("target", choices=["to-binary", "to-text"])
+    parser.add_argument("data_dir", nargs="?", type=Path, default=Path.cwd(), help="데이터 디렉터리 (기본: 현재 경로)")
+    args = parser.parse_args(argv)
+    target = args.target[3:]
+    try:
+        movies, bookings = convert(args.data_dir, target)
+    except (OSError, FormatError) as e:
+        print(f"!!! 오류: {e}")
+        return 1
+    print(f"영화 레코드 {movies}개, 예매 레코드 {bookings}개를 {'이진' if target == 'binary' else '텍스트'} 형식으로 변환했습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
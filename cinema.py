@@ -0,0 +1,1284 @@
+# -*- coding: utf-8 -*-
+"""
+KU 영화 예매 프로그램 공용 모듈 — cinema.py  (실행: python KUCinema.py)
+
+이 파일은 기획서의 6장 중 다음을 구현합니다.
+  • 6.1 날짜 입력 프롬프트 (입력 날짜 검증 및 설정)
+  • 6.2 로그인 프롬프트 (학번 입력 → 로그인 의사 → 기존/신규 분기 → 비밀번호 입력/설정)
+  • 6.3 주 프롬프트 (메뉴 1~4와 0 종료 / 외부 모듈로 디스패치)
+
+※ 데이터 파일 관련
+  - 홈 경로({HOME}) 기준으로 다음 파일을 사용합니다.
+      movie-schedule.txt : 반드시 존재해야 하며(읽기 가능), 없으면 즉시 종료
+      hall-info.txt      : 상영관 배치(행/열/막힌 좌석). 없으면 모든 상영이 기본 상영관(5×5) — seatmask.py 참고
+      student-info.txt   : 없으면 빈 파일 생성
+      booking-info.txt   : 없으면 빈 파일 생성. 취소는 취소 표시 레코드(-<학번>/<영화고유번호>/<좌석벡터>)를 추가하며
+                           죽은 레코드가 많아지면 압축 (repository.py 참고)
+      seat-journal.txt   : 예매/취소로 바뀐 좌석만 추가 기록, 종료 시(또는 크기 초과 시) 영화 파일에 합침
+      .kucinema.cache    : 검사를 통과한 데이터 파일의 지문과 파싱 결과 — 파일이 그대로면 다음 시작 때 검사 생략
+      archive/           : 지난 달 상영과 그 예매의 월별 gzip 보관 파티션과 목록(manifest.txt) — 날짜 입력(6.1) 후
+                           그 달보다 앞선 달의 상영을 옮기며, 시작 시 처음 보거나 바뀐 파티션만 검사 (archive.py 참고)
+  - movie-schedule.bin이 있으면 영화/예매 데이터 파일로 movie-schedule.bin, booking-info.bin(이진 형식)을 사용합니다.
+    (텍스트 파일은 교환 형식 — python binstore.py to-binary|to-text로 변환, binstore.py 참고)
+  - 학생 데이터 파일(student-info.txt)은 프로그램 시작 시 최소 무결성(형식/중복) 검사를 수행합니다.
+
+※ SQLite 저장소
+  - 홈 경로에 kucinema.db가 있으면 위 데이터 파일 대신 SQLite 데이터베이스를 저장소로 사용합니다 (sqlstore.py 참고).
+    python sqlstore.py import : 데이터 파일을 검사해 kucinema.db 생성 / python sqlstore.py export : 텍스트 파일로 내보내기
+
+※ 일괄 처리
+  - python KUCinema.py --batch FILE : 프롬프트 없이 date/login/book/cancel 명령을 실행 (batch.py 참고)
+
+※ 계측
+  - python KUCinema.py --profile : 구간별 시간/파일 I/O를 모아 종료 시 요약 표 출력 (profiling.py 참고)
+
+※ 서버 모드
+  - python KUCinema.py --serve [HOST:]PORT : TCP 연결마다 위 6.1~6.3 흐름을 실행 (server.py 참고)
+    세션 상태(core.LOGGED_IN_SID, core.CURRENT_DATE_STR)는 연결마다 따로 두고, 데이터는 모두 공유
+
+※ 메뉴 디스패치
+  - 사용자가 ‘1’~‘4’를 선택하면 각각 menu1.py~menu4.py의 동일한 함수명(menu1, menu2, ...)을 실행합니다.
+  - 모듈/함수가 없을 경우 친절한 오류 메시지를 출력하고 주 프롬프트로 복귀합니다.
+
+※ 모듈 구성
+  - KUCinema.py는 이 모듈의 run()만 부르는 얇은 실행 스크립트입니다. 스크립트는 __main__으로 실행되므로,
+    메뉴/일괄 처리/서버/저장소 모듈은 상수·검사 함수·입출력 도우미를 모두 이 모듈(cinema)에서 가져옵니다
+    (KUCinema를 가져오면 같은 코드가 다른 이름의 모듈로 한 번 더 실행됨).
+  - 시작 경로에 필요 없는 모듈(메뉴, 병렬 검사 프로세스 풀, SQLite/일괄 처리/서버 모드)은 쓰는 시점에 가져옵니다.
+    메뉴 모듈은 콘솔에서는 처음 선택할 때, 서버 모드에서는 접속을 받기 전에 한꺼번에(preload_menus) 불러옵니다.
+    시작 시 가져오는 모듈의 시간 예산은 python -m bench.importtime으로 확인합니다.
+
+Python 3.11 표준 라이브러리만 사용합니다.
+"""
+
+from __future__ import annotations
+
+"""
+    github 사용법은 노션에
+"""
+
+
+import os
+import sys
+import re
+import argparse
+from pathlib import Path
+from datetime import date
+from typing import Dict, Tuple, List
+from collections import defaultdict
+import core
+import binstore
+from repository import (TOMBSTONE_MARK, CinemaRepository, compact_booking_file, format_booking_line,
+                        format_movie_line, movie_hall, resolve_tombstones, write_booking_file, write_movie_file)
+from journal import SeatJournal, find_invalid_journal_lines
+from locking import FileLock, LOCK_FILE
+from snapshot import CACHE_FILE, load_snapshot, save_snapshot
+import profiling
+from seatmask import HALL_FILE, SEAT_COUNT, Hall, parse_hall_line, parse_mask
+
+
+# ---------------------------------------------------------------
+# 상수 정의
+# ---------------------------------------------------------------
+MOVIE_FILE = "movie-schedule.txt"
+STUDENT_FILE = "student-info.txt"
+BOOKING_FILE = "booking-info.txt"
+JOURNAL_FILE = "seat-journal.txt"   # 좌석 변경 저널 (체크포인트 전까지 movie-schedule.txt 위에 재적용)
+DATABASE_FILE = "kucinema.db"       # 있으면 데이터 파일 대신 SQLite 저장소 사용 (sqlstore.py)
+ARCHIVE_DIR = "archive"             # 지난 상영의 월별 보관 파티션 (archive.py)
+
+# 정규식 패턴 (문법 형식)
+RE_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")          # YYYY-MM-DD
+RE_STUDENT_ID = re.compile(r"^\d{2}$")                  # 2자리 숫자
+RE_PASSWORD = re.compile(r"^\d{4}$")                   # 4자리 숫자
+RE_STUDENT_RECORD = re.compile(r"^(?P<sid>\d{2})/(?P<pw>\d{4})$")  # 학생 레코드 형식
+RE_MOVIE_ID = re.compile(r"^\d{12}$")                   # YYYYMMDDHHMM
+RE_TIME = re.compile(r"^\d{2}:\d{2}-\d{2}:\d{2}$")      # HH:MM-HH:MM
+RE_TITLE = re.compile(r"^(?!\s)(?!.*\s$)[0-9A-Za-z가-힣 ]+$")  # 특수문자 제외, 앞뒤 공백 금지
+RE_BOOKING_RECORD = re.compile(
+    r"^(?P<sid>\d{2})/(?P<mid>\d{12})/(?P<vec>\[[^\]]*\])$"
+)   # 좌석 벡터 길이(상영관 좌석 수)와 원소는 _parse_seat_vector로 검사
+
+# 메뉴 번호 → 메뉴 모듈 (모듈과 같은 이름의 함수를 인자 없이 호출)
+MENU_MODULES = {"1": "menu1", "2": "menu2", "3": "menu3", "4": "menu4"}
+
+# 세션 상태(로그인한 학번, 내부 현재 날짜)는 core.LOGGED_IN_SID / core.CURRENT_DATE_STR
+
+
+# ---------------------------------------------------------------
+# 유틸리티 출력
+# ---------------------------------------------------------------
+def info(msg: str) -> None:
+    print(msg)
+
+def warn(msg: str) -> None:
+    print(f"..! 경고: {msg}")
+
+def error(msg: str) -> None:
+    print(f"!!! 오류: {msg}")
+
+
+# ---------------------------------------------------------------
+# 파일/환경 준비
+# ---------------------------------------------------------------
+def home_path() -> Path:
+    #hp = Path(os.path.expanduser("~")).resolve() # 홈 경로 반환
+    # try:
+    #     hp = Path(os.path.expanduser("~")).resolve()  # 홈 경로 반환
+    # except Exception as e:
+    #     error(f"홈 경로를 파악할 수 없습니다! 프로그램을 종료합니다. {e}")
+    #     sys.exit(1)
+    # 배포하기 전은 현재 경로(KUCinema.py를 실행한 경로)를 반환
+    hp = Path(os.getcwd())
+    #print("현재 경로:", os.getcwd())
+    return hp
+
+
+def ensure_environment() -> Tuple[Path, Path, Path]:
+    """필수 파일 존재/권한 확인 및 학생/예매 파일 생성.
+    홈 경로에 movie-schedule.bin이 있으면 영화/예매 데이터 파일은 이진 형식(.bin)을 사용.
+
+    return: (movie_path, student_path, booking_path)
+    """
+    hp = home_path()
+    binary = (hp / binstore.MOVIE_BIN_FILE).exists()
+    movie_path = hp / (binstore.MOVIE_BIN_FILE if binary else MOVIE_FILE)
+    student_path = hp / STUDENT_FILE
+    booking_path = hp / (binstore.BOOKING_BIN_FILE if binary else BOOKING_FILE)
+
+    # 1) 영화 데이터 파일: 존재 + 읽기 권한 필수
+    if not movie_path.exists():
+        error(f"영화 데이터 파일 \n홈 경로에 영화 데이터 파일({MOVIE_FILE})이 존재하지 않습니다. 프로그램을 종료합니다.")
+        sys.exit(1)
+    try:
+        _ = movie_path.read_bytes() if binary else movie_path.read_text(encoding="utf-8")
+    except Exception as e:
+        error(f"{movie_path}'에 대한 읽기 권한이 없습니다! 프로그램을 종료합니다. {e}")
+        sys.exit(1)
+
+    # 2) 학생 데이터 파일: 없으면 빈 파일 생성, 있으면 읽기/쓰기 가능 확인
+    if not student_path.exists():
+        warn(f"홈 경로 {hp}에 학생 데이터 파일이 없습니다.")
+        try:
+            student_path.write_text("", encoding="utf-8", newline="\n")
+            info(f"... 홈 경로에 빈 학생 데이터 파일을 새로 생성했습니다: \n{student_path}")
+        except Exception as e:
+            error(f"홈 경로에 학생 데이터 파일을 생성하지 못했습니다! 프로그램을 종료합니다.")
+            sys.exit(1)
+    else:
+        try:
+            _ = student_path.read_text(encoding="utf-8")
+        except Exception as e:
+            error(f"데이터 파일\n{student_path}에 대한 입출력 권한이 없습니다! 프로그램을 종료합니다.")
+            sys.exit(1)
+
+    # 3) 예매 데이터 파일: 없으면 빈 파일 생성 (6.1~6.3에서는 직접 사용하지 않지만 미리 준비)
+    if not booking_path.exists():
+        warn(f"홈 경로 {hp}에 예매 데이터 파일이 없습니다.")
+        try:
+            write_booking_file(booking_path, [])
+            info(f"... 홈 경로에 빈 예매 데이터 파일을 새로 생성했습니다:\n{booking_path}")
+        except Exception as e:
+            error(f"홈 경로에 예메 데이터파일을 생성하지 못했습니다! 프로그램을 종료합니다.")
+            sys.exit(1)
+    else:
+        try:
+            _ = booking_path.read_bytes() if binary else booking_path.read_text(encoding="utf-8")
+        except Exception as e:
+            error(f"데이터 파일\n{booking_path}\n에 대한 입출력 권한이 없습니다! 프로그램을 종료합니다.")
+            sys.exit(1)
+
+    return movie_path, student_path, booking_path
+
+
+# ---------------------------------------------------------------
+# 학생 파일 무결성 체크 (형식/중복)
+# ---------------------------------------------------------------
+def load_and_validate_students(student_path: Path) -> Dict[str, str]:
+    """학생 데이터 파일을 읽고 최소 무결성 점검.
+
+    - 각 행은 반드시 "NN/NNNN" 형식이어야 함
+    - 학번 중복 금지
+    - 공백 행/공백류 행 금지(파일에 등장하면 오류)
+    """
+    raw = student_path.read_text(encoding="utf-8").splitlines()
+    students: Dict[str, str] = {}
+    bad_lines: list[Tuple[int, str]] = []
+
+    for idx, line in enumerate(raw, start=1):
+        if line.strip() == "":
+            # 기획서 5.2.1: 모든 행이 학생 레코드여야 하므로 공백행도 오류로 간주
+            bad_lines.append((idx, line))
+            continue
+        m = RE_STUDENT_RECORD.match(line)
+        if not m:
+            bad_lines.append((idx, line))
+            continue
+        sid = m.group("sid")
+        pw = m.group("pw")
+        if sid in students:
+            bad_lines.append((idx, line))  # 중복도 오류로 보임
+            continue
+        students[sid] = pw
+
+    if bad_lines:
+        error("데이터 파일\n{student_path}가 올바르지 않습니다! 프로그램을 종료합니다.")
+        for li, content in bad_lines:
+            #print(f"  - {li}행: {content!r}")
+            print(f"{content}")
+        sys.exit(1)
+
+
+    return students
+
+# ---------------------------------------------------------------
+# 상영관 데이터 파일 무결성 체크 (형식/중복)
+# ---------------------------------------------------------------
+def load_and_validate_halls(hall_path: Path) -> Dict[str, Hall]:
+    """상영관 데이터 파일을 읽고 검사. 파일이 없으면 빈 딕셔너리(모든 상영이 기본 상영관).
+
+    - 각 행은 "<상영관번호>/<행 수>/<열 수>/<막힌 좌석,...>" 형식이어야 함 (seatmask.parse_hall_line)
+    - 상영관번호 중복 금지, 공백 행 금지
+    - 위배 행은 모두 출력 후 종료
+    """
+    try:
+        raw = hall_path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return {}
+    halls: Dict[str, Hall] = {}
+    bad_lines: List[str] = []
+
+    for line in raw:
+        hall = parse_hall_line(line)
+        if hall is None or hall.id in halls:
+            bad_lines.append(line)
+            continue
+        halls[hall.id] = hall
+
+    if bad_lines:
+        error(f"데이터 파일\n{hall_path}가 올바르지 않습니다! 프로그램을 종료합니다.")
+        for content in bad_lines:
+            print(f"{content}")
+        sys.exit(1)
+    return halls
+
+
+# ---------------------------------------------------------------
+# 영화 데이터 파일 무결성 체크 
+# ---------------------------------------------------------------
+
+def _parse_time_bounds(t: str) -> Tuple[int, int]:
+    sh, sm, eh, em = int(t[0:2]), int(t[3:5]), int(t[6:8]), int(t[9:11])
+    return sh * 60 + sm, eh * 60 + em
+
+def _valid_movie_time(s: str) -> bool:
+    if not RE_TIME.fullmatch(s):
+        return False
+    sh, sm = int(s[0:2]), int(s[3:5])
+    eh, em = int(s[6:8]), int(s[9:11])
+    if not (0 <= sh <= 23 and 0 <= sm <= 59):
+        return False
+    if not (0 <= eh <= 99 and 0 <= em <= 59):
+        return False
+    start_min, end_min = _parse_time_bounds(s)
+    return end_min > start_min  # 종료는 시작+1분 이상
+
+def _valid_movie_id(mid: str) -> bool:
+    if not RE_MOVIE_ID.fullmatch(mid):
+        return False
+    yyyy = int(mid[0:4]); mm = int(mid[4:6]); dd = int(mid[6:8])
+    hh = int(mid[8:10]); m2 = int(mid[10:12])
+    if yyyy < 1583:
+        return False
+    try:
+        date(yyyy, mm, dd)
+    except ValueError:
+        return False
+    return 0 <= hh <= 23 and 0 <= m2 <= 59
+
+def _valid_title(title: str) -> bool:
+    return RE_TITLE.fullmatch(title) is not None
+
+def _parse_seat_vector(vec: str, count: int = SEAT_COUNT) -> int | None:
+    """좌석 벡터 문자열('[0,1,...]', 길이 count(상영관 좌석 수, 기본 25)의 0/1)을 마스크로 변환. 형식 위배 시 None"""
+    return parse_mask(vec, count)
+
+def _parse_movie_record(line: str, halls: Dict[str, Hall]) -> dict | None:
+    """
+    영화 레코드 한 행의 필드 단위 규칙 검사 (행 사이 규칙은 제외) 후 레코드로 변환. 위배 시 None.
+    5필드(mid/title/date/time/seatvec) 또는 6필드(mid/title/date/time/hall/seatvec), 각 필드 문법·의미,
+    고유번호 연도와 날짜 연도 일치, 상영관번호는 halls에 있어야 하며 막힌 좌석은 예매될 수 없음.
+    """
+    if line != line.strip():
+        return None  # 레코드 앞/뒤 공백 금지
+
+    parts = line.split("/")
+    if len(parts) == 5:
+        mid, title, dstr, tstr, vec = parts
+        hall_id = None
+    elif len(parts) == 6:
+        mid, title, dstr, tstr, hall_id, vec = parts
+        if hall_id not in halls:
+            return None  # 상영관 데이터 파일에 없는 상영관번호
+    else:
+        return None  # 필드 개수 오류(5개 또는 6개 아님)
+
+    if not _valid_movie_fields(mid, title, dstr, tstr):
+        return None
+    hall = halls[hall_id] if hall_id is not None else None
+    seats = _parse_seat_vector(vec, hall.count if hall else SEAT_COUNT)
+    if seats is None:
+        return None  # 좌석 유무 벡터 형식 오류(길이 = 상영관 좌석 수의 0/1 배열)
+    if hall is None:
+        return {"id": mid, "title": title, "date": dstr, "time": tstr, "seats": seats}
+    if seats & hall.blocked:
+        return None  # 막힌 좌석이 예매됨
+    return {"id": mid, "title": title, "date": dstr, "time": tstr, "hall": hall_id, "seats": seats}
+
+
+def _valid_movie_fields(mid: str, title: str, dstr: str, tstr: str) -> bool:
+    """좌석 벡터를 뺀 영화 레코드 필드 규칙 (텍스트 행과 이진 레코드가 함께 사용)"""
+    if not _valid_movie_id(mid):
+        return False  # 영화 상영표 고유번호 형식/의미 오류
+    if not _valid_title(title):
+        return False  # 영화 제목 형식 오류(특수문자/앞뒤공백 금지)
+    if not RE_DATE.fullmatch(dstr):
+        return False  # 영화 날짜 문법 오류(YYYY-MM-DD)
+    y, m, d = int(dstr[0:4]), int(dstr[5:7]), int(dstr[8:10])
+    try:
+        date(y, m, d)
+    except ValueError:
+        return False  # 영화 날짜 의미 오류(존재하지 않는 날짜)
+    if int(mid[0:4]) != y:
+        return False  # 고유번호 연도와 영화 날짜 연도 불일치
+    return _valid_movie_time(tstr)  # 영화 시간 형식/의미 오류(HH:MM-HH:MM)
+
+def _valid_movie_record(line: str, halls: Dict[str, Hall]) -> bool:
+    """영화 레코드 한 행의 필드 단위 규칙 검사 (행 사이 규칙은 제외)"""
+    return _parse_movie_record(line, halls) is not None
+
+
+def _parse_movie_lines(lines: List[str], halls: Dict[str, Hall]) -> List[dict] | None:
+    """영화 레코드 행들의 필드 단위 규칙 검사. 위배 행이 하나라도 있으면 None (분할 검사의 한 조각 단위)"""
+    records: List[dict] = []
+    for line in lines:
+        movie = _parse_movie_record(line, halls)
+        if movie is None:
+            return None
+        records.append(movie)
+    return records
+
+
+def _read_movie_records(movie_path: Path) -> List[dict] | None:
+    """영화 이진 파일의 레코드를 읽어 필드 단위 규칙 검사. 구조가 깨졌거나 위배 레코드가 있으면 None"""
+    try:
+        records = binstore.read_movies(movie_path)
+    except binstore.FormatError:
+        return None
+    for movie in records:
+        # 좌석 마스크 범위는 binstore가 확인함
+        if not _valid_movie_fields(movie["id"], movie["title"], movie["date"], movie["time"]):
+            return None
+    return records
+
+
+def validate_movie_file(movie_path: Path, jobs: int = 1, halls: Dict[str, Hall] | None = None) -> Dict[str, dict]:
+    """
+    영화 파일을 처음부터 끝까지 검사.
+    - 문법/의미 위배 발견 즉시 오류 출력 후 종료.
+    규칙: 5필드(mid/title/date/time/seatvec) 또는 6필드(상영관번호 포함), 각 필드 문법·의미,
+          고유번호 오름차순, 중복 금지, 같은 날짜 상영 10개 이상 금지.
+    halls: 검사를 통과한 상영관 (load_and_validate_halls, 없으면 기본 상영관만)
+    jobs > 1이면 필드 단위 검사를 행 경계로 나눈 조각별로 여러 프로세스에서 수행 (행 사이 규칙은 합친 뒤 검사)
+    이진 형식(.bin)은 레코드를 해석할 필요가 없으므로 jobs와 무관하게 한 프로세스에서 검사
+    return: 검사를 통과한 영화 레코드 {고유번호: 레코드} (파일 순서 = 오름차순)
+    """
+    if binstore.is_binary(movie_path):
+        records = _read_movie_records(movie_path)
+    elif jobs > 1:
+        parts = _map_line_chunks(movie_path, _movie_chunk_worker, jobs, (halls or {},))
+        records = None if any(part is None for part in parts) else [m for part in parts for m in part]
+    else:
+        records = _parse_movie_lines(movie_path.read_text(encoding="utf-8").splitlines(), halls or {})
+
+    movies = _index_movie_records(records) if records else None
+    if movies is None:
+        # 빈 파일(최소 1개 레코드 필요) 또는 문법/의미 규칙 위배 — 오류 문구는 동일
+        error(f"영화 데이터 파일\n데이터 파일에 규칙에 위배되는 행이 존재합니다. 프로그램을 종료합니다.")
+        sys.exit(1)
+    return movies
+
+
+def _index_movie_records(records: List[dict]) -> Dict[str, dict] | None:
+    """
+    필드 검사를 통과한 영화 레코드의 행 사이 규칙 검사 (고유번호 오름차순, 중복 금지, 같은 날짜 상영 10개 이상 금지).
+    return: {고유번호: 레코드} (파일 순서), 위배 시 None
+    """
+    prev_id_num: int | None = None
+    movies: Dict[str, dict] = {}
+    daily_counts = defaultdict(int)
+
+    for movie in records:
+        mid, dstr = movie["id"], movie["date"]
+
+        id_num = int(mid)
+        if prev_id_num is not None and id_num <= prev_id_num:
+            return None  # 고유번호 오름차순 위배
+        prev_id_num = id_num
+
+        if mid in movies:
+            return None  # 고유번호 중복
+        movies[mid] = movie
+
+        daily_counts[dstr] += 1
+        if daily_counts[dstr] >= 10:
+            return None  # 같은 날짜 상영 10개 이상
+
+    return movies
+
+
+# ---------------------------------------------------------------
+# 좌석 변경 저널 복구
+# ---------------------------------------------------------------
+def recover_seat_journal(movie_path: Path, journal_path: Path, movies: Dict[str, dict],
+                         halls: Dict[str, Hall] | None = None) -> None:
+    """
+    이전 실행에서 체크포인트되지 않은 좌석 변경 저널을 영화 데이터 파일에 합침.
+    - 영화 데이터 파일 검사 이후, 예매 데이터 파일 검사 이전에 호출
+    - movies: validate_movie_file이 반환한 영화 레코드 (좌석 마스크를 저널 반영 상태로 갱신)
+    - 형식 위배 행/존재하지 않는 영화 고유번호를 참조하는 행은 모두 출력 후 종료
+    - 막힌 좌석을 예매하는 변경은 반영하지 않음 (정상적인 예매/취소로는 생기지 않음)
+    """
+    journal = SeatJournal(journal_path)
+    if journal.size() == 0:
+        return
+
+    halls = halls or {}
+    bads = find_invalid_journal_lines(journal, _seat_counts(movies, halls))
+    if bads:
+        error(f"데이터 파일\n{journal_path}가 올바르지 않습니다! 프로그램을 종료합니다.")
+        for line in bads:
+            print(f"{line}")
+        sys.exit(1)
+
+    masks = {mid: m["seats"] for mid, m in movies.items()}
+    journal.replay(masks)
+    for mid, mask in masks.items():
+        movies[mid]["seats"] = mask & ~movie_hall(movies[mid], halls).blocked
+    write_movie_file(movie_path, movies.values(), halls)
+    journal.clear()
+
+
+# ---------------------------------------------------------------
+# 시작 시 무결성 검사 — 파일마다 한 번만 읽는 단일 패스
+# ---------------------------------------------------------------
+def _seat_counts(movies: Dict[str, dict], halls: Dict[str, Hall]) -> Dict[str, int]:
+    """{영화 고유번호: 상영관 좌석 수} — 예매/저널 행의 좌석 벡터 길이 검사용"""
+    return {mid: movie_hall(m, halls).count for mid, m in movies.items()}
+
+
+def _seat_sums(bookings: List[dict], referenced=()) -> Tuple[Dict[str, int], bool]:
+    """
+    예매 레코드들의 영화별 좌석 합과, 같은 영화의 예약 마스크끼리 겹치는지 여부.
+    referenced: 좌석이 모두 0인 레코드가 참조하는 영화 고유번호 — 합 0으로 넣어 두어, 그 영화의 좌석 유무 마스크에
+                예매된 좌석이 있으면 0인 레코드를 지우기 전에 좌석 합 불일치로 걸리게 함
+    """
+    summed: Dict[str, int] = dict.fromkeys(referenced, 0)
+    overlapped = False
+    for b in bookings:
+        mid, seats = b["movie_id"], b["seats"]
+        acc = summed.get(mid, 0)
+        if acc & seats:
+            overlapped = True
+        summed[mid] = acc | seats
+    return summed, overlapped
+
+
+def _resolve_booking_scan(records: List[dict], result: dict) -> dict:
+    """
+    한 조각의 레코드(취소 표시 포함)에 취소 표시를 적용해 검사 결과를 채움.
+    조각 앞쪽에 대상이 있는 취소 표시는 "orphans"로 남겨 조각을 합칠 때 다시 적용 (_join_booking_scans)
+    """
+    alive, orphans = resolve_tombstones(records)
+    bookings = [records[i] for i in alive]
+    zero_ids = {b["movie_id"] for b in records if b["seats"] == 0 and "tombstone" not in b}
+    result["sums"], result["overlapped"] = _seat_sums(bookings, zero_ids)
+    result["removed"] = sum(1 for b in records if b["seats"] == 0 and "tombstone" not in b)
+    result["zero_ids"] = zero_ids
+    result["bookings"] = bookings
+    result["orphans"] = orphans
+    return result
+
+
+def _scan_booking_lines(lines: List[str], student_ids, seat_counts: Dict[str, int]) -> dict:
+    """
+    예매 레코드 행들을 한 번 훑어 검사 결과를 모음 (분할 검사의 한 조각 단위, 보고/종료는 하지 않음).
+    취소 표시 행("-" + 예매 레코드)도 같은 문법/참조 규칙으로 검사.
+    seat_counts: {영화 고유번호: 상영관 좌석 수} — 좌석 벡터 길이는 예매한 상영의 상영관을 따름
+                 (없는 영화 고유번호는 기본 상영관 길이로 문법 검사 후 참조 위배로 보고)
+    return: {"syntax": 문법 위배 행, "sid": 없는 학번 참조 행, "mid": 없는 영화 고유번호 참조 행,
+             "sums": {영화 고유번호: 좌석 합}, "overlapped": 조각 안 좌석 겹침 여부,
+             "removed": 좌석이 모두 0인 레코드 수, "zero_ids": 그 레코드들이 참조하는 영화 고유번호,
+             "bookings": 취소되지 않은 나머지 예매 레코드, "orphans": 조각 안에 대상이 없는 취소 표시}
+    """
+    syntax_bads: List[str] = []
+    sid_bads: List[str] = []
+    mid_bads: List[str] = []
+    records: List[dict] = []
+
+    for line in lines:
+        # 문법 (학번/영화고유번호/좌석벡터, 앞뒤 공백·빈 행 금지)
+        if line.strip() == "" or line != line.strip():
+            syntax_bads.append(line)
+            continue
+        tombstone = line.startswith(TOMBSTONE_MARK)
+        m = RE_BOOKING_RECORD.match(line[1:] if tombstone else line)
+        if not m:
+            syntax_bads.append(line)
+            continue
+        sid, mid = m.group("sid"), m.group("mid")
+        if not RE_STUDENT_ID.fullmatch(sid):
+            syntax_bads.append(line)
+        if not RE_MOVIE_ID.fullmatch(mid):
+            syntax_bads.append(line)
+        seats = _parse_seat_vector(m.group("vec"), seat_counts.get(mid, SEAT_COUNT))
+        if seats is None:
+            syntax_bads.append(line)
+            continue
+
+        # 참조 규칙 (학생/영화 데이터 파일에 있는 학번·영화 고유번호)
+        if sid not in student_ids:
+            sid_bads.append(line)
+        if mid not in seat_counts:
+            mid_bads.append(line)
+
+        if tombstone:
+            records.append({"sid": sid, "movie_id": mid, "seats": seats, "tombstone": True})
+        else:
+            records.append({"sid": sid, "movie_id": mid, "seats": seats})
+
+    # 좌석 일관성(예매 좌석 합 = 영화 좌석 마스크, 겹침 금지)은 취소되지 않은 예매로 확인 — 좌석이 모두 0인 레코드는
+    # 좌석을 더하지 않지만 참조하는 영화는 합 0으로 비교 대상에 넣음
+    return _resolve_booking_scan(records, {"syntax": syntax_bads, "sid": sid_bads, "mid": mid_bads})
+
+
+def _scan_booking_records(records: List[dict], student_ids, movie_ids) -> dict:
+    """
+    이진 예매 파일의 레코드를 _scan_booking_lines와 같은 결과 형태로 검사 (문법은 binstore가 확인함).
+    위배 레코드는 텍스트 행 형식으로 보고.
+    """
+    sid_bads: List[str] = []
+    mid_bads: List[str] = []
+    for b in records:
+        if b["sid"] not in student_ids:
+            sid_bads.append(format_booking_line(b))
+        if b["movie_id"] not in movie_ids:
+            mid_bads.append(format_booking_line(b))
+    return _resolve_booking_scan(records, {"syntax": [], "sid": sid_bads, "mid": mid_bads})
+
+
+def _join_booking_scans(parts: List[dict]) -> Tuple[List[dict], List[dict], Dict[str, int], bool]:
+    """
+    조각별 검사 결과를 파일 순서대로 합침. 조각 안에서 대상을 찾지 못한 취소 표시는 앞 조각의 예매에 적용.
+    return: (예매 레코드, 대상이 없는 취소 표시, 영화별 좌석 합, 좌석 겹침 여부)
+    """
+    if len(parts) == 1:
+        part = parts[0]
+        return part["bookings"], part["orphans"], part["sums"], part["overlapped"]
+
+    live: Dict[Tuple[str, str, int], Tuple[int, int]] = {}
+    cancelled = set()
+    orphans: List[dict] = []
+    for k, part in enumerate(parts):
+        for t in part["orphans"]:
+            target = live.pop((t["sid"], t["movie_id"], t["seats"]), None)
+            if target is None:
+                orphans.append(t)
+            else:
+                cancelled.add(target)
+        for i, b in enumerate(part["bookings"]):
+            live[(b["sid"], b["movie_id"], b["seats"])] = (k, i)
+    bookings = [b for k, part in enumerate(parts) for i, b in enumerate(part["bookings"]) if (k, i) not in cancelled]
+    if cancelled:
+        summed, overlapped = _seat_sums(bookings, set().union(*(part["zero_ids"] for part in parts)))
+        return bookings, orphans, summed, overlapped
+
+    # 조각별 좌석 합을 합침 — 서로 다른 조각의 예매끼리 겹치면 조각별 합끼리도 겹침
+    overlapped = any(part["overlapped"] for part in parts)
+    summed: Dict[str, int] = {}
+    for part in parts:
+        for mid, mask in part["sums"].items():
+            acc = summed.get(mid, 0)
+            if acc & mask:
+                overlapped = True
+            summed[mid] = acc | mask
+    return bookings, orphans, summed, overlapped
+
+
+def scan_booking_file(booking_path: Path, students: Dict[str, str], movies: Dict[str, dict],
+                      jobs: int = 1, halls: Dict[str, Hall] | None = None) -> List[dict]:
+    """
+    예매 데이터 파일을 한 번 읽으며 아래 검사를 한꺼번에 수행하고, 위배 보고는 이 순서를 따름.
+      문법 → 없는 학번 참조 → 없는 영화 고유번호 참조 → 취소 표시 대상 확인
+      → 좌석 일관성(예매 좌석 합 = 영화 좌석 마스크, 겹침 금지) → 좌석이 모두 0인 레코드 삭제
+    좌석 합은 취소 표시를 적용한(취소되지 않은) 예매로 확인하며, 앞선 같은 예매가 없는 취소 표시는 의미 규칙 위배.
+    좌석이 모두 0인 레코드가 있으면 경고 후 예매 데이터 파일을 압축(compact_booking_file)해 한 번에 지움.
+    students, movies: 검사를 통과한(저널 반영 후) 학생/영화 레코드, halls: 검사를 통과한 상영관
+    jobs > 1이면 행 경계로 나눈 조각을 여러 프로세스에서 검사한 뒤 파일 순서대로 합침
+    이진 형식(.bin)은 구조가 깨졌으면 문법 위배로 보고하고, 나머지 검사는 같음
+    return: 취소된 예매와 좌석이 모두 0인 레코드를 제외한 예매 레코드 리스트 (파일 순서)
+    """
+    if binstore.is_binary(booking_path):
+        try:
+            records = binstore.read_bookings(booking_path)
+        except binstore.FormatError as e:
+            error(f"데이터 파일\n{booking_path}가 올바르지 않습니다! 프로그램을 종료합니다.")
+            print(e)
+            sys.exit(1)
+        parts = [_scan_booking_records(records, students, movies)]
+    else:
+        seat_counts = _seat_counts(movies, halls or {})
+        if jobs > 1:
+            parts = _map_line_chunks(booking_path, _booking_chunk_worker, jobs, (set(students), seat_counts))
+        else:
+            parts = [_scan_booking_lines(booking_path.read_text(encoding="utf-8").splitlines(), students, seat_counts)]
+
+    syntax_bads = [line for part in parts for line in part["syntax"]]
+    if syntax_bads:
+        error(f"데이터 파일\n{booking_path}가 올바르지 않습니다! 프로그램을 종료합니다.")
+        for content in syntax_bads:
+            print(f"{content}")
+        sys.exit(1)
+
+    for key in ("sid", "mid"):
+        invalid_lines = [line for part in parts for line in part[key]]
+        if invalid_lines:
+            error(f"데이터 파일\n{booking_path}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
+            for line in invalid_lines:
+                print(line)
+            sys.exit(1)
+
+    bookings, orphans, summed, overlapped = _join_booking_scans(parts)
+    if orphans:
+        error(f"데이터 파일\n{booking_path}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
+        for t in orphans:
+            print(format_booking_line(t, movie_hall(movies[t["movie_id"]], halls or {}).count))
+        sys.exit(1)
+
+    if overlapped or any(movies[mid]["seats"] != mask for mid, mask in summed.items()):
+        error(f" 데이터 파일\n{booking_path}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
+        sys.exit(1)
+
+    if any(part["removed"] for part in parts):
+        # 드문 경로: 좌석이 모두 0인 레코드를 압축으로 지움 (취소 표시도 함께 정리, 텍스트는 나머지 원본 행 그대로 보존)
+        warn(f"예매 데이터 파일에 무의미한 예매 레코드가 존재합니다. 해당 예매 레코드를 삭제합니다.")
+        bookings = compact_booking_file(booking_path)
+    return bookings
+
+
+# ---------------------------------------------------------------
+# 병렬 분할 검사 (--jobs N) — 행 경계로 나눈 파일 조각을 프로세스 풀에서 검사
+# ---------------------------------------------------------------
+_CHUNK_CONTEXT: tuple = ()   # 작업 프로세스마다 한 번 전달되는 검사 문맥 (상영관 / 학번 집합, 영화별 좌석 수)
+
+
+def _line_chunks(path: Path, count: int) -> List[Tuple[int, int]]:
+    """파일을 대략 같은 크기의 바이트 구간 count개로 나누되, 각 경계를 줄바꿈 바로 뒤로 맞춤"""
+    size = path.stat().st_size
+    bounds = [0]
+    with path.open("rb") as f:
+        for k in range(1, count):
+            pos = size * k // count
+            if pos <= bounds[-1]:
+                continue
+            f.seek(pos - 1)
+            f.readline()   # pos-1 이후 첫 줄바꿈까지 건너뜀
+            end = f.tell()
+            if end >= size:
+                break
+            if end > bounds[-1]:
+                bounds.append(end)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _read_line_chunk(path: Path, start: int, end: int) -> List[str]:
+    """바이트 구간을 읽어 행 리스트로 변환 (구간들을 이어 붙인 결과 = read_text().splitlines())"""
+    with path.open("rb") as f:
+        f.seek(start)
+        return f.read(end - start).decode("utf-8").splitlines()
+
+
+def _init_chunk_worker(*context) -> None:
+    global _CHUNK_CONTEXT
+    _CHUNK_CONTEXT = context
+
+
+def _movie_chunk_worker(path: Path, start: int, end: int) -> List[dict] | None:
+    halls, = _CHUNK_CONTEXT
+    return _parse_movie_lines(_read_line_chunk(path, start, end), halls)
+
+
+def _booking_chunk_worker(path: Path, start: int, end: int) -> dict:
+    student_ids, seat_counts = _CHUNK_CONTEXT
+    return _scan_booking_lines(_read_line_chunk(path, start, end), student_ids, seat_counts)
+
+
+def _map_line_chunks(path: Path, worker, jobs: int, context: tuple = ()) -> list:
+    """파일 조각마다 worker(path, start, end)를 jobs개 프로세스에서 실행하고 결과를 파일 순서대로 반환"""
+    from concurrent.futures import ProcessPoolExecutor   # --jobs > 1일 때만 필요 (multiprocessing 가져오기 비용이 큼)
+
+    chunks = _line_chunks(path, jobs * 4)   # 조각을 작업 수보다 잘게 나눠 부하 분산
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_chunk_worker, initargs=context) as pool:
+        return list(pool.map(worker, [path] * len(chunks), [c[0] for c in chunks], [c[1] for c in chunks]))
+
+
+def run_startup_checks(movie_path: Path, student_path: Path, booking_path: Path, journal_path: Path,
+                       jobs: int = 1) -> Tuple[Dict[str, dict], Dict[str, str], List[dict]]:
+    """
+    시작 시 무결성 검사 전체를 각 데이터 파일을 한 번씩만 읽어 수행.
+    오류 출력/종료 코드와 보고 순서는 개별 검사를 차례로 실행한 것과 같음:
+      상영관 → 학생 → 영화 → 좌석 변경 저널 복구 → 예매(문법 → 학번 → 영화 고유번호 → 좌석 합) → 0좌석 레코드 삭제
+    상영관 데이터 파일은 영화 데이터 파일과 같은 경로의 hall-info.txt (저장소는 adopt에서 다시 읽음)
+    jobs > 1이면 영화/예매 데이터 파일을 조각으로 나눠 여러 프로세스에서 검사 (결과와 보고 순서는 같음)
+    return: 저장소에 그대로 넘길 (영화 레코드, 학생 레코드, 예매 레코드)
+    """
+    with profiling.phase("startup:halls"):
+        halls = load_and_validate_halls(movie_path.with_name(HALL_FILE))
+    with profiling.phase("startup:students"):
+        students = load_and_validate_students(student_path)
+    with profiling.phase("startup:movies"):
+        movies = validate_movie_file(movie_path, jobs, halls)
+    with profiling.phase("startup:journal"):
+        recover_seat_journal(movie_path, journal_path, movies, halls)
+    with profiling.phase("startup:bookings"):
+        bookings = scan_booking_file(booking_path, students, movies, jobs, halls)
+    return movies, students, bookings
+
+# ---------------------------------------------------------------
+# 보관 파티션 검사 (archive.py) — 처음 보거나 바뀐 파티션만
+# ---------------------------------------------------------------
+def _valid_archive_partition(movie_lines: List[str], booking_lines: List[str], month: str,
+                             students: Dict[str, str], halls: Dict[str, Hall]) -> Tuple[int, int] | None:
+    """
+    보관 파티션 하나를 데이터 파일과 같은 규칙으로 검사하고, 상영 날짜가 모두 그 달인지와
+    예매가 같은 파티션의 상영만 참조하는지(취소 표시나 좌석이 모두 0인 레코드 없이) 확인.
+    return: (영화 수, 예매 수), 위배 시 None
+    """
+    records = _parse_movie_lines(movie_lines, halls)
+    movies = _index_movie_records(records) if records else None
+    if movies is None or any(m["date"][:7] != month for m in movies.values()):
+        return None
+    scan = _scan_booking_lines(booking_lines, students, _seat_counts(movies, halls))
+    if scan["syntax"] or scan["sid"] or scan["mid"] or scan["overlapped"]:
+        return None
+    if len(scan["bookings"]) != len(booking_lines):
+        return None  # 취소 표시 또는 좌석이 모두 0인 레코드
+    if any(movies[mid]["seats"] != mask for mid, mask in scan["sums"].items()):
+        return None
+    return len(movies), len(booking_lines)
+
+
+def verify_archive(archive_dir: Path, students: Dict[str, str], halls: Dict[str, Hall]) -> None:
+    """
+    보관 파티션 검사. 목록(manifest.txt)의 지문과 같은 파티션은 읽지 않고 건너뛰며(파일 상태 확인만),
+    지문만 바뀌고 해시가 같으면 지문만 갱신. 목록에 없거나 해시가 다른 파티션은 한 번 검사한 뒤 해시와 지문을 기록.
+    - 파티션 파일이 없거나 압축이 깨졌거나 규칙에 위배되면 오류 출력 후 종료
+    - students, halls: 검사를 통과한 학생/상영관 (보관된 예매의 학번, 상영의 상영관 참조)
+    """
+    if not archive_dir.is_dir():
+        return
+    import archive   # 보관 파티션이 있을 때만 (gzip)
+
+    entries = archive.read_manifest(archive_dir)
+    changed = False
+    for month in archive.list_partitions(archive_dir, entries):
+        paths = archive.partition_paths(archive_dir, month)
+        missing = [path for path in paths if not path.exists()]
+        if missing:
+            error(f"보관 파티션\n{missing[0]}이(가) 존재하지 않습니다. 프로그램을 종료합니다.")
+            sys.exit(1)
+        entry = entries.get(month)
+        stamp = archive.partition_stamp(paths)
+        if entry is not None and entry["stamp"] == stamp:
+            continue
+        digest = archive.partition_checksum(paths)
+        if entry is not None and entry["sha256"] == digest:
+            entry["stamp"] = stamp   # 복사 등으로 파일 상태만 바뀜
+            changed = True
+            continue
+        try:
+            counts = _valid_archive_partition(*archive.read_partition_lines(archive_dir, month), month,
+                                              students, halls)
+        except (OSError, EOFError, UnicodeDecodeError):
+            counts = None
+        if counts is None:
+            error(f"보관 파티션\n{paths[0]}, {paths[1]}가 올바르지 않습니다! 프로그램을 종료합니다.")
+            sys.exit(1)
+        entries[month] = archive.manifest_entry(*counts, digest, stamp)
+        changed = True
+    if changed:
+        archive.write_manifest(archive_dir, entries)
+
+
+def archive_past_showings(repo: CinemaRepository, date_str: str) -> None:
+    """
+    date_str이 속한 달보다 앞선 달의 상영을 그 예매와 함께 보관 파티션으로 옮김 (archive.py).
+    옮길 상영이 없으면 보관 모듈을 가져오지도 않음. SQLite 저장소는 보관하지 않음
+    """
+    if repo.backend != "files" or not repo.movies_before(date_str[:7] + "-01"):
+        return
+    import archive
+
+    with profiling.phase("archive:seal"):
+        months = archive.seal_before(repo, date_str, home_path() / ARCHIVE_DIR)
+    if months:
+        info(f"지난 상영({', '.join(months)})을 보관 파티션으로 옮겼습니다. (조회: python archive.py history)")
+
+# ---------------------------------------------------------------
+# 예매/취소 직후 무결성 검사 — 변경분(델타)만 검사
+# ---------------------------------------------------------------
+def validate_mutation_delta(repo: CinemaRepository, movie_id: str, booking: dict, added: bool) -> None:
+    """
+    예매/취소로 바뀐 레코드만 검사. 위배 시 전체 검사와 같은 오류를 출력하고 종료.
+    - 좌석이 바뀐 영화 레코드 1행 (필드 문법/의미)
+    - 추가(added=True) 또는 삭제된 예매 레코드 1행 (문법, 추가 시 학번/영화 고유번호 참조)
+    - 해당 영화 고유번호 하나의 좌석 합 불변식 (예약 마스크끼리 겹치지 않고, 합 == 좌석 유무 마스크)
+    영화 레코드와 예매 레코드를 같은 시점의 상태로 읽도록 저장소 잠금 안에서 검사
+    (서버 모드에서 다른 세션의 변경이 두 조회 사이에 끼어들지 않도록 — run_full_check와 같은 `with repo.lock:`)
+    """
+    with repo.lock:
+        booking_path = repo.booking_path
+        movie = repo.get_movie(movie_id)
+        count = repo.hall_of(movie_id).count
+
+        # 1. 변경된 영화 레코드
+        if movie is None or not _valid_movie_record(format_movie_line(movie, count), repo.halls):
+            error(f"영화 데이터 파일\n데이터 파일에 규칙에 위배되는 행이 존재합니다. 프로그램을 종료합니다.")
+            sys.exit(1)
+
+        # 2. 추가/삭제된 예매 레코드
+        line = format_booking_line(booking, count)
+        m = RE_BOOKING_RECORD.match(line)
+        if not m or _parse_seat_vector(m.group("vec"), count) is None:
+            error(f"데이터 파일\n{booking_path}가 올바르지 않습니다! 프로그램을 종료합니다.")
+            print(line)
+            sys.exit(1)
+        if added and booking["sid"] not in repo.students:
+            error(f"데이터 파일\n{booking_path}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
+            print(line)
+            sys.exit(1)
+
+        # 3. 해당 영화의 좌석 합 불변식
+        summed = 0
+        overlapped = False
+        for b in repo.bookings_for_movie(movie_id):
+            overlapped = overlapped or bool(summed & b["seats"])
+            summed |= b["seats"]
+        if overlapped or summed != movie["seats"]:
+            error(f" 데이터 파일\n{booking_path}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
+            sys.exit(1)
+
+
+def validate_database(repo) -> None:
+    """
+    SQLite 저장소(sqlstore.py) 무결성 검사 — 데이터 파일 검사와 같은 규칙, 같은 오류 출력과 보고 순서.
+    형식 규칙은 테이블 제약 조건(quick_check)으로, 참조/좌석 합/같은 날짜 상영 수는 질의로 확인하고
+    영화 레코드의 필드 의미 규칙만 행마다 검사 (고유번호 중복/순서는 기본 키가 보장).
+    """
+    path = repo.path
+    problems = repo.structure_problems()
+    if problems:
+        error(f"데이터 파일\n{path}가 올바르지 않습니다! 프로그램을 종료합니다.")
+        for line in problems:
+            print(line)
+        sys.exit(1)
+
+    movies_ok = False
+    for movie in repo.iter_movies():
+        movies_ok = _valid_movie_fields(movie["id"], movie["title"], movie["date"], movie["time"])
+        if not movies_ok:
+            break
+    if not movies_ok or repo.crowded_dates(10):
+        error(f"영화 데이터 파일\n데이터 파일에 규칙에 위배되는 행이 존재합니다. 프로그램을 종료합니다.")
+        sys.exit(1)
+
+    for table in ("students", "showings"):
+        invalid = repo.dangling_bookings(table)
+        if invalid:
+            error(f"데이터 파일\n{path}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
+            for b in invalid:
+                print(format_booking_line(b))
+            sys.exit(1)
+
+    if not repo.seat_sums_consistent():
+        error(f" 데이터 파일\n{path}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
+        sys.exit(1)
+
+
+def run_full_check(repo: CinemaRepository) -> None:
+    """--full-check 모드: 저널을 합친 뒤 세 데이터 파일 전체를 시작 시와 동일하게 재검사하고 저장소를 다시 읽음"""
+    if repo.backend == "sqlite":
+        with repo.lock:
+            validate_database(repo)
+        return
+    with repo.lock:
+        repo.checkpoint()
+        repo.adopt(*run_startup_checks(repo.movie_path, repo.student_path, repo.booking_path, repo.journal.path,
+                                       core.CHECK_JOBS))
+
+
+def check_after_mutation(movie_id: str, booking: dict, added: bool) -> None:
+    """예매/취소 직후 호출. 기본은 변경분 검사, --full-check 지정 시 전체 재검사"""
+    repo = core.REPO
+    if core.FULL_CHECK:
+        with profiling.phase("check:full"):
+            run_full_check(repo)
+    else:
+        with profiling.phase("check:delta"):
+            validate_mutation_delta(repo, movie_id, booking, added)
+
+# ---------------------------------------------------------------
+# 날짜(6.1) — 문법/의미 검증
+# ---------------------------------------------------------------
+def is_valid_date_string(s: str) -> bool:
+    """YYYY-MM-DD 형식 + 실제 존재하는 날짜 + 연도 첫 자리가 0이 아님"""
+    if not RE_DATE.fullmatch(s):
+        return False
+    if s[0] == "0":
+        return False  # 연도 첫 자리는 0 불가
+    y, m, d = int(s[0:4]), int(s[5:7]), int(s[8:10])
+    try:
+        # 그레고리력 시작일(1582년 10월 15일) 이전의 날짜는 거부
+        if y < 1582 or (y == 1582 and m < 10) or (y == 1582 and m == 10 and d < 15):
+            return False
+        date(y, m, d)
+    except ValueError:
+        return False
+    return True
+
+
+def prompt_input_date() -> str:
+    """6.1 날짜 입력 프롬프트"""
+    while True:
+        s = input("현재 날짜를 입력하세요 (YYYY-MM-DD) : ")
+        # 문법/의미 체크
+        if not RE_DATE.fullmatch(s):
+            info("날짜 형식이 맞지 않습니다. 다시 입력해주세요")
+            continue
+        if not is_valid_date_string(s):
+            info("존재하지 않는 날짜입니다. 다시 입력해주세요.")
+            continue
+        return s
+
+
+# ---------------------------------------------------------------
+# 로그인 플로우(6.2)
+# ---------------------------------------------------------------
+def prompt_student_id() -> str:
+    """6.2.1 학번 입력 — 문법 형식: 2자리 숫자, 공백 불가"""
+    while True:
+        sid = input("학번을 입력하세요 (2자리 숫자) : ")
+        if not RE_STUDENT_ID.fullmatch(sid):
+            info("학번의 형식이 올바르지 않습니다. 다시 입력해주세요.")
+            continue
+        return sid
+
+
+def prompt_login_intent(sid: str) -> bool:
+    """6.2.2 로그인 의사 — 'Y'만 긍정, 나머지는 모두 부정"""
+    ans = input(f"{sid} 님으로 로그인하시겠습니까? (Y/N) : ")
+    return ans == "Y"
+
+
+def prompt_password_existing(expected_pw: str) -> bool:
+    """6.2.3 기존 회원 비밀번호 입력.
+    - 문법 형식 위배: 현재 단계(비밀번호 입력) 재시작
+    - 의미 규칙 위배(불일치): 6.2.1 학번 입력으로 되돌아가야 하므로 False 반환
+    - 정상: True 반환
+    """
+    while True:
+        pw = input("비밀번호를 입력하세요 (4자리 숫자) : ")
+        if not RE_PASSWORD.fullmatch(pw):
+            info("비밀번호의 형식이 올바르지 않습니다. 다시 입력해주세요.")
+            continue  # 6.2.3 재시작
+        if pw != expected_pw:
+            info("비밀번호가 올바르지 않습니다.")
+            return False  # 6.2.1로 복귀
+        # 정상
+        return True
+
+
+def prompt_password_new(repo: CinemaRepository, sid: str) -> bool:
+    """6.2.4 신규 회원: 비밀번호 설정 후 파일에 <학번>/<비밀번호> 추가.
+    - 그사이 다른 키오스크에서 같은 학번이 먼저 가입된 경우 False 반환 (6.2.1로 복귀)
+    """
+    while True:
+        pw = input("신규 회원입니다. 비밀번호를 설정해주세요 (4자리 숫자) : ")
+        if not RE_PASSWORD.fullmatch(pw):
+            info("비밀번호의 형식이 올바르지 않습니다. 다시 입력해주세요.")
+            continue
+        # 저장소를 통해 파일에 추가
+        if not repo.add_student(sid, pw):
+            info("이미 가입된 학번입니다. 다시 로그인해주세요.")
+            return False
+        #info("신규 회원 가입이 완료되었습니다.")
+        return True
+
+
+def login_flow(repo: CinemaRepository) -> str:
+    """6.2 로그인 플로우 전체 — 로그인(또는 가입)에 성공한 학번을 반환"""
+    while True:
+        sid = prompt_student_id()  # 6.2.1
+        if not prompt_login_intent(sid):  # 6.2.2 (부정이면 학번 입력 재시작)
+            continue
+
+        repo.refresh()  # 다른 키오스크에서 가입한 학생 반영
+        if sid in repo.students:  # 기존 회원 → 6.2.3
+            if not prompt_password_existing(repo.students[sid]):
+                # 의미 규칙 위배(비밀번호 불일치) → 6.2.1로 되돌아감
+                continue
+            # 정상 로그인
+            info(f"{sid} 님 환영합니다.")
+            return sid
+        # 신규 회원 → 6.2.4
+        if not prompt_password_new(repo, sid):
+            continue
+        info(f"회원가입되었습니다. {sid} 님 환영합니다.")
+        return sid
+
+
+# ---------------------------------------------------------------
+# 주 프롬프트(6.3) & 메뉴 디스패치
+# ---------------------------------------------------------------
+def show_main_menu() -> None:
+    print()
+    print("원하는 동작에 해당하는 번호를 입력하세요.")
+    print("1) 영화 예매")
+    print("2) 예매 내역 조회")
+    print("3) 예매 취소")
+    print("4) 상영 시간표 조회")
+    print("0) 종료")
+
+
+def load_menu(choice: str):
+    """메뉴 번호의 모듈을 가져와 반환 (이미 가져온 모듈이면 sys.modules의 것을 그대로 사용)"""
+    return __import__(MENU_MODULES[choice])
+
+
+def preload_menus() -> None:
+    """
+    메뉴 모듈 전체를 미리 가져옴 (서버 모드).
+    - 콘솔은 처음 고른 메뉴만 그때 가져오지만, 서버는 첫 접속의 응답이 모듈 가져오기를 기다리지 않도록
+      접속을 받기 전에 한꺼번에 가져옴 (여러 연결 스레드가 동시에 처음 가져오는 일도 없음)
+    """
+    with profiling.phase("startup:menus"):
+        for choice in MENU_MODULES:
+            load_menu(choice)
+
+
+def dispatch_menu(choice: str) -> None:
+    """외부 모듈(menu1~menu4)의 동일 함수(menu1~menu4)를 호출.
+    모듈/함수 미존재 시 오류 메시지 후 복귀.
+    """
+    module_name = MENU_MODULES[choice]
+    func_name = module_name
+
+    try:
+        mod = load_menu(choice)
+    except Exception as e:
+        error(f"메뉴 모듈 '{module_name}.py'을(를) 불러올 수 없습니다: {e}")
+        return
+
+    func = getattr(mod, func_name, None)
+    if not callable(func):
+        error(f"'{module_name}.py' 안에 함수 '{func_name}()'가 없습니다.")
+        return
+
+    try:
+        # --profile: 메뉴 한 번 실행 전체를 하나의 구간으로 계측 (--profile-dump면 cProfile 결과도 저장)
+        with profiling.phase(module_name, dump=True):
+            # 다른 키오스크가 그사이 바꾼 데이터 파일이 있으면 메뉴 진입 전에 반영
+            if core.REPO is not None:
+                core.REPO.refresh()
+            # 기획서/요청: menu1() 식으로 인자 없이 호출
+            func()
+    except TypeError as te:
+        error(f"함수 호출 형식 오류: {module_name}.{func_name}(): {te}")
+    except SystemExit:
+        raise
+    except Exception as e:
+        error(f"메뉴 실행 중 예외가 발생했습니다: {e}")
+
+
+def data_paths(repo: CinemaRepository) -> Tuple[Path, Path, Path, Path, Path]:
+    """검증 상태 캐시의 지문 대상 파일 (영화, 학생, 예매, 좌석 변경 저널, 상영관)"""
+    return repo.movie_path, repo.student_path, repo.booking_path, repo.journal.path, repo.hall_path
+
+
+def save_validated_snapshot(repo: CinemaRepository) -> None:
+    """
+    메모리 상태가 검사를 통과한 상태이고 파일과 일치하면 검증 상태 캐시에 저장.
+    다른 곳에서 바뀐 파일을 검사 없이 다시 읽은 경우(repo.validated == False)에는 저장하지 않음.
+    """
+    with repo.lock:
+        repo.refresh()
+        if repo.validated:
+            save_snapshot(home_path() / CACHE_FILE, data_paths(repo), repo.movies, repo.students, repo.bookings)
+
+
+def shutdown() -> None:
+    """종료 전 정리: 좌석 변경 저널을 영화 데이터 파일에 합치고 검증 상태 캐시 갱신"""
+    if core.REPO is not None:
+        with profiling.phase("shutdown"):
+            core.REPO.checkpoint()
+            save_validated_snapshot(core.REPO)
+
+
+def main_prompt_loop() -> None:
+    """6.3 주 프롬프트 — 입력 검증 및 분기. '0'을 입력하면 반환"""
+    while True:
+        show_main_menu()
+        s = input("")
+
+        # 문법 형식: 숫자만의 길이 1
+        if not re.fullmatch(r"\d", s or ""):
+            info("올바르지 않은 입력입니다. 원하는 동작에 해당하는 번호만 입력하세요.")
+            continue
+
+        # 의미 규칙: {1,2,3,4,0}
+        if s not in {"1", "2", "3", "4", "0"}:
+            info("범위 밖의 입력입니다. 다시 입력해주세요.")
+            continue
+
+        if s == "0":
+            return  # 종료 처리는 호출 측(콘솔: main, 서버: 세션 종료)
+
+        # 1~4: 해당 메뉴 모듈로 디스패치
+        dispatch_menu(s)
+
+
+# ---------------------------------------------------------------
+# 엔트리포인트: 전체 플로우 결합
+# ---------------------------------------------------------------
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="KUCinema.py", description="KU 영화 예매 프로그램")
+    parser.add_argument(
+        "--full-check", action="store_true",
+        help="예매/취소 직후 변경분 대신 데이터 파일 전체를 다시 검사",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, metavar="N",
+        help="영화/예매 데이터 파일 무결성 검사를 N개 프로세스로 나눠 수행 (대용량 파일용, 기본 1)",
+    )
+    parser.add_argument(
+        "--batch", metavar="FILE",
+        help="프롬프트 대신 명령 파일(date/login/book/cancel, '-'이면 표준 입력)을 일괄 실행",
+    )
+    parser.add_argument(
+        "--serve", metavar="[HOST:]PORT",
+        help="여러 키오스크가 TCP로 접속하는 서버 모드로 실행 (기본 호스트 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="구간(시작 검사, 메뉴, 파일 기록)별 시간/읽기·쓰기 바이트/파일 열기 횟수를 모아 종료 시 요약 표 출력",
+    )
+    parser.add_argument(
+        "--profile-dump", type=Path, metavar="DIR",
+        help="--profile과 함께 메뉴 실행마다 cProfile 결과를 DIR에 저장 (--profile 포함)",
+    )
+    return parser.parse_args(argv)
+
+
+def open_data_files(lock: FileLock) -> CinemaRepository:
+    """데이터 파일 저장소 준비 — 환경 확인, 시작 시 무결성 검사(또는 검증 상태 캐시) 후 저장소 구성"""
+    # 0) 환경 준비
+    with profiling.phase("startup:environment"):
+        movie_path, student_path, booking_path = ensure_environment()
+
+    # 0-0) 다른 키오스크와 데이터 디렉터리를 공유할 수 있으므로 검사/복구 동안 잠금 유지
+    with lock:
+        # 0-1) 무결성 검사 — 학생 → 영화(위배 즉시 종료) → 좌석 변경 저널 복구
+        #      → 예매 문법/의미 규칙(위배 행 전부 출력 후 종료) → 좌석이 모두 0인 예매 레코드 삭제
+        #      각 파일은 한 번씩만 읽음
+        #      마지막으로 검사를 통과한 뒤 데이터 파일이 그대로면(지문 일치) 검사 없이 캐시된 상태 사용
+        journal_path = home_path() / JOURNAL_FILE
+        repo = CinemaRepository(movie_path, student_path, booking_path, journal_path, lock)
+        cache_path = home_path() / CACHE_FILE
+        with profiling.phase("startup:snapshot_load"):
+            state = load_snapshot(cache_path, data_paths(repo))
+        if state is None:
+            state = run_startup_checks(movie_path, student_path, booking_path, journal_path, core.CHECK_JOBS)
+            with profiling.phase("startup:snapshot_save"):
+                save_snapshot(cache_path, data_paths(repo), *state)
+
+        # 0-2) 검사에서 파싱한 레코드로 공유 저장소 구성 (메뉴 1~4가 공유, 파일을 다시 읽지 않음)
+        with profiling.phase("startup:adopt"):
+            repo.adopt(*state)
+
+        # 0-3) 보관 파티션 — 이미 검사한 파티션은 파일 상태만 확인 (archive.py)
+        with profiling.phase("startup:archive"):
+            verify_archive(home_path() / ARCHIVE_DIR, repo.students, repo.halls)
+    return repo
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    core.FULL_CHECK = args.full_check
+    core.CHECK_JOBS = max(1, args.jobs)
+    if args.profile or args.profile_dump is not None:
+        profiling.enable(args.profile_dump)
+
+    # 0) 저장소 준비 — kucinema.db가 있으면 SQLite 저장소, 없으면 데이터 파일
+    lock = FileLock(home_path() / LOCK_FILE)
+    database_path = home_path() / DATABASE_FILE
+    if database_path.exists():
+        # SQLite 저장소 — 데이터베이스를 검사한 뒤 메뉴 1~4가 질의로 사용 (sqlstore.py)
+        import sqlstore
+        with lock, profiling.phase("startup:database"):
+            repo = sqlstore.SqliteRepository.open(database_path, lock)
+            validate_database(repo)
+    else:
+        repo = open_data_files(lock)
+    core.REPO = repo
+
+    # 0-3) 일괄 처리 모드 — 날짜/로그인/메뉴 프롬프트 대신 명령 파일 실행 (batch.py)
+    if args.batch is not None:
+        import batch
+        with profiling.phase("batch"):
+            code = batch.run_batch(args.batch, repo)
+        shutdown()
+        sys.exit(code)
+
+    # 0-4) 서버 모드 — 연결마다 날짜/로그인/주 프롬프트를 실행, 저장소는 모든 연결이 공유 (server.py)
+    if args.serve is not None:
+        import server
+        preload_menus()
+        code = server.run_server(args.serve, repo)
+        if code == 0:
+            shutdown()
+        sys.exit(code)
+
+    # 1) 6.1 — 날짜 입력
+    core.CURRENT_DATE_STR = prompt_input_date()  # 내부 현재 날짜 확정
+    archive_past_showings(repo, core.CURRENT_DATE_STR)   # 지난달까지의 상영은 보관 파티션으로
+
+    # 2) 6.2 — 로그인 플로우
+    core.LOGGED_IN_SID = login_flow(repo)
+
+    # 3) 6.3 — 주 프롬프트
+    main_prompt_loop()
+    shutdown()
+    info("프로그램을 종료합니다.")
+    sys.exit(0)
+
+
+def run(argv: List[str] | None = None) -> None:
+    """실행 스크립트(KUCinema.py)의 진입점 — Ctrl+C 종료 처리 포함"""
+    try:
+        main(argv)
+    except KeyboardInterrupt:
+        shutdown()
+        print()  # 줄바꿈 정리
+        warn("사용자에 의해 종료되었습니다.")
+        sys.exit(130)
@@ -1,3 +1,64 @@
 # core.py
-LOGGED_IN_SID: str | None = None
-CURRENT_DATE_STR: str | None = None
\ No newline at end of file
+"""
+세션 상태와 프로세스 공용 설정.
+
+LOGGED_IN_SID / CURRENT_DATE_STR / REPO는 '현재 세션'의 값입니다.
+콘솔 실행은 기본 세션 하나만 쓰므로 예전처럼 모듈 전역 변수처럼 동작하고,
+서버 모드(server.py)는 연결마다 Session을 만들어 use_session()으로 지정하므로
+메뉴 코드를 바꾸지 않고도 연결끼리 로그인/날짜 상태가 섞이지 않습니다 (contextvars 기반).
+"""
+from __future__ import annotations
+
+import sys
+import types
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from repository import CinemaRepository
+
+LOGGED_IN_SID: str | None        # 로그인된 학번 (세션별)
+CURRENT_DATE_STR: str | None     # 내부 현재 날짜 (세션별)
+REPO: CinemaRepository | None    # main()에서 한 번 로드되는 공유 데이터 저장소 (서버 세션은 공유 프록시)
+FULL_CHECK: bool = False  # --full-check: 예매/취소 후 데이터 파일 전체 재검사
+CHECK_JOBS: int = 1  # --jobs N: 무결성 검사를 N개 프로세스로 나눠 수행
+
+
+class Session:
+    """사용자 한 명의 세션 상태 — 콘솔은 기본 세션 하나, 서버는 연결마다 하나"""
+
+    def __init__(self, repo: CinemaRepository | None = None) -> None:
+        self.LOGGED_IN_SID: str | None = None
+        self.CURRENT_DATE_STR: str | None = None
+        self.REPO = repo
+
+
+_DEFAULT_SESSION = Session()
+_CURRENT_SESSION: ContextVar[Session] = ContextVar("kucinema_session", default=_DEFAULT_SESSION)
+
+
+def current_session() -> Session:
+    return _CURRENT_SESSION.get()
+
+
+def use_session(session: Session) -> Token:
+    """현재 컨텍스트(스레드/태스크)의 세션을 지정. 반환한 토큰으로 reset_session() 가능"""
+    return _CURRENT_SESSION.set(session)
+
+
+def reset_session(token: Token) -> None:
+    _CURRENT_SESSION.reset(token)
+
+
+def _session_attr(name: str) -> property:
+    return property(lambda _mod: getattr(_CURRENT_SESSION.get(), name),
+                    lambda _mod, value: setattr(_CURRENT_SESSION.get(), name, value))
+
+
+class _CoreModule(types.ModuleType):
+    LOGGED_IN_SID = _session_attr("LOGGED_IN_SID")
+    CURRENT_DATE_STR = _session_attr("CURRENT_DATE_STR")
+    REPO = _session_attr("REPO")
+
+
+sys.modules[__name__].__class__ = _CoreModule
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 상영표 일괄 가져오기 — importer.py  (python importer.py BATCH [--dry-run] [DIR])
+
+새 상영 묶음(정렬되지 않은 CSV 또는 텍스트)을 영화 데이터 파일에 합칩니다.
+  • 텍스트 : 영화 데이터 파일과 같은 행 (고유번호/제목/날짜/시간[/상영관번호]/좌석벡터), 빈 행은 무시
+  • CSV    : 고유번호,제목,날짜,시간[,상영관번호][,좌석벡터] (.csv 확장자, 첫 행이 고유번호가 아니면 머리글로 건너뜀)
+             좌석벡터를 생략하면 상영관 좌석 수만큼의 빈 벡터
+검사: 행마다 시작 검사(validate_movie_file)와 같은 필드 규칙(cinema._parse_movie_record — 12자리 고유번호,
+고유번호 연도와 날짜 연도 일치, HH:MM-HH:MM, 상영관 좌석 수 길이의 좌석 벡터) + 새 상영은 예매된 좌석이 없어야 함.
+위배 행은 모두 모아 출력하고 파일을 건드리지 않음.
+합치기: 묶음을 고유번호순으로 정렬한 뒤 기존 파일 행(오름차순)과 한 번에 흘려 합치며(heapq.merge) 행 사이 규칙
+(고유번호 오름차순·중복 금지, 같은 날짜 상영 10개 이상 금지)을 검사하고 임시 파일에 씀 — 끝까지 통과하면 교체.
+기존 텍스트 행은 다시 만들지 않고 그대로 옮김. 변경은 키오스크와 같은 파일 잠금 안에서 하므로,
+실행 중인 키오스크는 다음 조회에서 바뀐 파일을 다시 읽음. SQLite 저장소(kucinema.db)는 지원하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import heapq
+import os
+import sys
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import binstore
+from repository import format_movie_line, movie_hall
+from seatmask import SEAT_COUNT, Hall, format_mask
+
+MAX_REPORTED = 20   # 출력할 위배 행 수
+
+
+class ImportRejected(ValueError):
+    """묶음 또는 합친 결과가 규칙에 위배됨 — problems: 사람이 읽을 위배 내용"""
+
+    def __init__(self, problems: List[str]) -> None:
+        super().__init__(f"규칙에 위배되는 행이 {len(problems)}개 있습니다.")
+        self.problems = problems
+
+
+# ---------------------------------------------------------------
+# 묶음 읽기
+# ---------------------------------------------------------------
+def _csv_row_to_line(row: List[str], halls: Dict[str, Hall]) -> str | None:
+    """CSV 한 행 → 영화 데이터 파일 행 (열 개수가 맞지 않으면 None)"""
+    if not 4 <= len(row) <= 6:
+        return None
+    mid, title, dstr, tstr, *rest = row
+    hall_id = vec = None
+    if len(rest) == 2:
+        hall_id, vec = rest
+    elif rest and rest[0].startswith("["):
+        vec = rest[0]
+    elif rest:
+        hall_id = rest[0]
+    if vec is None:
+        vec = format_mask(0, halls[hall_id].count if hall_id in halls else SEAT_COUNT)
+    hall = f"/{hall_id}" if hall_id is not None else ""
+    return f"{mid}/{title}/{dstr}/{tstr}{hall}/{vec}"
+
+
+def read_batch_lines(path: Path, halls: Dict[str, Hall]) -> List[Tuple[int, str | None, str]]:
+    """묶음 파일 → [(행 번호, 영화 데이터 파일 행 또는 None(CSV 열 개수 오류), 원래 행 표시)]"""
+    if path.suffix.lower() != ".csv":
+        return [(no, line, line) for no, line in
+                enumerate(path.read_text(encoding="utf-8-sig").splitlines(), 1) if line.strip()]
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        rows = list(enumerate(csv.reader(f), 1))
+    if rows and rows[0][1] and not rows[0][1][0].strip().isdigit():
+        rows = rows[1:]   # 머리글
+    return [(no, _csv_row_to_line(row, halls), ",".join(row)) for no, row in rows if any(cell.strip() for cell in row)]
+
+
+def parse_batch(path: Path, halls: Dict[str, Hall], binary: bool) -> List[dict]:
+    """
+    묶음의 모든 행을 필드 규칙으로 검사해 고유번호순으로 정렬한 영화 레코드로 반환.
+    위배 행이 있으면 모두 모아 ImportRejected (행 사이 규칙은 합칠 때 검사)
+    """
+    from cinema import _parse_movie_record
+
+    movies: List[dict] = []
+    problems: List[str] = []
+    for no, line, shown in read_batch_lines(path, halls):
+        movie = _parse_movie_record(line, halls) if line is not None else None
+        if movie is None:
+            problems.append(f"{no}행: 형식/의미 규칙 위배 — {shown}")
+        elif movie["seats"]:
+            problems.append(f"{no}행: 새 상영에 예매된 좌석이 있습니다 — {shown}")
+        elif binary and "hall" in movie:
+            problems.append(f"{no}행: 이진 형식 영화 데이터 파일은 상영관 지정 상영을 지원하지 않습니다 — {shown}")
+        else:
+            movies.append(movie)
+    if problems:
+        raise ImportRejected(problems)
+    if not movies:
+        raise ImportRejected(["가져올 상영이 없습니다."])
+    movies.sort(key=itemgetter("id"))
+    return movies
+
+
+# ---------------------------------------------------------------
+# 합치기
+# ---------------------------------------------------------------
+def _existing_text(movie_path: Path, halls: Dict[str, Hall]) -> Iterator[Tuple[str, str, str]]:
+    """기존 텍스트 영화 데이터 파일 → (고유번호, 날짜, 원래 행) — 행마다 필드 규칙 검사"""
+    from cinema import _parse_movie_record
+
+    with open(movie_path, encoding="utf-8") as f:
+        for no, raw in enumerate(f, 1):
+            line = raw.rstrip("\n")
+            movie = _parse_movie_record(line, halls)
+            if movie is None:
+                raise ImportRejected([f"영화 데이터 파일 {no}행: 형식/의미 규칙 위배 — {line}"])
+            yield movie["id"], movie["date"], line
+
+
+def _existing_binary(movie_path: Path) -> Iterator[Tuple[str, str, dict]]:
+    from cinema import _read_movie_records
+
+    records = _read_movie_records(movie_path)
+    if records is None:
+        raise ImportRejected([f"영화 데이터 파일 {movie_path}이 규칙에 위배됩니다."])
+    for movie in records:
+        yield movie["id"], movie["date"], movie
+
+
+def merge_showings(existing: Iterable[Tuple[str, str, object]],
+                   batch: Iterable[Tuple[str, str, object]], counter: List[int]) -> Iterator[object]:
+    """
+    (고유번호, 날짜, 항목) 두 흐름(각각 고유번호 오름차순)을 고유번호순으로 합쳐 항목을 내보냄.
+    고유번호가 같거나(기존과 겹침/묶음 안 중복) 같은 날짜 상영이 10개 이상이 되면 ImportRejected.
+    counter[0]: 내보낸 항목 수
+    """
+    prev: str | None = None
+    daily: Dict[str, int] = {}
+    for mid, dstr, item in heapq.merge(existing, batch, key=itemgetter(0)):
+        if mid == prev:
+            raise ImportRejected([f"고유번호 중복: {mid}"])
+        prev = mid
+        daily[dstr] = n = daily.get(dstr, 0) + 1
+        if n >= 10:
+            raise ImportRejected([f"같은 날짜의 상영이 10개 이상이 됩니다: {dstr}"])
+        counter[0] += 1
+        yield item
+
+
+def _write_text_stream(movie_path: Path, lines: Iterable[str], dry_run: bool) -> None:
+    """행들을 임시 파일에 쓰고 끝까지 쓰면 교체 (write_movie_file과 같은 형식 — 마지막 행 뒤 줄바꿈 없음)"""
+    tmp_path = movie_path.with_name(movie_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            sep = ""
+            for line in lines:
+                f.write(sep + line)
+                sep = "\n"
+        if not dry_run:
+            os.replace(tmp_path, movie_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def import_batch(data_dir: Path, batch_path: Path, dry_run: bool = False) -> Tuple[int, int]:
+    """
+    묶음을 데이터 디렉터리의 영화 데이터 파일(텍스트 또는 이진)에 합쳐 원자적으로 다시 씀 (dry_run이면 검사만).
+    return: (가져온 상영 수, 합친 뒤 상영 수). 규칙 위배는 ImportRejected (파일은 그대로)
+    """
+    from cinema import HALL_FILE, MOVIE_FILE, load_and_validate_halls
+    from locking import FileLock, LOCK_FILE
+
+    binary = (data_dir / binstore.MOVIE_BIN_FILE).exists()
+    movie_path = data_dir / (binstore.MOVIE_BIN_FILE if binary else MOVIE_FILE)
+    if not movie_path.exists():
+        raise FileNotFoundError(f"데이터 파일이 없습니다: {movie_path}")
+    halls = load_and_validate_halls(data_dir / HALL_FILE)
+    movies = parse_batch(batch_path, halls, binary)
+
+    counter = [0]
+    with FileLock(data_dir / LOCK_FILE):
+        if binary:
+            merged = merge_showings(_existing_binary(movie_path), ((m["id"], m["date"], m) for m in movies), counter)
+            if dry_run:
+                for _ in merged:
+                    pass
+            else:
+                try:
+                    binstore.write_movies(movie_path, merged)
+                finally:
+                    movie_path.with_name(movie_path.name + ".tmp").unlink(missing_ok=True)
+        else:
+            batch = ((m["id"], m["date"], format_movie_line(m, movie_hall(m, halls).count)) for m in movies)
+            _write_text_stream(movie_path, merge_showings(_existing_text(movie_path, halls), batch, counter), dry_run)
+    return len(movies), counter[0]
+
+
+# ---------------------------------------------------------------
+# 명령행
+# ---------------------------------------------------------------
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="importer.py", description="KUCinema 상영표 일괄 가져오기")
+    parser.add_argument("batch", type=Path, help="새 상영 묶음 (.csv 또는 영화 데이터 파일 형식의 텍스트)")
+    parser.add_argument("--dry-run", action="store_true", help="검사만 하고 파일을 바꾸지 않음")
+    parser.add_argument("data_dir", nargs="?", type=Path, default=Path.cwd(), help="데이터 디렉터리 (기본: 현재 경로)")
+    args = parser.parse_args(argv)
+    from cinema import DATABASE_FILE
+
+    if (args.data_dir / DATABASE_FILE).exists():
+        print(f"!!! 오류: SQLite 저장소({DATABASE_FILE})는 일괄 가져오기를 지원하지 않습니다.")
+        return 1
+    try:
+        added, total = import_batch(args.data_dir, args.batch, args.dry_run)
+    except ImportRejected as e:
+        print(f"!!! 오류: {e}")
+        for problem in e.problems[:MAX_REPORTED]:
+            print(problem)
+        if len(e.problems) > MAX_REPORTED:
+            print(f"... 외 {len(e.problems) - MAX_REPORTED}개")
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"!!! 오류: {e}")
+        return 1
+    verb = "검사했습니다 (파일은 바꾸지 않음)" if args.dry_run else "가져왔습니다"
+    print(f"새 상영 {added}개를 {verb}. 상영표의 영화 레코드는 {total}개입니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
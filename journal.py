@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 좌석 변경 저널 — journal.py
+
+예매/취소 때마다 movie-schedule.txt 전체를 다시 쓰는 대신,
+좌석 변경분만 seat-journal.txt 끝에 한 줄씩 추가합니다(append-only).
+  • 레코드 형식 : <영화고유번호>/<+ 또는 ->/<좌석 벡터>
+      +  : 예매 — 좌석 유무 마스크 | 벡터
+      -  : 취소 — 좌석 유무 마스크 & ~벡터
+    좌석 벡터 길이는 상영의 상영관 좌석 수입니다.
+  • 읽기   : movie-schedule.txt(기준 상태) 위에 저널을 순서대로 재적용
+  • 체크포인트 : 저널을 movie-schedule.txt에 합쳐 쓰고 저널을 비움
+                 (프로그램 종료 시, 또는 저널 크기가 임계값을 넘을 때)
+
+같은 좌석에 대한 마지막 연산이 결과를 결정하므로, 체크포인트 도중 중단되어
+이미 반영된 저널이 다시 재적용되어도 결과는 같습니다.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from seatmask import SEAT_COUNT, parse_mask, format_mask
+
+JOURNAL_CHECKPOINT_BYTES = 64 * 1024   # 저널이 이 크기를 넘으면 체크포인트
+
+RE_JOURNAL_RECORD = re.compile(r"^(?P<mid>\d{12})/(?P<op>[+-])/(?P<vec>\[[^\]]*\])$")
+
+
+def apply_delta(mask: int, op: str, delta: int) -> int:
+    return mask | delta if op == "+" else mask & ~delta
+
+
+class SeatJournal:
+    """좌석 변경분을 추가 전용으로 기록하는 저널 파일"""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def append(self, movie_id: str, op: str, mask: int, seat_count: int = SEAT_COUNT) -> None:
+        """좌석 변경 한 건을 저널 끝에 추가 (O(1) 쓰기)"""
+        with self.path.open("a", encoding="utf-8", newline="\n") as f:
+            f.write(f"{movie_id}/{op}/{format_mask(mask, seat_count)}\n")
+
+    def size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def needs_checkpoint(self) -> bool:
+        return self.size() >= JOURNAL_CHECKPOINT_BYTES
+
+    def read_lines(self) -> List[str]:
+        try:
+            return self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+
+    def entries(self) -> Iterator[Tuple[str, str, int]]:
+        """(영화 고유번호, '+'/'-', 마스크)를 기록 순서대로 반환 (검증된 저널 전제)"""
+        for line in self.read_lines():
+            if not line:
+                continue
+            mid, op, vec = line.split("/", 2)
+            yield mid, op, parse_mask(vec, None)
+
+    def replay(self, masks: Dict[str, int]) -> None:
+        """저널을 좌석 유무 마스크 딕셔너리({영화 고유번호: 마스크})에 재적용"""
+        for mid, op, delta in self.entries():
+            if mid in masks:
+                masks[mid] = apply_delta(masks[mid], op, delta)
+
+    def clear(self) -> None:
+        if self.path.exists():
+            self.path.write_text("", encoding="utf-8", newline="\n")
+
+
+def find_invalid_journal_lines(journal: SeatJournal, seat_counts: Dict[str, int]) -> List[str]:
+    """저널의 형식 위배 행과 존재하지 않는 영화 고유번호를 참조하는 행을 반환
+
+    seat_counts: {영화 고유번호: 상영관 좌석 수} — 좌석 벡터 길이를 상영마다 검사
+    """
+    bads = []
+    for line in journal.read_lines():
+        m = RE_JOURNAL_RECORD.match(line)
+        count = seat_counts.get(m.group("mid")) if m else None
+        if count is None or parse_mask(m.group("vec"), count) is None:
+            bads.append(line)
+    return bads
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 데이터 파일 잠금 — locking.py
+
+같은 데이터 디렉터리를 여러 키오스크(프로세스)가 함께 쓸 때,
+읽기-수정-쓰기 구간을 fcntl.flock 배타 잠금으로 직렬화합니다.
+  • 잠금 파일 : 홈 경로의 .kucinema.lock (내용 없음)
+  • 재진입 가능 : 같은 프로세스 안에서 중첩된 with 블록은 바깥 잠금을 그대로 사용
+  • fcntl이 없는 환경(Windows 등)에서는 잠금 없이 동작 (단일 프로세스 전제)
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows 등
+    fcntl = None
+
+LOCK_FILE = ".kucinema.lock"
+
+
+class FileLock:
+    """flock 기반의 재진입 가능한 프로세스 간 배타 잠금"""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fh = None
+        self._depth = 0
+
+    def acquire(self) -> None:
+        if self._depth == 0 and fcntl is not None:
+            self._fh = open(self.path, "a")
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+        self._depth += 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._fh is not None:
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+            self._fh.close()
+            self._fh = None
+
+    @property
+    def held(self) -> bool:
+        return self._depth > 0
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
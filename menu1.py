@@ -1,14 +1,11 @@
 import re
-import ast
-from KUCinema import MOVIE_FILE,BOOKING_FILE,STUDENT_FILE, info, error, home_path,validate_all_booking_rules,load_and_validate_students,validate_movie_file,validate_booking_syntax,prune_zero_seat_bookings
+from cinema import info, error, check_after_mutation
 import core
-from collections import defaultdict
+import seatmask
+from paging import select_paged
+from repository import SeatConflictError, QuotaExceededError, MAX_SEATS_PER_SHOWING
 
 
-import sys
-import ast
-from collections import defaultdict
-
 # ---------------------------------------------------------------
 # 6.4.1 날짜 선택
 # ---------------------------------------------------------------
@@ -16,6 +13,7 @@ def select_date() -> str | None:
     """
     6.4.1 날짜 선택
     - 영화 데이터 파일에서 현재 날짜 이후의 상영 날짜를 제시하고 선택을 받음
+    - 날짜가 9개를 넘으면 페이지 단위로 출력 (n/p로 이동, 여러 자리 번호로 바로 선택 — paging.py)
     - 정상 입력 시 해당 날짜 문자열을 반환
     - '0' 입력 시 None 반환 (주 프롬프트 복귀)
     """
@@ -24,60 +22,24 @@ def select_date() -> str | None:
         error("내부 현재 날짜가 설정되어 있지 않습니다.")
         return None
 
-    # 1️. 영화 데이터 파일 읽기
-    movie_path = home_path() / MOVIE_FILE
-    lines = movie_path.read_text(encoding="utf-8").splitlines()
-
-    # 2️. 현재 날짜 이후 상영 날짜만 추출 (중복 제거)
-    dates = []
-    for line in lines:
-        if not line.strip():
-            continue
-        parts = line.split("/")
-        if len(parts) < 5:
-            continue
-        _, _, movie_date, _, _ = parts
-        if movie_date > core.CURRENT_DATE_STR and movie_date not in dates:
-            dates.append(movie_date)
+    # 1️. 공유 저장소의 날짜 색인에서 현재 날짜 다음 날부터의 상영 날짜 수를 셈 (이분 탐색)
+    today = core.CURRENT_DATE_STR
+    n = core.REPO.count_upcoming_dates(today)
 
-    # 3️. 날짜 정렬 및 최대 9개 제한
-    dates.sort()
-    dates = dates[:9]
-    n = len(dates)
-
-    # 4️. 출력 화면 구성
+    # 2️. 출력 화면 구성
     print("영화예매를 선택하셨습니다. 아래는 예매 가능한 날짜 리스트입니다.")
     if n == 0:
         info("상영이 예정된 영화가 없습니다.")
         return None
 
-    for i, d in enumerate(dates, start=1):
-        print(f"{i}) {d}")
-    print("0) 뒤로 가기")
-
-    # 5️. 입력 로직
-    while True:
-        s = input("원하는 날짜의 번호를 입력해주세요 : ").strip()
-
-        # --- 문법 형식 위배 ---
-        if not re.fullmatch(r"\d", s or "") or re.search(r"[A-Za-z]", s or ""):
-            print("올바르지 않은 입력입니다. 원하는 날짜의 번호만 입력하세요.")
-            continue
-
-        num = int(s)
-
-        # --- 의미 규칙 위배 ---
-        if not (0 <= num <= n):
-            print("범위 밖의 입력입니다. 다시 입력해주세요.")
-            continue
-
-        # --- 정상 입력 ---
-        if num == 0:
-            # 주 프롬프트로 복귀
-            return None
-        else:
-            selected_date = dates[num - 1]
-            return selected_date
+    # 3️. 페이지마다 날짜 색인의 해당 위치부터 필요한 만큼만 가져와 출력하고 선택을 받음 ('0'이면 주 프롬프트로 복귀)
+    return select_paged(
+        n,
+        lambda offset, limit: core.REPO.upcoming_dates(today, limit, offset),
+        str,
+        "원하는 날짜의 번호를 입력해주세요 : ",
+        "올바르지 않은 입력입니다. 원하는 날짜의 번호만 입력하세요.",
+    )
 
 # ---------------------------------------------------------------
 # 6.4.2 영화 선택
@@ -89,26 +51,8 @@ def select_movie(selected_date: str) -> dict | None:
     - 정상 선택 시 영화 딕셔너리 반환
     - '0' 입력 시 None 반환 (6.4.1로 되돌아감)
     """
-    movie_path = home_path() / MOVIE_FILE
-    lines = movie_path.read_text(encoding="utf-8").splitlines()
-
-    # 1️. 해당 날짜의 영화만 추출
-    movies = []
-    for line in lines:
-        if not line.strip():
-            continue
-        parts = line.split("/")
-        if len(parts) < 5:
-            continue
-        movie_id, title, date_str, time_str, seat_vec = parts
-        if date_str.strip() == selected_date:
-            movies.append({
-                "id": movie_id.strip(),
-                "title": title.strip(),
-                "date": date_str.strip(),
-                "time": time_str.strip(),
-                "seats": ast.literal_eval(seat_vec.strip())
-            })
+    # 1️. 해당 날짜의 영화만 추출 (레코드를 복사해 예매 흐름 중 원본이 바뀌지 않도록 함)
+    movies = [dict(movie) for movie in core.REPO.movies_on(selected_date)]
 
     # 2️. 시간순 정렬 (시작 시각 기준)
     def sort_key(m):  # "HH:MM-HH:MM"
@@ -158,6 +102,7 @@ def input_people(selected_movie: dict) -> int | None:
     """
     6.4.3 인원 수 입력
     - 선택된 영화에 대해 인원 수(최대 4명)를 입력받음
+    - 이미 같은 상영을 예매했다면 보유 좌석을 뺀 만큼만 입력 가능 (한 상영당 최대 4석)
     - 정상 입력 시 인원 수(int) 반환
     - '0' 입력 시 이전 단계(6.4.2 영화 선택)로 복귀 → None 반환
     """
@@ -165,9 +110,15 @@ def input_people(selected_movie: dict) -> int | None:
     movie_time = selected_movie["time"]
     movie_title = selected_movie["title"]
 
+    # 학생별 예매 인덱스에서 이 상영의 남은 예매 가능 좌석 수 확인 (O(1))
+    remaining = core.REPO.remaining_quota(core.LOGGED_IN_SID, selected_movie["id"])
+    if remaining == 0:
+        print(f"이미 해당 영화를 최대 인원({MAX_SEATS_PER_SHOWING}명)만큼 예매하셨습니다. 다른 영화를 선택해주세요.")
+        return None
+
     # 입력 루프
     while True:
-        s = input(f"{movie_date} {movie_time} | 〈{movie_title}〉를 선택하셨습니다. 인원 수를 입력해주세요 (최대 4명): ").strip()
+        s = input(f"{movie_date} {movie_time} | 〈{movie_title}〉를 선택하셨습니다. 인원 수를 입력해주세요 (최대 {remaining}명): ").strip()
 
         # --- 문법 형식 위배 ---
         if not re.fullmatch(r"\d", s or "") or re.search(r"[A-Za-z]", s):
@@ -177,7 +128,7 @@ def input_people(selected_movie: dict) -> int | None:
         n = int(s)
 
         # --- 의미 규칙 위배 ---
-        if not (0 <= n <= 4):
+        if not (0 <= n <= remaining):
             print("범위 밖의 입력입니다. 다시 입력해주세요.")
             continue
 
@@ -192,153 +143,157 @@ def input_people(selected_movie: dict) -> int | None:
 # 6.4.4 좌석 선택 단계
 # ---------------------------------------------------------------
 # ---------------------------------------------------------------
-# 기본 좌석 설정
-# ---------------------------------------------------------------
-ROWS = ["A", "B", "C", "D", "E"]
-COLS = [1, 2, 3, 4, 5]
-
-# ---------------------------------------------------------------
-# 좌석 벡터 → 버퍼 변환
+# 좌석 설정 (좌석 상태는 상영관(seatmask.Hall) 크기의 정수 마스크로 다룸)
 # ---------------------------------------------------------------
-def create_seat_buffer(seat_vector: list[int]) -> dict[str, int]:
-    """
-    영화의 좌석 유무 벡터(길이 25, 0/1)를 
-    {'A1':0, 'A2':1, ..., 'E5':1} 형태로 변환
-    """
-    seat_buffer = {}
-    idx = 0
-    for row in ROWS:
-        for col in COLS:
-            seat_id = f"{row}{col}"
-            seat_buffer[seat_id] = seat_vector[idx]
-            idx += 1
-    return seat_buffer
-
+RE_SEAT_NAME = re.compile(r"[A-Z][1-9]\d?")   # 행 A~Z, 열 1~99 — 상영관에 있는 좌석인지는 hall.index로 확인
 
 # ---------------------------------------------------------------
 # 좌석표 출력 함수
 # ---------------------------------------------------------------
-def print_seat_board(seat_buffer: dict[str, int]) -> None:
+def print_seat_board(taken_mask: int, chosen_mask: int = 0, hall: seatmask.Hall = seatmask.DEFAULT_HALL) -> None:
     """
-    좌석 버퍼를 기반으로 현재 좌석 상태를 콘솔에 시각화하여 출력
-    - '□' : 예매 가능 (0)
-    - '■' : 이미 예매됨 (1)
-    - '*' : 이번 예매에서 방금 선택한 좌석 (2)
+    좌석 마스크를 기반으로 현재 좌석 상태를 콘솔에 시각화하여 출력
+    - '□' : 예매 가능
+    - '■' : 이미 예매됨 (taken_mask)
+    - '■' : 이번 예매에서 방금 선택한 좌석 (chosen_mask)
+    - '×' : 막힌 좌석 (통로/기둥 등, 예매 불가)
+    열 번호가 두 자리인 상영관은 칸 너비를 두 글자로 맞춤
     """
+    width = len(str(hall.cols))
     print("빈 사각형은 예매 가능한 좌석입니다.")
     print("   스크린")
-    print("   ", " ".join(str(c) for c in COLS))
+    print("   ", " ".join(str(c).rjust(width) for c in range(1, hall.cols + 1)))
 
-    for row in ROWS:
+    occupied = taken_mask | chosen_mask
+    bit = 1
+    for row in seatmask.ROW_LABELS[:hall.rows]:
         line = [f"{row}"]
-        for col in COLS:
-            seat_id = f"{row}{col}"
-            val = seat_buffer[seat_id]
-            if val == 0:
-                line.append("□")  # 예매 가능
-            elif val == 1:
-                line.append("■")  # 이미 예매됨
-            elif val == 2:
-                #line.append("★")  # 현재 예매 중
-                line.append("■")  # 현재 예매 중
+        for _ in range(hall.cols):
+            mark = "×" if hall.blocked & bit else "■" if occupied & bit else "□"
+            line.append(mark.rjust(width))
+            bit <<= 1
         print(" ", " ".join(line))
 
 # ---------------------------------------------------------------
 # 파일 반영
 # ---------------------------------------------------------------
-def finalize_booking(selected_movie: dict, chosen_seats: list[str], student_id: str,
-                     movie_path, booking_path) -> None:
+def finalize_booking(selected_movie: dict, chosen_seats: list[str], student_id: str) -> None:
     movie_id = selected_movie["id"]
-    date = selected_movie["date"]
-    time = selected_movie["time"]
-
-    # 이번 예매의 좌석 벡터 만들기 (내가 선택한 좌석만 1)
-    new_booking_vector = [0] * 25
-    for seat in chosen_seats:
-        row_idx = ROWS.index(seat[0])
-        col_idx = int(seat[1]) - 1
-        new_booking_vector[row_idx * 5 + col_idx] = 1
-
-    # movie-schedule.txt 업데이트 (기존 1 유지 + 새 1 추가)
-    lines = movie_path.read_text(encoding="utf-8").splitlines()
-    updated_lines = []
-
-    for line in lines:
-        parts = line.strip().split("/")
-        if len(parts) < 5:
-            updated_lines.append(line)
-            continue
 
-        movie_id_in_file = parts[0].strip()
-        if movie_id_in_file == movie_id:
-            seats = ast.literal_eval(parts[-1])
-            for i in range(25):
-                # 기존이 1이면 그대로, 새로 선택된 좌석이면 1로 바꿈
-                seats[i] = 1 if (seats[i] == 1 or new_booking_vector[i] == 1) else 0
-            parts[-1] = "[" + ",".join(map(str, seats)) + "]"
-            updated_line = "/".join(parts)
-            updated_lines.append(updated_line)
-        else:
-            updated_lines.append(line)
+    # 이번 예매의 좌석 마스크 만들기 (내가 선택한 좌석만 1)
+    new_booking_mask = core.REPO.hall_of(movie_id).seats_to_mask(chosen_seats)
 
-    # 파일 덮어쓰기
-    movie_path.write_text("\n".join(updated_lines), encoding="utf-8")
+    # 저장소에 반영 (movie-schedule.txt 좌석 갱신 + booking-info.txt 레코드 추가)
+    booking = core.REPO.add_booking(student_id, movie_id, new_booking_mask)
 
-    # booking-info.txt에 새로운 예매 레코드 추가
-    with open(booking_path, "a+", encoding="utf-8") as f:
-        f.seek(0)
-        is_empty = (f.read().strip() == "")
-        booking_vec_str = ",".join(map(str, new_booking_vector))
+    # 변경된 레코드 무결성 검사 (--full-check 시 전체 검사)
+    check_after_mutation(movie_id, booking, added=True)
 
-        if is_empty:
-            f.write(f"{student_id}/{movie_id}/[{booking_vec_str}]")
-        else:
-            f.write(f"\n{student_id}/{movie_id}/[{booking_vec_str}]")
+def commit_seats(selected_movie: dict, chosen_seats: list[str]) -> bool:
+    """
+    선택한 좌석으로 예매를 확정하고 결과를 출력.
+    기록 시점에 좌석이 이미 예매되었거나 보유 좌석 한도를 넘으면 False (예매 처음부터 재시작)
+    """
+    try:
+        finalize_booking(
+            selected_movie=selected_movie,
+            chosen_seats=chosen_seats,
+            student_id=core.LOGGED_IN_SID,
+        )
+    except SeatConflictError as e:
+        # 좌석을 고르는 사이 다른 키오스크에서 먼저 예매됨 → 최신 좌석 현황으로 다시 예매
+        taken = ", ".join(core.REPO.hall_of(selected_movie["id"]).mask_to_seats(e.taken))
+        print(f"{taken} 좌석이 그사이 다른 사용자에 의해 예매되었습니다. 예매를 다시 진행해주세요.")
+        return False
+    except QuotaExceededError:
+        print(f"해당 영화는 한 학생이 최대 {MAX_SEATS_PER_SHOWING}석까지 예매할 수 있습니다. 예매를 다시 진행해주세요.")
+        return False
+
+    print(f"{', '.join(chosen_seats)} 자리 예매가 완료되었습니다. 주 프롬프트로 돌아갑니다.")
+    return True
+
+def propose_auto_seats(taken_mask: int, n: int, hall: seatmask.Hall = seatmask.DEFAULT_HALL) -> list[str] | None:
+    """
+    좌석 자동 배정 — 한 행 안의 가장 가운데에 가까운 n석 연속 묶음(없으면 가장 가깝게 나눈 좌석)을 제시하고 확인
+    - 막힌 좌석은 예매된 좌석처럼 피함
+    - Y 입력 시 배정된 좌석 이름 리스트 반환, Y 밖의 모든 입력은 N으로 간주해 None 반환 (직접 선택으로 돌아감)
+    """
+    auto_mask = hall.auto_assign(taken_mask, n)
+    if not auto_mask:
+        print("자동 배정할 수 있는 빈 좌석이 부족합니다.")
+        return None
+    seats = hall.mask_to_seats(auto_mask)
+    answer = input(f"자동 배정 좌석은 {', '.join(seats)}입니다. 이 좌석으로 예매하시겠습니까? (Y/N) : ")
+    return seats if answer == "Y" else None
 
 def input_seats(selected_movie: dict, n: int) -> bool:
     """
     6.4.4 좌석 입력
     - 입력받은 관람 인원(n)만큼 좌석을 한 명씩 입력받는다.
-    - 좌석 문법, 예매 가능 여부, 중복 선택 검사 수행
-    - 올바른 좌석 입력 시 버퍼에 반영하고 즉시 현황 재출력
-    - 모든 인원 좌석 선택 완료 시 예매 데이터 파일 기록 후 주 프롬프트로 복귀 (기록 아직)
+    - 첫 좌석 입력에서 '*'를 입력하면 n석을 자동 배정해 제시하고, 확인하면 바로 예매 (propose_auto_seats)
+    - 좌석 문법(상영관에 있는 좌석), 예매 가능 여부(막힌 좌석 포함), 중복 선택 검사 수행
+    - 올바른 좌석 입력 시 선택 마스크에 반영하고 즉시 현황 재출력
+    - 모든 인원 좌석 선택 완료 시 예매 데이터 파일 기록 후 주 프롬프트로 복귀
+    - 기록 시점에 선택한 좌석이 이미 예매되어 있으면(다른 키오스크) False 반환 → 예매 처음부터 재시작
     """
 
-    # 1️. 좌석 벡터 불러오기
-    seat_vector = selected_movie["seats"]
+    # 0. 한 상영당 최대 좌석 수 확인 (인원 수 입력 이후 다른 키오스크에서 예매했을 수 있음)
+    if n > core.REPO.remaining_quota(core.LOGGED_IN_SID, selected_movie["id"]):
+        print(f"해당 영화는 한 학생이 최대 {MAX_SEATS_PER_SHOWING}석까지 예매할 수 있습니다. 예매를 다시 진행해주세요.")
+        return False
 
-    # 2️. 버퍼 생성
-    seat_buffer = create_seat_buffer(seat_vector)
+    # 1️. 좌석 유무 마스크와 상영관 배치 불러오기
+    taken_mask = selected_movie["seats"]
+    hall = core.REPO.hall_of(selected_movie["id"])
 
-    # 3️. 초기 좌석 현황 출력
-    print_seat_board(seat_buffer)
+    # 2️. 초기 좌석 현황 출력
+    print_seat_board(taken_mask, hall=hall)
     print()
 
-    # 4️. 선택 현황 초기화
+    # 3️. 선택 현황 초기화
     chosen_seats = []
+    chosen_mask = 0
     k = 0  # 현재까지 선택된 인원 수
 
-    # 5️. 좌석 입력 루프
+    # 4️. 좌석 입력 루프
     while k < n:
-        s = input(f"{k + 1}번째로 예매할 좌석을 입력하세요. (예:A1): ").strip().upper()
+        hint = ", 자동 배정:*" if k == 0 else ""
+        s = input(f"{k + 1}번째로 예매할 좌석을 입력하세요. (예:A1{hint}): ").strip().upper()
+
+        # --- 자동 배정 (아직 좌석을 고르지 않았을 때만) ---
+        if s == "*" and k == 0:
+            auto_seats = propose_auto_seats(taken_mask, n, hall)
+            if auto_seats is not None:
+                return commit_seats(selected_movie, auto_seats)
+            print()
+            print_seat_board(taken_mask, hall=hall)
+            print()
+            continue
 
         # --- 문법 형식 위배 ---
-        if not re.fullmatch(r"[A-E][1-5]", s) or re.search(r"[가-힣]", s):
+        if not RE_SEAT_NAME.fullmatch(s) or s not in hall.index:
             print("올바르지 않은 입력입니다.")
             continue
 
+        bit = hall.seat_bit(s)
+
+        # --- 의미 규칙 위배 --- 0. 막힌 좌석 ---
+        if hall.blocked & bit:
+            print("예매할 수 없는 좌석입니다.")
+            continue
+
         # --- 의미 규칙 위배 --- 1. 이미 예매된 좌석 ---
-        if seat_buffer[s] == 1:
+        if taken_mask & bit:
             print("이미 예매된 좌석입니다.")
             continue
 
         # --- 의미 규칙 위배 --- 2. 동일 예매 흐름 내 중복 ---
-        if s in chosen_seats:
+        if chosen_mask & bit:
             print("동일 좌석 중복 선택은 불가능합니다.")
             continue
 
          # --- 정상 입력 ---
-        seat_buffer[s] = 2  # 선택한 좌석을 '예매 중'으로 표시
+        chosen_mask |= bit  # 선택한 좌석을 '예매 중'으로 표시
         chosen_seats.append(s)
         k += 1
 
@@ -346,30 +301,15 @@ def input_seats(selected_movie: dict, n: int) -> bool:
         if k < n:
             # 아직 모든 인원 좌석 미선택 - 좌석표 재출력
             print()
-            print_seat_board(seat_buffer)
+            print_seat_board(taken_mask, chosen_mask, hall)
             print()
             continue
         else:
             # 모든 인원 좌석 선택 완료
-            movie_path = home_path() / MOVIE_FILE
-            booking_path = home_path() / BOOKING_FILE
-            finalize_booking(
-                selected_movie=selected_movie,
-                chosen_seats=chosen_seats,
-                student_id=core.LOGGED_IN_SID,
-                movie_path=movie_path,
-                booking_path=booking_path,
-            )
-
-            print(f"{', '.join(chosen_seats)} 자리 예매가 완료되었습니다. 주 프롬프트로 돌아갑니다.")
-            return True
+            return commit_seats(selected_movie, chosen_seats)
 
 def menu1():
 
-    movie_path = home_path() / MOVIE_FILE
-    student_path = home_path() / STUDENT_FILE
-    booking_path = home_path() / BOOKING_FILE
-
     if core.LOGGED_IN_SID is None:
         error("로그인 정보가 없습니다. 주 프롬프트로 돌아갑니다.")
         return
@@ -405,18 +345,3 @@ def menu1():
     if not seat_input_success:
         # 예매 과정을 처음부터 시작
         return menu1()
-
-    # 0-1) 학생 파일 최소 무결성 검사
-    students = load_and_validate_students(student_path)
-    
-    # 0-2) 영화 데이터 파일 무결성(문법+의미) 검사 — 위배 발견 즉시 종료
-    validate_movie_file(movie_path)
-
-    # 0-3) 예매 데이터 파일 문법 검사 — 위배 행 전부 출력 후 종료
-    validate_booking_syntax(booking_path)
-
-    # 예매 데이터 파일 무결성 검사(의미 규칙)
-    validate_all_booking_rules()
-
-    prune_zero_seat_bookings(booking_path)
-
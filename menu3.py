@@ -1,57 +1,32 @@
-import os
-import re
-import ast
-import sys
-from datetime import datetime
-from KUCinema import MOVIE_FILE,BOOKING_FILE,STUDENT_FILE, info, error, home_path, validate_all_booking_rules,load_and_validate_students,validate_movie_file,validate_booking_syntax,prune_zero_seat_bookings
+from cinema import info, error, check_after_mutation
 import core
-from collections import defaultdict
+from paging import select_paged
 
-#HOME = os.path.expanduser("~")
-#BOOKING_FILE = os.path.join(HOME, "booking-info.txt")
-#MOVIE_FILE = os.path.join(HOME, "movie-schedule.txt")
 
-
-def load_records(path) -> None:
-    if not os.path.exists(path):
-        return []
-    with open(path, "r", encoding="utf-8") as f:
-        lines = [line.strip() for line in f if line.strip()]
-    return lines
-
-def parse_movie_record(line) -> None:
-    uid, title, date, time, seats = line.split("/", 4)
+# ---------------------------------------------------------------
+# 6.6.1 취소 대상 선택
+# ---------------------------------------------------------------
+def cancelable_entry(record: dict, movie: dict) -> dict:
+    """(예매, 영화) 레코드 → 취소 목록 항목"""
     return {
-        "uid": uid.strip(),
-        "title": title.strip(),
-        "date": date.strip(),
-        "time": time.strip(),
-        "seats": ast.literal_eval(seats.strip())
+        "movie_id" : record["movie_id"],
+        "seats" : record["seats"],
+        "title": movie["title"],
+        "date": movie["date"],
+        "time": movie["time"]
     }
 
-def parse_booking_record(line) -> None:
-    sid, uid, seats = line.split("/", 2)
-    return {
-        "sid": sid.strip(),
-        "uid": uid.strip(),
-        "seats": ast.literal_eval(seats.strip())
-    }
+def render_cancelable(d: dict) -> str:
+    # 좌석 마스크에서 1인 비트만 골라 좌석 이름으로 변환
+    booked = core.REPO.hall_of(d['movie_id']).mask_to_seats(d['seats'])
+    seat_str = " ".join(booked) if booked else "(예매된 좌석 없음)"
+    return f"{d['date']} {d['time']} | {d['title']} | {seat_str}"
 
-def save_records(path, records) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        for i, line in enumerate(records):
-            line = line.strip()
-            if i < len(records) - 1:
-                f.write(line + "\n")
-            else:
-                f.write(line)
-# ---------------------------------------------------------------
-# 6.6.1 취소 대상 선택
-# ---------------------------------------------------------------
 def select_cancelation(student_id) -> dict | None:
     """
     6.6.1 날짜 선택
     - 예매 데이터 파일에서 현재 로그인한 학번, 현재 날짜 이후의 예매 내역을 출력
+    - 예매 내역이 9개를 넘으면 페이지 단위로 출력 (n/p로 이동, 여러 자리 번호로 바로 선택 — paging.py)
     - 정상 입력 시 예매 정보를 반환
     - '0' 입력 시 None 반환 (주 프롬프트 복귀)
     """
@@ -60,81 +35,30 @@ def select_cancelation(student_id) -> dict | None:
         error("내부 현재 날짜가 설정되어 있지 않습니다.")
         return None
     
-    # 예매 데이터 파일, 영화 데이터 파일 읽기
-    booking_path = home_path() / BOOKING_FILE
-    movie_path = home_path() / MOVIE_FILE
-    booking_lines = booking_path.read_text(encoding="utf-8").splitlines()
-    movie_lines = movie_path.read_text(encoding="utf-8").splitlines()
-
-    #print(booking_lines[0:])
-    # 현재 로그인한 학번, 현재 날짜 이후의 예매 내역 추출
-    bookings = []
-    for line in booking_lines:
-        if not line.strip():
-            continue
-        parts = line.split("/", 2)
-        if len(parts) < 3:
-            continue
-        student_who_booked, movie_id, seat_vec = parts
-        movie_date = movie_id[0:4] + "-" + movie_id[4:6] + "-" + movie_id[6:8]
-        if student_id == student_who_booked and movie_date > core.CURRENT_DATE_STR:
-            for mline in movie_lines:
-                if movie_id in mline:
-                    bookings.append({
-                        "movie_id" : movie_id.strip(),
-                        "seats" : ast.literal_eval(seat_vec.strip()),
-                        "title": parse_movie_record(mline)["title"],
-                        "date": parse_movie_record(mline)["date"],
-                        "time": parse_movie_record(mline)["time"]
-                    })
-                    break
+    # 현재 로그인한 학번, 현재 날짜 이후의 예매 내역 수 (학생별 영화 고유번호순 색인을 이분 탐색)
+    today = core.CURRENT_DATE_STR
+    n = core.REPO.count_upcoming_bookings(student_id, today)
     
     # 예매 내역이 없으면 None 반환
-    if not bookings:
+    if n == 0:
         info(f"{student_id}님의 예매 내역이 존재하지 않습니다. 주 프롬프트로 돌아갑니다.")
         return None
     
-    # 예매 내역 출력 (최대 9개)
-    bookings.sort(key=lambda x: x["movie_id"])
-    bookings = bookings[:9]
-    n = len(bookings)
+    # 예매 내역 출력 (영화 고유번호순, 9개씩 페이지 단위 — 페이지마다 색인의 해당 위치부터 필요한 만큼만 조인)
     info(f"{student_id}님의 예매 내역입니다.")
 
-    # 출력 로직
-    seat_names = [f"{row}{col}" for row in "ABCDE" for col in range(1, 6)]
-    for i, d in enumerate(bookings, start=1):
-        # 좌석 벡터에서 1인 것만 골라 좌석 이름으로 변환
-        booked = [seat_names[idx] for idx, v in enumerate(d['seats']) if v == 1]
-        seat_str = " ".join(booked) if booked else "(예매된 좌석 없음)"
-    
-        print(f"{i}) {d['date']} {d['time']} | {d['title']} | {seat_str}")
-
-    print("0) 뒤로 가기")
-
-
-    # 입력 로직
-    while True:
-        s = input("예매를 취소할 내역을 선택해주세요. (번호로 입력) : ").strip()
+    def fetch(offset: int, limit: int) -> list[dict]:
+        return [cancelable_entry(record, movie)
+                for record, movie in core.REPO.upcoming_bookings(student_id, today, limit, offset)]
 
-        # --- 문법 형식 위배 ---
-        if not re.fullmatch(r"\d", s):
-            print("올바르지 않은 입력입니다. 취소할 내역의 번호만 입력하세요.")
-            continue
-
-        num = int(s)
-
-        # --- 의미 규칙 위배 ---
-        if not (0 <= num <= n):
-            print("범위 밖의 입력입니다. 다시 입력해주세요.")
-            continue
-
-        # --- 정상 입력 ---
-        if num == 0:
-            # 주 프롬프트로 복귀
-            return None
-        else:
-            # 선택한 예매 정보 반환
-            return bookings[num - 1]
+    # 입력 로직 ('0'이면 주 프롬프트로 복귀)
+    return select_paged(
+        n,
+        fetch,
+        render_cancelable,
+        "예매를 취소할 내역을 선택해주세요. (번호로 입력) : ",
+        "올바르지 않은 입력입니다. 취소할 내역의 번호만 입력하세요.",
+    )
 
 # ---------------------------------------------------------------
 # 6.6.2 취소 최종 확인
@@ -147,81 +71,33 @@ def confirm_cancelation(selected_booking: dict) -> None:
     - N 입력 시 6.6.1 재실행
     """
 
-    movie_path = home_path() / MOVIE_FILE
-    student_path = home_path() / STUDENT_FILE
-    booking_path = home_path() / BOOKING_FILE
-
-    seat_names = [f"{row}{col}" for row in "ABCDE" for col in range(1, 6)]
     seat_str = ""
-    seats = selected_booking.get('seats', [])
+    seats = selected_booking.get('seats', 0)
     if not seats:
         print("(예매된 좌석 없음)")
         return
 
-    booked = [seat_names[idx] for idx, v in enumerate(seats) if v == 1]
+    booked = core.REPO.hall_of(selected_booking['movie_id']).mask_to_seats(seats)
     seat_str = " ".join(booked) if booked else "(예매된 좌석 없음)"
 
     n = input(f"{selected_booking['date']} {selected_booking['time']} | {selected_booking['title']} | {seat_str}의 예매를 취소하겠습니까? (Y/N) : ")
 
     if n == 'Y':
-        # 예매 데이터 파일, 영화 데이터 파일 읽기
-        booking_path = home_path() / BOOKING_FILE
-        movie_path = home_path() / MOVIE_FILE
-        booking_lines = booking_path.read_text(encoding="utf-8").splitlines()
-        movie_lines = movie_path.read_text(encoding="utf-8").splitlines()
-
-        # 예매 데이터 파일에서 해당 예매 정보 삭제
-        new_booking_lines = []
-        for line in booking_lines:
-            if not line.strip():
-                continue
-            parts = line.split("/")
-            if len(parts) < 3:
-                continue
-            student_who_booked, movie_id, seat_vec = parts
-            if (student_who_booked == core.LOGGED_IN_SID and 
-                movie_id == selected_booking['movie_id'] and 
-                ast.literal_eval(seat_vec.strip()) == selected_booking['seats']):
-                continue  # 이 줄은 삭제
-            new_booking_lines.append(line)
-        
-        # 영화 데이터 파일에서 해당 좌석 벡터 복원
-        new_movie_lines = []
-        for line in movie_lines:
-            if not line.strip():
-                continue
-            parts = line.split("/", 4)
-            if len(parts) < 5:
-                continue
-            uid, title, date, time, seats = parts
-            if uid == selected_booking['movie_id']:
-                current_seats = ast.literal_eval(seats.strip())
-                restored_seats = [max(0, cs - ss) for cs, ss in zip(current_seats, selected_booking['seats'])]
-                seat_str = "[" + ",".join(map(str, restored_seats)) + "]"
-                new_line = f"{uid}/{title}/{date}/{time}/{seat_str}"
-                new_movie_lines.append(new_line)
-            else:
-                new_movie_lines.append(line)
-        
-        # 변경된 내용을 파일에 저장
-        save_records(booking_path, new_booking_lines)
-        save_records(movie_path, new_movie_lines)
+        # 저장소에서 해당 예매 레코드 삭제 + 영화 좌석 벡터 복원 (두 파일에 즉시 반영)
+        removed = core.REPO.cancel_booking(core.LOGGED_IN_SID, selected_booking['movie_id'], selected_booking['seats'])
 
-        info("예매가 취소되었습니다.")
+        if removed is None:
+            # 다른 키오스크에서 이미 취소된 예매
+            info("이미 취소된 예매입니다.")
+        else:
+            info("예매가 취소되었습니다.")
     else:
         menu3()
         return
-    # 0-1) 학생 파일 최소 무결성 검사
-    students = load_and_validate_students(student_path)
-    
-    # 0-2) 영화 데이터 파일 무결성(문법+의미) 검사 — 위배 발견 즉시 종료
-    validate_movie_file(movie_path)
 
-    # 0-3) 예매 데이터 파일 문법 검사 — 위배 행 전부 출력 후 종료
-    validate_booking_syntax(booking_path)
-
-    # 예매 데이터 파일 무결성 검사(의미 규칙)
-    validate_all_booking_rules()
+    # 변경된 레코드 무결성 검사 (--full-check 시 전체 검사)
+    if removed is not None:
+        check_after_mutation(selected_booking['movie_id'], removed, added=False)
 
     # 6.6.1 재실행
     menu3()
@@ -229,10 +105,6 @@ def confirm_cancelation(selected_booking: dict) -> None:
 
 def menu3():
 
-    movie_path = home_path() / MOVIE_FILE
-    student_path = home_path() / STUDENT_FILE
-    booking_path = home_path() / BOOKING_FILE
-
     if core.LOGGED_IN_SID is None:
         error("로그인 정보가 없습니다. 주 프롬프트로 돌아갑니다.")
         return
@@ -248,17 +120,3 @@ def menu3():
     # 6.6.2 취소 최종 확인
     # -------------------------------
     confirm_cancelation(selected_cancelation)
-
-    # 0-1) 학생 파일 최소 무결성 검사
-    students = load_and_validate_students(student_path)
-    
-    # 0-2) 영화 데이터 파일 무결성(문법+의미) 검사 — 위배 발견 즉시 종료
-    validate_movie_file(movie_path)
-
-    # 0-3) 예매 데이터 파일 문법 검사 — 위배 행 전부 출력 후 종료
-    validate_booking_syntax(booking_path)
-
-    # 예매 데이터 파일 무결성 검사(의미 규칙)
-    validate_all_booking_rules()
-
-    prune_zero_seat_bookings(booking_path)
\ No newline at end of file
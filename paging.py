@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 목록 페이지 넘김 — paging.py
+
+날짜/상영/취소할 예매처럼 번호로 고르는 목록을 한 페이지(PAGE_SIZE개)씩 보여 주고 선택을 받습니다.
+  • 번호는 목록 전체에서의 순번(1부터)이며 여러 자리 입력 가능 — 다른 페이지의 번호도 바로 선택
+  • n : 다음 페이지, p : 이전 페이지 (해당 페이지가 있을 때만 표시), 0 : 뒤로 가기
+  • 목록은 fetch(offset, limit)로 페이지마다 정렬된 색인에서 필요한 만큼만 가져옴
+    (저장소의 upcoming_dates / upcoming_bookings — 전체를 다시 읽거나 정렬하지 않음)
+항목이 PAGE_SIZE개 이하이면 화면은 페이지 넘김이 없던 때와 같습니다.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Callable, List, TypeVar
+
+T = TypeVar("T")
+
+PAGE_SIZE = 9
+NEXT_PAGE = "n"
+PREV_PAGE = "p"
+
+RE_CHOICE = re.compile(r"0|[1-9]\d*")   # 0 또는 앞자리가 0이 아닌 번호
+
+
+def select_paged(total: int, fetch: Callable[[int, int], List[T]], render: Callable[[T], str],
+                 prompt: str, syntax_error: str) -> T | None:
+    """
+    total개 항목 목록을 페이지 단위로 출력하고 선택한 항목을 반환. '0' 입력 시 None
+    - fetch(offset, limit): 목록의 offset번째부터 최대 limit개 항목
+    - render(item): 항목 한 줄 (번호 제외)
+    - syntax_error: 번호/n/p 밖의 입력에 대한 안내 문구
+    """
+    pages = (total + PAGE_SIZE - 1) // PAGE_SIZE
+    page = 0
+    show = True
+    while True:
+        offset = page * PAGE_SIZE
+        if show:
+            items = fetch(offset, PAGE_SIZE)
+            if pages > 1:
+                print(f"({page + 1}/{pages} 페이지)")
+            for i, item in enumerate(items, start=offset + 1):
+                print(f"{i}) {render(item)}")
+            if page + 1 < pages:
+                print(f"{NEXT_PAGE}) 다음 페이지")
+            if page > 0:
+                print(f"{PREV_PAGE}) 이전 페이지")
+            print("0) 뒤로 가기")
+            show = False
+
+        s = input(prompt).strip()
+
+        # --- 페이지 이동 ---
+        move = s.lower()
+        if move == NEXT_PAGE and page + 1 < pages or move == PREV_PAGE and page > 0:
+            page += 1 if move == NEXT_PAGE else -1
+            show = True
+            continue
+
+        # --- 문법 형식 위배 ---
+        if not RE_CHOICE.fullmatch(s):
+            print(syntax_error)
+            continue
+
+        num = int(s)
+
+        # --- 의미 규칙 위배 ---
+        if num > total:
+            print("범위 밖의 입력입니다. 다시 입력해주세요.")
+            continue
+
+        # --- 정상 입력 ---
+        if num == 0:
+            return None
+        if offset < num <= offset + len(items):
+            return items[num - 1 - offset]
+        found = fetch(num - 1, 1)   # 다른 페이지의 번호 — 그 위치만 가져옴
+        if not found:
+            print("범위 밖의 입력입니다. 다시 입력해주세요.")
+            continue
+        return found[0]
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 구간 계측 — profiling.py  (python KUCinema.py --profile [--profile-dump DIR])
+
+--profile을 주면 이름 붙은 구간(phase)마다 다음을 모아 종료 시 요약 표로 출력합니다.
+  • 시간     : 구간의 벽시계 시간 — 구간 안에서 input()을 기다린 시간은 빼므로 사람의 입력 속도와 무관
+  • 파일 I/O : 읽은/쓴 바이트 수(텍스트는 인코딩한 바이트 기준)와 파일 열기 횟수
+  • 상호작용 : 입력 한 행을 받은 뒤 다음 프롬프트가 나올 때까지의 지연 시간 (그 입력을 받은 구간 이름으로 집계)
+구간은 중첩될 수 있으며, 바깥 구간의 값은 안쪽 구간을 포함합니다. 스레드(서버 세션)마다 따로 추적합니다.
+--profile-dump DIR을 주면 메뉴를 실행할 때마다 cProfile 결과를 DIR/<메뉴>-<순번>.prof로 저장합니다.
+
+계측을 켜지 않으면 phase()는 아무 일도 하지 않는 공용 객체를 돌려주고 open/input도 바꾸지 않으므로 추가 비용은 함수 호출 한 번입니다.
+병렬 검사(--jobs)의 작업 프로세스 안에서 일어난 파일 I/O는 집계되지 않습니다.
+cProfile/statistics는 결과를 저장하거나 요약할 때 가져오므로 계측을 끈 시작 경로에는 포함되지 않습니다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import builtins
+import io
+import marshal
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, List
+
+ENABLED = False
+_DUMP_DIR: Path | None = None
+_NULL = nullcontext()
+
+_lock = threading.Lock()
+_local = threading.local()
+_stats: Dict[str, "_Totals"] = {}          # 구간 이름 → 누적
+_interactions: Dict[str, List[float]] = {}  # 구간 이름 → 입력→다음 프롬프트 지연 시간(초)
+_overall: "_Totals | None" = None           # 구간과 무관한 전체 파일 I/O
+_dump_seq = 0
+_started = 0.0
+_real_open = io.open                         # cProfile 결과 저장은 집계하지 않음
+
+
+class _Totals:
+    __slots__ = ("calls", "seconds", "max_seconds", "read", "written", "opens")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.read = 0
+        self.written = 0
+        self.opens = 0
+
+
+class _Frame:
+    """진행 중인 구간 하나 (스레드별 스택에 쌓임)"""
+    __slots__ = ("name", "start", "waited", "read", "written", "opens", "profiler")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = time.perf_counter()
+        self.waited = 0.0
+        self.read = 0
+        self.written = 0
+        self.opens = 0
+        self.profiler: cProfile.Profile | None = None
+
+
+def _stack() -> List[_Frame]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+# ---------------------------------------------------------------
+# 파일 I/O 집계 — open()이 돌려준 파일 객체를 감싸 읽기/쓰기 바이트 수를 셈
+# ---------------------------------------------------------------
+def _count(read: int = 0, written: int = 0, opens: int = 0) -> None:
+    for frame in _stack():
+        frame.read += read
+        frame.written += written
+        frame.opens += opens
+    with _lock:
+        _overall.read += read
+        _overall.written += written
+        _overall.opens += opens
+
+
+class _CountingFile:
+    """파일 객체 프록시 — read*/write*/순회만 가로채 바이트 수를 세고 나머지는 그대로 전달"""
+
+    def __init__(self, f) -> None:
+        self._f = f
+        self._encoding = getattr(f, "encoding", None)  # 텍스트 모드면 인코딩 이름
+
+    def _size(self, data) -> int:
+        if self._encoding is not None and isinstance(data, str):
+            return len(data.encode(self._encoding, "replace"))
+        return len(data)
+
+    def read(self, *args):
+        data = self._f.read(*args)
+        _count(read=self._size(data))
+        return data
+
+    def readline(self, *args):
+        data = self._f.readline(*args)
+        _count(read=self._size(data))
+        return data
+
+    def readlines(self, *args):
+        lines = self._f.readlines(*args)
+        _count(read=sum(self._size(line) for line in lines))
+        return lines
+
+    def __iter__(self):
+        for line in self._f:
+            _count(read=self._size(line))
+            yield line
+
+    def write(self, data):
+        n = self._f.write(data)
+        _count(written=self._size(data))
+        return n
+
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.write(line)
+
+    def __enter__(self):
+        self._f.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._f.__exit__(*exc)
+
+    def __getattr__(self, name: str):
+        return getattr(self._f, name)
+
+
+def _wrap_open(real_open):
+    def counting_open(*args, **kwargs):
+        f = real_open(*args, **kwargs)
+        _count(opens=1)
+        return _CountingFile(f)
+    return counting_open
+
+
+# ---------------------------------------------------------------
+# 입력 대기 — 구간 시간에서 빼고, 상호작용 지연 시간을 기록
+# ---------------------------------------------------------------
+class _Waiting:
+    """input()을 기다리는 동안을 감싸는 컨텍스트 (서버 세션의 입력 경로도 사용)"""
+
+    def __enter__(self) -> None:
+        now = time.perf_counter()
+        self._t0 = now
+        resumed = getattr(_local, "resumed", None)
+        if resumed is not None:
+            started, name = resumed
+            with _lock:
+                _interactions.setdefault(name, []).append(now - started)
+
+    def __exit__(self, *exc) -> None:
+        now = time.perf_counter()
+        waited = now - self._t0
+        stack = _stack()
+        for frame in stack:
+            frame.waited += waited
+        _local.resumed = (now, stack[-1].name if stack else "prompt")
+
+
+def waiting():
+    """input() 대기 구간. 계측이 꺼져 있으면 아무 일도 하지 않음"""
+    return _Waiting() if ENABLED else _NULL
+
+
+def _wrap_input(real_input):
+    def timed_input(prompt: object = "") -> str:
+        with _Waiting():
+            return real_input(prompt)
+    return timed_input
+
+
+# ---------------------------------------------------------------
+# 구간
+# ---------------------------------------------------------------
+class _Phase:
+    def __init__(self, name: str, dump: bool) -> None:
+        self.name = name
+        self.dump = dump
+
+    def __enter__(self) -> None:
+        frame = _Frame(self.name)
+        _stack().append(frame)
+        if self.dump and _DUMP_DIR is not None:
+            import cProfile   # --profile-dump일 때만 (계측을 끈 시작 경로에서는 가져오지 않음)
+            frame.profiler = cProfile.Profile()
+            frame.profiler.enable()
+
+    def __exit__(self, *exc) -> None:
+        global _dump_seq
+        frame = _stack().pop()
+        elapsed = time.perf_counter() - frame.start - frame.waited
+        if frame.profiler is not None:
+            frame.profiler.disable()
+        with _lock:
+            totals = _stats.get(frame.name)
+            if totals is None:
+                totals = _stats[frame.name] = _Totals()
+            totals.calls += 1
+            totals.seconds += elapsed
+            totals.max_seconds = max(totals.max_seconds, elapsed)
+            totals.read += frame.read
+            totals.written += frame.written
+            totals.opens += frame.opens
+            if frame.profiler is not None:
+                _dump_seq += 1
+                seq = _dump_seq
+        if frame.profiler is not None:
+            # Profile.dump_stats와 같은 형식 (pstats로 읽음)
+            frame.profiler.create_stats()
+            with _real_open(_DUMP_DIR / f"{frame.name.replace(':', '_')}-{seq:04d}.prof", "wb") as f:
+                marshal.dump(frame.profiler.stats, f)
+
+
+def phase(name: str, dump: bool = False):
+    """
+    이름 붙은 계측 구간 (with profiling.phase("menu1"): ...).
+    dump=True이고 --profile-dump가 지정되었으면 구간 전체를 cProfile로 기록해 파일로 저장.
+    """
+    return _Phase(name, dump) if ENABLED else _NULL
+
+
+def enable(dump_dir: Path | None = None) -> None:
+    """계측 시작: open/input을 감싸고 종료 시 요약 표를 출력하도록 등록"""
+    global ENABLED, _DUMP_DIR, _overall, _started
+    if ENABLED:
+        return
+    if dump_dir is not None:
+        dump_dir.mkdir(parents=True, exist_ok=True)
+    ENABLED = True
+    _DUMP_DIR = dump_dir
+    _overall = _Totals()
+    _started = time.perf_counter()
+    io.open = _wrap_open(io.open)
+    builtins.open = _wrap_open(builtins.open)
+    builtins.input = _wrap_input(builtins.input)
+    atexit.register(print_report)
+
+
+# ---------------------------------------------------------------
+# 요약 표
+# ---------------------------------------------------------------
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.3f}"
+
+
+def print_report() -> None:
+    if not ENABLED:
+        return
+    with _lock:
+        stats = sorted(_stats.items(), key=lambda item: -item[1].seconds)
+        interactions = {name: sorted(samples) for name, samples in _interactions.items()}
+        overall = _overall
+
+    print()
+    print(f"===== 프로파일 요약 (--profile, 경과 {_ms(time.perf_counter() - _started)}ms, 구간 시간은 입력 대기 제외) =====")
+    # 한글 머리글은 화면에서 두 칸을 차지하므로 그만큼 폭을 줄여 숫자 열과 맞춤
+    print(f"{'구간':<30}| {'횟수':>4} | {'합계(ms)':>8} | {'평균(ms)':>8} | {'최대(ms)':>8} | "
+          f"{'읽기(B)':>9} | {'쓰기(B)':>9} | {'열기':>4}")
+    for name, t in stats:
+        print(f"{name:<32}| {t.calls:>6} | {_ms(t.seconds):>10} | {_ms(t.seconds / t.calls):>10} | "
+              f"{_ms(t.max_seconds):>10} | {t.read:>11} | {t.written:>11} | {t.opens:>6}")
+    print(f"{'(전체 파일 I/O)':<28}| {'':>6} | {'':>10} | {'':>10} | {'':>10} | "
+          f"{overall.read:>11} | {overall.written:>11} | {overall.opens:>6}")
+
+    if interactions:
+        import statistics
+        print()
+        print("상호작용 지연 시간 (입력 한 행 → 다음 프롬프트, 입력을 받은 구간 기준)")
+        print(f"{'구간':<30}| {'횟수':>4} | {'중앙(ms)':>8} | {'p95(ms)':>10} | {'최대(ms)':>8}")
+        for name, samples in sorted(interactions.items()):
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            print(f"{name:<32}| {len(samples):>6} | {_ms(statistics.median(samples)):>10} | "
+                  f"{_ms(p95):>10} | {_ms(samples[-1]):>10}")
+    if _DUMP_DIR is not None:
+        print(f"cProfile 결과: {_DUMP_DIR}")
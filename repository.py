@@ -0,0 +1,714 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 공유 데이터 저장소 — repository.py
+
+프로그램 시작 시(main) 세 데이터 파일을 한 번만 읽어 파싱한 뒤,
+메뉴 1~4가 모두 같은 메모리 상의 레코드를 사용하도록 합니다.
+  • 영화 레코드   : {"id", "title", "date", "time", "seats"} (+ 기본 상영관이 아니면 "hall": 상영관번호)
+  • 학생 레코드   : {학번: 비밀번호}
+  • 예매 레코드   : {"sid", "movie_id", "seats"}
+  • 상영관        : {상영관번호: seatmask.Hall} — 상영관 데이터 파일(hall-info.txt, 영화 데이터 파일과 같은 경로)
+좌석("seats")은 모두 seatmask 모듈의 정수 마스크이며, 파일의 좌석 벡터 길이는 상영의 상영관 좌석 수입니다.
+영화 레코드 행은 기본 상영관이면 <고유번호>/<제목>/<날짜>/<시간>/<좌석벡터>,
+그 밖의 상영관이면 <고유번호>/<제목>/<날짜>/<시간>/<상영관번호>/<좌석벡터>입니다.
+
+변경(회원가입/예매/취소)은 메모리에 반영함과 동시에 파일에도 즉시 기록합니다(write-through).
+영화 좌석 변경은 movie-schedule.txt를 다시 쓰지 않고 좌석 변경 저널(journal.py)에 추가하며,
+checkpoint()가 저널을 movie-schedule.txt에 합칩니다.
+영화/예매 데이터 파일이 이진 형식(.bin, binstore.py)이면 같은 레코드를 이진 파일로 읽고 씁니다 (확장자로 구분).
+
+예매 취소는 예매 데이터 파일을 다시 쓰지 않고 취소 표시(tombstone) 레코드 "-<학번>/<영화고유번호>/<좌석벡터>"를
+파일 끝에 추가합니다. 읽을 때 취소 표시는 앞선 같은 예매 레코드 하나를 지우는 것으로 해석하며,
+죽은 레코드(취소 표시와 그 대상, 좌석이 모두 0인 레코드)의 비율이 임계값을 넘으면 compact()가 파일을 다시 씁니다.
+
+지난 달 상영은 archive.py가 보관 파티션에 기록한 뒤 detach_movies()로 데이터 파일에서 빼며, 되돌릴 때는 attach_movies().
+
+여러 프로세스(키오스크)가 같은 데이터 디렉터리를 쓰는 경우를 위해, 모든 변경은
+transaction() 안에서 수행됩니다: 파일 잠금(locking.py)을 잡고, 마지막으로 읽은 뒤
+다른 프로세스가 파일을 바꿨으면 다시 읽은 다음, 현재 상태를 기준으로 변경을 확정합니다.
+무결성 검사는 cinema.py의 검증 함수가 담당하며, 이 모듈은 검증을 통과한 파일만 읽는다고 가정합니다.
+"""
+
+from __future__ import annotations
+
+import os
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import binstore
+import profiling
+from journal import SeatJournal
+from locking import FileLock, LOCK_FILE
+from seatmask import DEFAULT_HALL, HALL_FILE, SEAT_COUNT, Hall, format_mask, parse_mask, read_hall_file
+
+
+# ---------------------------------------------------------------
+# 레코드 파싱/직렬화
+# ---------------------------------------------------------------
+TOMBSTONE_MARK = "-"   # 예매 데이터 파일의 취소 표시 레코드 머리 (이진 형식은 레코드의 취소 표시 바이트)
+
+def parse_movie_line(line: str) -> dict:
+    parts = line.split("/")
+    mid, title, date_str, time_str, vec = parts[0], parts[1], parts[2], parts[3], parts[-1]
+    movie = {
+        "id": mid.strip(),
+        "title": title.strip(),
+        "date": date_str.strip(),
+        "time": time_str.strip(),
+        "seats": parse_mask(vec.strip(), None),
+    }
+    if len(parts) == 6:
+        movie["hall"] = parts[4]
+    return movie
+
+
+def format_movie_line(movie: dict, seat_count: int = SEAT_COUNT) -> str:
+    """영화 레코드 → 한 행 (seat_count: 상영의 상영관 좌석 수)"""
+    hall = f"{movie['hall']}/" if "hall" in movie else ""
+    return f"{movie['id']}/{movie['title']}/{movie['date']}/{movie['time']}/{hall}{format_mask(movie['seats'], seat_count)}"
+
+
+def movie_hall(movie: dict, halls: Dict[str, Hall]) -> Hall:
+    """영화 레코드가 가리키는 상영관 (지정하지 않았으면 기본 상영관)"""
+    hall_id = movie.get("hall")
+    return DEFAULT_HALL if hall_id is None else halls[hall_id]
+
+
+def parse_booking_line(line: str) -> dict:
+    """예매 레코드 한 행 → 예매 레코드. 취소 표시 행이면 "tombstone": True가 붙음"""
+    tombstone = line.startswith(TOMBSTONE_MARK)
+    sid, mid, vec = (line[1:] if tombstone else line).split("/", 2)
+    booking = {"sid": sid.strip(), "movie_id": mid.strip(), "seats": parse_mask(vec.strip(), None)}
+    if tombstone:
+        booking["tombstone"] = True
+    return booking
+
+
+def format_booking_line(booking: dict, seat_count: int = SEAT_COUNT) -> str:
+    """예매 레코드 → 한 행 (seat_count: 예매한 상영의 상영관 좌석 수)"""
+    mark = TOMBSTONE_MARK if booking.get("tombstone") else ""
+    return f"{mark}{booking['sid']}/{booking['movie_id']}/{format_mask(booking['seats'], seat_count)}"
+
+
+def tombstone_of(booking: dict) -> dict:
+    """예매 레코드를 취소하는 취소 표시 레코드"""
+    return {"sid": booking["sid"], "movie_id": booking["movie_id"], "seats": booking["seats"], "tombstone": True}
+
+
+def resolve_tombstones(records: List[dict]) -> Tuple[List[int], List[dict]]:
+    """
+    취소 표시를 앞선 같은(학번, 영화 고유번호, 좌석) 예매 레코드에 적용.
+    살아 있는 예매끼리는 좌석이 겹치지 않으므로 취소 표시 하나가 가리키는 레코드는 많아야 하나.
+    return: (살아 있는 예매 레코드의 위치 — 파일 순서, 좌석이 모두 0인 레코드 제외, 가리키는 레코드가 없는 취소 표시)
+    """
+    live: Dict[Tuple[str, str, int], int] = {}
+    cancelled = set()
+    orphans: List[dict] = []
+    for i, b in enumerate(records):
+        key = (b["sid"], b["movie_id"], b["seats"])
+        if "tombstone" in b:
+            target = live.pop(key, None)
+            if target is None:
+                orphans.append(b)
+            else:
+                cancelled.add(target)
+        elif b["seats"]:
+            live[key] = i
+    alive = [i for i, b in enumerate(records) if b["seats"] and "tombstone" not in b and i not in cancelled]
+    return alive, orphans
+
+
+def append_record(path: Path, line: str) -> None:
+    """레코드 한 행을 파일 끝에 추가. 파일이 비어 있지 않고 줄바꿈으로 끝나지 않을 때만 앞에 줄바꿈을 붙임 (빈 행 방지)"""
+    with path.open("a+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        sep = b""
+        if size > 0:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                sep = b"\n"
+        f.write(sep + line.encode("utf-8"))
+
+
+def write_movie_file(movie_path: Path, movies, halls: Dict[str, Hall] | None = None) -> None:
+    """영화 레코드들로 movie-schedule.txt(.bin)를 원자적으로 다시 씀 (임시 파일 작성 후 교체)"""
+    if binstore.is_binary(movie_path):
+        binstore.write_movies(movie_path, movies)
+        return
+    lines = [format_movie_line(m, movie_hall(m, halls or {}).count) for m in movies]
+    tmp_path = movie_path.with_name(movie_path.name + ".tmp")
+    tmp_path.write_text("\n".join(lines), encoding="utf-8", newline="\n")
+    os.replace(tmp_path, movie_path)
+
+
+def read_movie_file(movie_path: Path) -> Dict[str, dict]:
+    """영화 데이터 파일 → {고유번호: 영화 레코드} (파일 순서)"""
+    if binstore.is_binary(movie_path):
+        return {m["id"]: m for m in binstore.read_movies(movie_path)}
+    movies = {}
+    for line in movie_path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        movie = parse_movie_line(line)
+        movies[movie["id"]] = movie
+    return movies
+
+
+def read_booking_records(booking_path: Path) -> List[dict]:
+    """예매 데이터 파일 → 취소 표시를 포함한 모든 레코드 리스트 (파일 순서)"""
+    if binstore.is_binary(booking_path):
+        return binstore.read_bookings(booking_path)
+    return [
+        parse_booking_line(line)
+        for line in booking_path.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+
+
+def count_booking_records(booking_path: Path) -> int:
+    """예매 데이터 파일의 레코드 수 (취소 표시 포함, 검사를 통과한 파일 전제 — 빈 행 없음)"""
+    if binstore.is_binary(booking_path):
+        return binstore.count_bookings(booking_path)
+    data = booking_path.read_bytes()
+    return data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+
+
+def append_booking_records(booking_path: Path, bookings: List[dict], seat_count: int = SEAT_COUNT) -> None:
+    """예매 레코드들을 한 번의 쓰기로 예매 데이터 파일 끝에 추가 (seat_count: 같은 상영관 좌석 수)"""
+    if binstore.is_binary(booking_path):
+        binstore.append_bookings(booking_path, bookings)
+    else:
+        append_record(booking_path, "\n".join(format_booking_line(b, seat_count) for b in bookings))
+
+
+def write_booking_file(booking_path: Path, bookings, seat_counts: Dict[str, int] | None = None) -> None:
+    """
+    예매 레코드들로 예매 데이터 파일을 원자적으로 다시 씀 (임시 파일 작성 후 교체).
+    seat_counts: {영화 고유번호: 상영관 좌석 수} — 없는 고유번호는 기본 상영관 길이로 씀
+    """
+    if binstore.is_binary(booking_path):
+        binstore.write_bookings(booking_path, bookings)
+        return
+    counts = seat_counts or {}
+    lines = [format_booking_line(b, counts.get(b["movie_id"], SEAT_COUNT)) for b in bookings]
+    tmp_path = booking_path.with_name(booking_path.name + ".tmp")
+    tmp_path.write_text("\n".join(lines), encoding="utf-8", newline="\n")
+    os.replace(tmp_path, booking_path)
+
+
+def compact_booking_file(booking_path: Path) -> List[dict]:
+    """
+    예매 데이터 파일 압축: 취소 표시와 그 대상, 좌석이 모두 0인 레코드를 지우고
+    같은 학생의 같은 상영 예매 여러 건을 첫 레코드 자리에 하나로 합쳐(좌석 OR) 원자적으로 다시 씀.
+    텍스트 파일은 합치지 않은 레코드의 원래 행을 그대로 둠. 다른 키오스크가 들고 있던 합치기 전 레코드는
+    cancel_booking이 합친 레코드의 좌석 일부로 취소함.
+    return: 압축 후 예매 레코드 리스트 (파일 순서)
+    """
+    binary = binstore.is_binary(booking_path)
+    if binary:
+        lines = None
+        records = binstore.read_bookings(booking_path)
+    else:
+        lines = [line for line in booking_path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        records = [parse_booking_line(line) for line in lines]
+
+    kept: List[int] = []
+    seats: List[int] = []
+    merged: Dict[Tuple[str, str], int] = {}   # (학번, 영화 고유번호) → kept 안의 위치
+    for i in resolve_tombstones(records)[0]:
+        b = records[i]
+        key = (b["sid"], b["movie_id"])
+        at = merged.get(key)
+        if at is None:
+            merged[key] = len(kept)
+            kept.append(i)
+            seats.append(b["seats"])
+        else:
+            seats[at] |= b["seats"]
+
+    bookings = []
+    for i, mask in zip(kept, seats):
+        b = records[i]
+        if mask != b["seats"]:
+            b = {"sid": b["sid"], "movie_id": b["movie_id"], "seats": mask}
+            if lines is not None:
+                # 좌석 벡터 길이(상영관 좌석 수)는 원래 행을 따름
+                lines[i] = format_booking_line(b, lines[i].rsplit("/", 1)[1].count(",") + 1)
+        bookings.append(b)
+
+    if binary:
+        binstore.write_bookings(booking_path, bookings)
+    else:
+        tmp_path = booking_path.with_name(booking_path.name + ".tmp")
+        tmp_path.write_text("".join(lines[i] + "\n" for i in kept), encoding="utf-8", newline="\n")
+        os.replace(tmp_path, booking_path)
+    return bookings
+
+
+# ---------------------------------------------------------------
+# 저장소
+# ---------------------------------------------------------------
+MAX_SEATS_PER_SHOWING = 4   # 한 학생이 한 상영에서 보유할 수 있는 최대 좌석 수
+COMPACT_MIN_DEAD = 64       # 죽은 레코드가 이 수 이상이고
+COMPACT_DEAD_RATIO = 0.25   # 예매 데이터 파일 레코드 중 이 비율 이상이면 압축
+
+
+class SeatConflictError(Exception):
+    """예매 확정 시점에 선택한 좌석 중 일부가 이미 다른 세션에서 예매된 경우"""
+
+    def __init__(self, movie_id: str, taken: int) -> None:
+        super().__init__(f"{movie_id}: 이미 예매된 좌석이 포함되어 있습니다.")
+        self.movie_id = movie_id
+        self.taken = taken  # 충돌한 좌석 마스크
+
+
+class QuotaExceededError(Exception):
+    """예매 확정 시점에 학생의 해당 상영 보유 좌석이 최대 좌석 수를 넘게 되는 경우"""
+
+    def __init__(self, student_id: str, movie_id: str, remaining: int) -> None:
+        super().__init__(f"{student_id}/{movie_id}: 추가로 예매 가능한 좌석은 {remaining}석입니다.")
+        self.remaining = remaining
+
+
+class CinemaRepository:
+    """세 데이터 파일의 파싱 결과를 보관하고 변경 사항을 파일에 반영하는 저장소"""
+
+    backend = "files"   # SQLite 저장소(sqlstore.SqliteRepository)는 "sqlite"
+
+    def __init__(self, movie_path: Path, student_path: Path, booking_path: Path, journal_path: Path,
+                 lock: FileLock | None = None) -> None:
+        self.movie_path = movie_path
+        self.student_path = student_path
+        self.booking_path = booking_path
+        self.journal = SeatJournal(journal_path)
+        self.hall_path = movie_path.with_name(HALL_FILE)
+        self.lock = lock if lock is not None else FileLock(movie_path.with_name(LOCK_FILE))
+        self._stamps: Tuple = ()   # 마지막으로 읽거나 쓴 시점의 파일 상태 (다른 프로세스 변경 감지용)
+        self.validated = False     # 메모리 상태가 무결성 검사를 통과한 상태인지 (검사 없이 다시 읽으면 False)
+
+        self.halls: Dict[str, Hall] = {}       # 상영관번호 → 상영관 (기본 상영관 제외)
+        self.movies: Dict[str, dict] = {}      # 영화 고유번호 → 영화 레코드 (파일 순서 = 오름차순)
+        self._date_index: List[Tuple[str, str]] = []  # (상영 날짜, 영화 고유번호) 오름차순 — 날짜 이분 탐색용
+        self._dates: List[str] = []                   # 상영이 있는 날짜 오름차순 (중복 없음) — 날짜 목록 페이지용
+        self.students: Dict[str, str] = {}     # 학번 → 비밀번호
+        self.bookings: List[dict] = []         # 파일 순서대로의 예매 레코드
+        self._by_movie: Dict[str, List[dict]] = {}  # 영화 고유번호 → 예매 레코드 (좌석 합 검사용)
+        self._by_student: Dict[str, List[dict]] = {}           # 학번 → 예매 레코드 (내역 조회/취소 목록용)
+        self._by_student_sorted: Dict[str, List[dict]] = {}    # 학번 → 예매 레코드 (영화 고유번호순, 취소 목록 페이지용)
+        self._held: Dict[Tuple[str, str], int] = {}            # (학번, 영화 고유번호) → 보유 좌석 마스크
+        self._records: int | None = None   # 예매 데이터 파일의 레코드 수 (취소 표시 포함, None이면 필요할 때 셈)
+
+    @classmethod
+    def load(cls, movie_path: Path, student_path: Path, booking_path: Path, journal_path: Path,
+             lock: FileLock | None = None) -> "CinemaRepository":
+        repo = cls(movie_path, student_path, booking_path, journal_path, lock)
+        repo.reload()
+        return repo
+
+    def reload(self) -> None:
+        """세 데이터 파일(+ 좌석 변경 저널)을 다시 읽어 메모리 상태를 갱신"""
+        with self.lock, profiling.phase("reload"):
+            self._reload_unlocked()
+            self._stamps = self._file_stamps()
+            self.validated = False
+
+    def adopt(self, movies: Dict[str, dict], students: Dict[str, str], bookings: List[dict]) -> None:
+        """
+        무결성 검사를 통과한 레코드(cinema.run_startup_checks 결과 또는 snapshot 캐시)로 메모리 상태를 채움.
+        파일을 다시 읽지 않으며(작은 상영관 데이터 파일만 읽음), 레코드는 저널이 반영된 상태여야 함.
+        """
+        with self.lock:
+            self.halls = read_hall_file(self.hall_path)
+            self._set_state(movies, students, bookings)
+            self._records = None
+            self._stamps = self._file_stamps()
+            self.validated = True
+
+    def _reload_unlocked(self) -> None:
+        self.halls = read_hall_file(self.hall_path)
+        movies = read_movie_file(self.movie_path)
+
+        masks = {mid: m["seats"] for mid, m in movies.items()}
+        self.journal.replay(masks)
+        for mid, mask in masks.items():
+            movies[mid]["seats"] = mask
+
+        students = {}
+        for line in self.student_path.read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            sid, pw = line.strip().split("/", 1)
+            students[sid] = pw
+
+        records = read_booking_records(self.booking_path)
+        self._set_state(movies, students, [records[i] for i in resolve_tombstones(records)[0]])
+        self._records = len(records)
+
+    def _set_state(self, movies: Dict[str, dict], students: Dict[str, str], bookings: List[dict]) -> None:
+        self.movies = movies
+        self.students = students
+        self.bookings = bookings
+        # 고유번호와 날짜 필드는 연도만 일치가 보장되므로 날짜 필드 자체로 정렬한 색인을 따로 둠
+        self._date_index = sorted((m["date"], mid) for mid, m in movies.items())
+        self._dates = list(dict.fromkeys(d for d, _ in self._date_index))
+        self._by_student_sorted = {}   # 학생마다 처음 조회할 때 구성 (_sorted_bookings_of)
+        # _index_booking을 예매마다 호출하는 것과 같은 결과를 한 번의 루프로 구성 (시작 시간 단축)
+        by_movie: Dict[str, List[dict]] = {}
+        by_student: Dict[str, List[dict]] = {}
+        held: Dict[Tuple[str, str], int] = {}
+        for b in bookings:
+            sid, mid = b["sid"], b["movie_id"]
+            lst = by_movie.get(mid)
+            if lst is None:
+                by_movie[mid] = [b]
+            else:
+                lst.append(b)
+            lst = by_student.get(sid)
+            if lst is None:
+                by_student[sid] = [b]
+            else:
+                lst.append(b)
+            key = (sid, mid)
+            held[key] = held.get(key, 0) | b["seats"]
+        self._by_movie = by_movie
+        self._by_student = by_student
+        self._held = held
+
+    def _index_booking(self, b: dict) -> None:
+        self._by_movie.setdefault(b["movie_id"], []).append(b)
+        self._by_student.setdefault(b["sid"], []).append(b)
+        ordered = self._by_student_sorted.get(b["sid"])
+        if ordered is not None:
+            insort(ordered, b, key=itemgetter("movie_id"))
+        key = (b["sid"], b["movie_id"])
+        self._held[key] = self._held.get(key, 0) | b["seats"]
+
+    def _unindex_booking(self, b: dict) -> None:
+        self._by_movie[b["movie_id"]].remove(b)
+        self._by_student[b["sid"]].remove(b)
+        ordered = self._by_student_sorted.get(b["sid"])
+        if ordered is not None:
+            ordered.remove(b)
+        key = (b["sid"], b["movie_id"])
+        held = self._held.get(key, 0) & ~b["seats"]
+        if held:
+            self._held[key] = held
+        else:
+            self._held.pop(key, None)
+
+    # -----------------------------------------------------------
+    # 프로세스 간 동기화
+    # -----------------------------------------------------------
+    def _file_stamps(self) -> Tuple:
+        stamps = []
+        for path in (self.movie_path, self.student_path, self.booking_path, self.journal.path, self.hall_path):
+            try:
+                st = path.stat()
+                stamps.append((st.st_ino, st.st_size, st.st_mtime_ns))
+            except FileNotFoundError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def refresh(self) -> None:
+        """마지막으로 읽은 뒤 다른 프로세스가 데이터 파일을 바꿨으면 다시 읽음"""
+        with self.lock:
+            if self._file_stamps() != self._stamps:
+                self.reload()
+
+    @contextmanager
+    def transaction(self):
+        """
+        잠금을 잡고(재진입 가능) 최신 파일 상태를 반영한 뒤 변경 작업을 수행.
+        가장 바깥 트랜잭션이 끝날 때 자신이 쓴 파일 상태를 기록해 다음 refresh에서 다시 읽지 않도록 함.
+        """
+        outermost = not self.lock.held
+        with self.lock:
+            if outermost:
+                self.refresh()
+            try:
+                yield self
+            finally:
+                if outermost:
+                    self._stamps = self._file_stamps()
+
+    # -----------------------------------------------------------
+    # 조회
+    # -----------------------------------------------------------
+    def get_movie(self, movie_id: str) -> dict | None:
+        return self.movies.get(movie_id)
+
+    def hall_of(self, movie_id: str) -> Hall:
+        """상영의 상영관 (영화 데이터에 없는 고유번호면 기본 상영관)"""
+        movie = self.movies.get(movie_id)
+        return DEFAULT_HALL if movie is None else movie_hall(movie, self.halls)
+
+    def iter_movies(self):
+        """영화 레코드를 고유번호 오름차순으로 순회"""
+        return iter(self.movies.values())
+
+    def iter_movies_from(self, date_str: str, inclusive: bool = True):
+        """
+        상영 날짜가 date_str 이후(inclusive=True면 당일 포함)인 영화 레코드를 날짜순(같은 날은 고유번호순)으로 순회.
+        날짜 색인을 이분 탐색해 시작 위치를 찾으므로, 지난 상영이 아무리 많아도 건너뛰는 비용은 O(log n).
+        """
+        find = bisect_left if inclusive else bisect_right
+        index = self._date_index
+        for i in range(find(index, date_str, key=itemgetter(0)), len(index)):
+            yield self.movies[index[i][1]]
+
+    def movies_on(self, date_str: str) -> List[dict]:
+        """해당 날짜의 영화 레코드 (고유번호순)"""
+        movies = []
+        for movie in self.iter_movies_from(date_str):
+            if movie["date"] != date_str:
+                break
+            movies.append(movie)
+        return movies
+
+    def movies_before(self, date_str: str) -> List[dict]:
+        """상영 날짜가 date_str보다 앞선 영화 레코드 (날짜순, 같은 날은 고유번호순) — 보관(archive.py) 대상 찾기용"""
+        index = self._date_index
+        return [self.movies[mid] for _, mid in index[:bisect_left(index, date_str, key=itemgetter(0))]]
+
+    def upcoming_dates(self, after_date: str, limit: int, offset: int = 0) -> List[str]:
+        """after_date 다음 날부터 상영이 있는 날짜를 오름차순으로 offset번째부터 최대 limit개 (이분 탐색 + 슬라이스)"""
+        start = bisect_right(self._dates, after_date) + offset
+        return self._dates[start:start + limit]
+
+    def count_upcoming_dates(self, after_date: str) -> int:
+        """after_date 다음 날부터 상영이 있는 날짜 수"""
+        return len(self._dates) - bisect_right(self._dates, after_date)
+
+    def bookings_of(self, student_id: str) -> List[dict]:
+        """학생의 예매 레코드 (파일 순서)"""
+        return self._by_student.get(student_id, [])
+
+    def bookings_with_movies(self, student_id: str) -> List[Tuple[dict, dict]]:
+        """
+        학생의 예매 레코드를 영화 레코드와 조인한 (예매, 영화) 목록 (파일 순서).
+        영화 고유번호로 딕셔너리를 바로 조회하므로 예매 1건당 O(1) — 상영표 크기와 무관.
+        영화 데이터에 없는 고유번호를 참조하는 예매는 건너뜀.
+        """
+        joined = []
+        for b in self.bookings_of(student_id):
+            movie = self.movies.get(b["movie_id"])
+            if movie is not None:
+                joined.append((b, movie))
+        return joined
+
+    def _sorted_bookings_of(self, student_id: str) -> List[dict]:
+        """학생의 예매 레코드 (영화 고유번호순, 같은 상영은 파일 순서). 학생마다 한 번만 정렬하고 이후 변경은 삽입/삭제로 유지"""
+        ordered = self._by_student_sorted.get(student_id)
+        if ordered is None:
+            ordered = sorted(self.bookings_of(student_id), key=itemgetter("movie_id"))
+            self._by_student_sorted[student_id] = ordered
+        return ordered
+
+    def _upcoming_start(self, ordered: List[dict], after_date: str) -> int:
+        # 고유번호 앞 8자리(YYYYMMDD)가 after_date 다음 날 이후인 첫 위치
+        return bisect_right(ordered, after_date.replace("-", "") + "9999", key=itemgetter("movie_id"))
+
+    def upcoming_bookings(self, student_id: str, after_date: str, limit: int,
+                          offset: int = 0) -> List[Tuple[dict, dict]]:
+        """
+        고유번호의 날짜가 after_date 다음 날 이후인 학생의 예매를 영화 레코드와 조인한 (예매, 영화) 목록
+        (영화 고유번호순)에서 offset번째부터 최대 limit개. 영화 데이터에 없는 고유번호를 참조하는 예매는 건너뜀.
+        """
+        ordered = self._sorted_bookings_of(student_id)
+        start = self._upcoming_start(ordered, after_date) + offset
+        joined = []
+        for b in ordered[start:start + limit]:
+            movie = self.movies.get(b["movie_id"])
+            if movie is not None:
+                joined.append((b, movie))
+        return joined
+
+    def count_upcoming_bookings(self, student_id: str, after_date: str) -> int:
+        ordered = self._sorted_bookings_of(student_id)
+        return len(ordered) - self._upcoming_start(ordered, after_date)
+
+    def held_seats(self, student_id: str, movie_id: str) -> int:
+        """학생이 해당 상영에서 이미 보유한 좌석 마스크"""
+        return self._held.get((student_id, movie_id), 0)
+
+    def remaining_quota(self, student_id: str, movie_id: str) -> int:
+        """학생이 해당 상영에서 추가로 예매할 수 있는 좌석 수"""
+        return max(0, MAX_SEATS_PER_SHOWING - self.held_seats(student_id, movie_id).bit_count())
+
+    def bookings_for_movie(self, movie_id: str) -> List[dict]:
+        return self._by_movie.get(movie_id, [])
+
+    # -----------------------------------------------------------
+    # 변경 (write-through)
+    # -----------------------------------------------------------
+    def add_student(self, sid: str, pw: str) -> bool:
+        """신규 회원을 등록하고 학생 데이터 파일 끝에 <학번>/<비밀번호>를 추가. 그사이 다른 곳에서 가입된 학번이면 False"""
+        with self.transaction(), profiling.phase("commit:add_student"):
+            if sid in self.students:
+                return False
+            append_record(self.student_path, f"{sid}/{pw}")
+            self.students[sid] = pw
+            return True
+
+    def add_booking(self, student_id: str, movie_id: str, booking_seats: int) -> dict:
+        """
+        예매 레코드를 추가하고 해당 영화의 좌석 유무 마스크에 반영 (OR).
+        확정 시점의 최신 상태 기준으로 아무것도 쓰지 않고 예외 발생:
+        - 좌석이 이미 예매되어 있으면 SeatConflictError
+        - 학생의 해당 상영 보유 좌석이 MAX_SEATS_PER_SHOWING을 넘게 되면 QuotaExceededError
+        """
+        with self.transaction(), profiling.phase("commit:add_booking"):
+            movie = self.movies[movie_id]
+            taken = movie["seats"] & booking_seats
+            if taken:
+                raise SeatConflictError(movie_id, taken)
+            remaining = self.remaining_quota(student_id, movie_id)
+            if booking_seats.bit_count() > remaining:
+                raise QuotaExceededError(student_id, movie_id, remaining)
+
+            seat_count = self.hall_of(movie_id).count
+            movie["seats"] |= booking_seats
+            self.journal.append(movie_id, "+", booking_seats, seat_count)
+
+            booking = {"sid": student_id, "movie_id": movie_id, "seats": booking_seats}
+            append_booking_records(self.booking_path, [booking], seat_count)
+            if self._records is not None:
+                self._records += 1
+            self.bookings.append(booking)
+            self._index_booking(booking)
+            self._maybe_checkpoint()
+            return booking
+
+    def cancel_booking(self, student_id: str, movie_id: str, booking_seats: int) -> dict | None:
+        """
+        예매 좌석을 취소하고 영화 좌석 유무 마스크를 복원(AND-NOT).
+        좌석이 같은 예매 레코드가 없으면 그 좌석을 모두 포함한 예매 레코드(압축으로 합쳐진 레코드)에서 일부만 취소:
+        예매 데이터 파일에는 그 레코드의 취소 표시와 남은 좌석의 새 예매 레코드를 한 번에 추가.
+        죽은 레코드가 많아지면 압축. 취소한 예매(좌석은 booking_seats)를 반환하며,
+        그사이 다른 곳에서 이미 취소되어 대상이 없으면 None.
+        """
+        with self.transaction(), profiling.phase("commit:cancel_booking"):
+            candidates = [b for b in self.bookings_of(student_id)
+                          if b["movie_id"] == movie_id and b["seats"] & booking_seats == booking_seats]
+            if not booking_seats or not candidates:
+                return None
+            booking = next((b for b in candidates if b["seats"] == booking_seats), candidates[0])
+
+            self.bookings.remove(booking)
+            self._unindex_booking(booking)
+            movie = self.movies.get(movie_id)
+            seat_count = self.hall_of(movie_id).count
+            if movie is not None:
+                movie["seats"] &= ~booking_seats
+                self.journal.append(movie_id, "-", booking_seats, seat_count)
+            appended = [tombstone_of(booking)]
+            if booking["seats"] != booking_seats:
+                rest = {"sid": student_id, "movie_id": movie_id, "seats": booking["seats"] & ~booking_seats}
+                appended.append(rest)
+                self.bookings.append(rest)
+                self._index_booking(rest)
+            append_booking_records(self.booking_path, appended, seat_count)
+            if self._records is not None:
+                self._records += len(appended)
+            self._maybe_checkpoint()
+            self._maybe_compact()
+            return {"sid": student_id, "movie_id": movie_id, "seats": booking_seats}
+
+    # -----------------------------------------------------------
+    # 체크포인트 (저널 → movie-schedule.txt)
+    # -----------------------------------------------------------
+    def checkpoint(self) -> None:
+        """최신 좌석 상태로 movie-schedule.txt를 원자적으로 다시 쓰고 저널을 비움"""
+        with self.transaction(), profiling.phase("commit:checkpoint"):
+            if self.journal.size() == 0:
+                return
+            self._write_movies()
+            self.journal.clear()
+
+    def _maybe_checkpoint(self) -> None:
+        if self.journal.needs_checkpoint():
+            self.checkpoint()
+
+    # -----------------------------------------------------------
+    # 압축 (취소 표시 → 예매 데이터 파일 다시 쓰기)
+    # -----------------------------------------------------------
+    def dead_records(self) -> int:
+        """예매 데이터 파일에서 읽을 때 건너뛰는 레코드 수 (취소 표시와 그 대상, 좌석이 모두 0인 레코드)"""
+        if self._records is None:
+            self._records = count_booking_records(self.booking_path)
+        return self._records - len(self.bookings)
+
+    def compact(self) -> None:
+        """예매 데이터 파일을 압축(compact_booking_file)하고 그 결과로 메모리 상태를 갱신"""
+        with self.transaction(), profiling.phase("commit:compact"):
+            bookings = compact_booking_file(self.booking_path)
+            self._set_state(self.movies, self.students, bookings)
+            self._records = len(bookings)
+
+    def _maybe_compact(self) -> None:
+        dead = self.dead_records()
+        if dead >= COMPACT_MIN_DEAD and dead >= self._records * COMPACT_DEAD_RATIO:
+            self.compact()
+
+    # -----------------------------------------------------------
+    # 보관 (지난 상영을 보관 파티션으로 떼어 내거나 되돌림 — archive.py)
+    # -----------------------------------------------------------
+    def detach_movies(self, movie_ids) -> List[dict]:
+        """
+        영화 레코드들과 그 예매를 저장소와 데이터 파일에서 뺌 (보관 파티션에 기록한 뒤 호출).
+        저널을 먼저 체크포인트한 뒤 예매 데이터 파일(취소 표시 정리) → 영화 데이터 파일 순으로 원자적으로 다시 씀
+        (도중에 멈춰도 예매나 저널이 없는 영화 고유번호를 참조하는 일은 없음).
+        return: 뺀 예매 레코드 (파일 순서)
+        """
+        with self.transaction(), profiling.phase("commit:detach"):
+            self.checkpoint()
+            ids = set(movie_ids)
+            kept: List[dict] = []
+            removed: List[dict] = []
+            for b in self.bookings:
+                (removed if b["movie_id"] in ids else kept).append(b)
+            self._write_bookings(kept)
+            movies = {mid: m for mid, m in self.movies.items() if mid not in ids}
+            self._set_state(movies, self.students, kept)
+            self._records = len(kept)
+            self._write_movies()
+            return removed
+
+    def attach_movies(self, movies: List[dict], bookings: List[dict]) -> None:
+        """
+        보관 파티션에서 되돌린 영화 레코드들과 그 예매를 저장소와 데이터 파일에 더함 (detach_movies의 반대).
+        영화 데이터 파일 → 예매 데이터 파일 순으로 다시 씀 (저널은 먼저 체크포인트).
+        이미 있는 고유번호, 없는 상영관, 같은 날짜 상영 10개 이상이 되면 아무것도 바꾸지 않고 ValueError.
+        """
+        with self.transaction(), profiling.phase("commit:attach"):
+            clash = [m["id"] for m in movies if m["id"] in self.movies]
+            if clash:
+                raise ValueError(f"이미 상영표에 있는 고유번호입니다: {', '.join(clash[:5])}")
+            unknown = [m["id"] for m in movies if "hall" in m and m["hall"] not in self.halls]
+            if unknown:
+                raise ValueError(f"상영관 데이터 파일에 없는 상영관의 상영입니다: {', '.join(unknown[:5])}")
+            merged = dict(sorted([*self.movies.items(), *((m["id"], m) for m in movies)]))
+            daily: Dict[str, int] = {}
+            for m in merged.values():
+                daily[m["date"]] = daily.get(m["date"], 0) + 1
+            crowded = sorted(d for d, n in daily.items() if n >= 10)
+            if crowded:
+                raise ValueError(f"같은 날짜의 상영이 10개 이상이 됩니다: {', '.join(crowded[:5])}")
+            self.checkpoint()
+            self._set_state(merged, self.students, self.bookings + bookings)
+            self._write_movies()
+            self._write_bookings(self.bookings)
+            self._records = len(self.bookings)
+
+    # -----------------------------------------------------------
+    # 파일 기록
+    # -----------------------------------------------------------
+    def _write_movies(self) -> None:
+        write_movie_file(self.movie_path, self.movies.values(), self.halls)
+
+    def _write_bookings(self, bookings: List[dict]) -> None:
+        counts = {b["movie_id"]: self.hall_of(b["movie_id"]).count for b in bookings}
+        write_booking_file(self.booking_path, bookings, counts)
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 좌석 비트마스크 — seatmask.py
+
+좌석 벡터(길이 = 상영관 좌석 수의 0/1 리스트)를 정수 하나로 표현합니다.
+  • i번째 좌석(A1=0, A2=1, ..., 기본 상영관 E5=24)이 예매되어 있으면 i번째 비트가 1
+  • 예매      : 좌석 유무 마스크 | 예약 마스크
+  • 취소      : 좌석 유무 마스크 & ~예약 마스크
+  • 중복 예매 : 두 마스크의 & 가 0이 아님
+  • 좌석 수   : popcount (int.bit_count)
+
+파일에는 기존과 같이 '[0,1,0,...]' 텍스트 형식으로 저장됩니다.
+상영관(Hall)은 행 수 × 열 수 배치와 막힌 좌석(통로·기둥 등, 예매 불가) 마스크입니다.
+상영관을 지정하지 않은 상영은 기본 상영관(5행 × 5열, 막힌 좌석 없음 — 아래 ROWS/COLS)을 사용하며,
+나머지 상영관은 홈 경로의 상영관 데이터 파일(hall-info.txt, HALL_FILE)에 정의합니다.
+  • 레코드 형식 : <상영관번호>/<행 수>/<열 수>/<막힌 좌석 이름,...>  (막힌 좌석이 없으면 마지막 필드는 빈 문자열)
+  • 행 이름은 A부터 최대 Z(26행), 열 번호는 1부터 최대 99
+좌석 자동 배정(auto_assign)은 상영관 크기별로 미리 계산한 연속 좌석 묶음 마스크를 빈 좌석과 비교합니다.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+ROWS = ["A", "B", "C", "D", "E"]
+COLS = [1, 2, 3, 4, 5]
+SEAT_COUNT = len(ROWS) * len(COLS)          # 25
+FULL_MASK = (1 << SEAT_COUNT) - 1
+
+SEAT_NAMES = [f"{row}{col}" for row in ROWS for col in COLS]
+
+HALL_FILE = "hall-info.txt"
+ROW_LABELS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+MAX_HALL_ROWS = len(ROW_LABELS)   # 26
+MAX_HALL_COLS = 99
+
+_DIGITS = frozenset("01")
+
+
+# ---------------------------------------------------------------
+# 텍스트 ↔ 마스크
+# ---------------------------------------------------------------
+def parse_mask(text: str, count: int | None = SEAT_COUNT) -> int | None:
+    """
+    '[0,1,...]' 형태의 좌석 벡터 문자열을 마스크로 변환. 형식 위배 시 None.
+    - 대괄호 안쪽의 공백은 허용, 바깥쪽 공백은 불허
+    - 원소는 정확히 count개(상영관 좌석 수)의 0/1. count가 None이면 길이를 검사하지 않음 (검사를 통과한 파일 읽기용)
+    문자열 슬라이스와 int(..., 2)만 쓰므로 수백 석 상영관도 C 수준 속도로 변환
+    """
+    if len(text) < 2 or text[0] != "[" or text[-1] != "]":
+        return None
+    body = text[1:-1]
+    if count is None:
+        body = "".join(body.split())
+        count = (len(body) + 1) // 2
+        if count == 0:
+            return None
+    if len(body) != 2 * count - 1:
+        body = "".join(body.split())  # 안쪽 공백 제거 후 재검사
+        if len(body) != 2 * count - 1:
+            return None
+    digits = body[0::2]
+    if body[1::2] != "," * (count - 1) or not _DIGITS.issuperset(digits):
+        return None
+    # digits[0]이 A1(비트 0)이므로 뒤집어서 2진수로 해석
+    return int(digits[::-1], 2)
+
+
+def format_mask(mask: int, count: int = SEAT_COUNT) -> str:
+    """마스크를 길이 count(상영관 좌석 수)의 '[0,1,...]' 텍스트 형식으로 변환"""
+    return "[" + ",".join(f"{mask:0{count}b}"[::-1]) + "]"
+
+
+# ---------------------------------------------------------------
+# 좌석 이름 ↔ 마스크
+# ---------------------------------------------------------------
+def mask_to_seats(mask: int) -> List[str]:
+    """마스크에서 1인 좌석 이름을 좌석 순서(A1 → E5)대로 반환"""
+    seats = []
+    while mask:
+        low = mask & -mask
+        seats.append(SEAT_NAMES[low.bit_length() - 1])
+        mask ^= low
+    return seats
+
+
+# ---------------------------------------------------------------
+# 상영관 배치
+# ---------------------------------------------------------------
+class Hall:
+    """상영관 — rows행 × cols열과 막힌 좌석 마스크. 좌석 비트 = 행 번호 × cols + 열 번호 (A1 = 0)"""
+
+    __slots__ = ("id", "rows", "cols", "blocked", "count", "names", "index")
+
+    def __init__(self, hall_id: str | None, rows: int, cols: int, blocked: int = 0) -> None:
+        self.id = hall_id              # None이면 기본 상영관
+        self.rows = rows
+        self.cols = cols
+        self.blocked = blocked
+        self.count = rows * cols
+        self.names = [f"{row}{col}" for row in ROW_LABELS[:rows] for col in range(1, cols + 1)]
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+    def parse(self, text: str) -> int | None:
+        """이 상영관 크기의 좌석 벡터 문자열 → 마스크 (형식 위배 시 None)"""
+        return parse_mask(text, self.count)
+
+    def format(self, mask: int) -> str:
+        return format_mask(mask, self.count)
+
+    def seat_bit(self, name: str) -> int:
+        return 1 << self.index[name]
+
+    def seats_to_mask(self, names: Iterable[str]) -> int:
+        mask = 0
+        for name in names:
+            mask |= 1 << self.index[name]
+        return mask
+
+    def mask_to_seats(self, mask: int) -> List[str]:
+        """마스크에서 1인 좌석 이름을 좌석 순서대로 반환"""
+        seats = []
+        while mask:
+            low = mask & -mask
+            seats.append(self.names[low.bit_length() - 1])
+            mask ^= low
+        return seats
+
+    def free_seats(self, mask: int) -> int:
+        """예매 가능한 좌석 수 (막힌 좌석 제외)"""
+        return self.count - (mask | self.blocked).bit_count()
+
+    def auto_assign(self, taken: int, n: int) -> int:
+        """막힌 좌석을 예매된 좌석처럼 피해 n석을 자동 배정 (auto_assign)"""
+        return auto_assign(taken | self.blocked, n, self.rows, self.cols)
+
+
+DEFAULT_HALL = Hall(None, len(ROWS), len(COLS))
+
+
+def parse_hall_line(line: str) -> Hall | None:
+    """
+    상영관 레코드 한 행 → Hall. 형식/의미 위배 시 None
+    (상영관번호는 영문/숫자 1~10자, 행 1~26, 열 1~99, 막힌 좌석은 상영관 안의 서로 다른 좌석이며 모든 좌석을 막을 수 없음)
+    """
+    parts = line.split("/")
+    if len(parts) != 4:
+        return None
+    hall_id, rows, cols, blocked = parts
+    if not (1 <= len(hall_id) <= 10 and hall_id.isascii() and hall_id.isalnum()):
+        return None
+    if not (rows.isascii() and rows.isdigit() and cols.isascii() and cols.isdigit() and len(rows) <= 2 and len(cols) <= 2):
+        return None
+    if not (1 <= int(rows) <= MAX_HALL_ROWS and 1 <= int(cols) <= MAX_HALL_COLS):
+        return None
+    hall = Hall(hall_id, int(rows), int(cols))
+    mask = 0
+    for name in blocked.split(",") if blocked else ():
+        bit = hall.index.get(name)
+        if bit is None or mask >> bit & 1:
+            return None
+        mask |= 1 << bit
+    if mask.bit_count() == hall.count:
+        return None
+    hall.blocked = mask
+    return hall
+
+
+def read_hall_file(path: Path) -> Dict[str, Hall]:
+    """상영관 데이터 파일 → {상영관번호: Hall} (검사를 통과한 파일 전제, 파일이 없으면 빈 딕셔너리)"""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return {}
+    halls = {}
+    for line in lines:
+        hall = parse_hall_line(line)
+        halls[hall.id] = hall
+    return halls
+
+
+# ---------------------------------------------------------------
+# 자동 배정 — 가장 좋은 연속 좌석 묶음
+# ---------------------------------------------------------------
+MAX_BLOCK = 4   # 미리 계산하는 연속 좌석 묶음의 최대 크기 (한 상영당 최대 예매 좌석 수와 같음)
+
+
+@lru_cache(maxsize=None)
+def candidate_blocks(rows: int, cols: int) -> Tuple[Tuple[Tuple[int, float, float], ...], ...]:
+    """
+    상영관(rows행 × cols열, 비트 = 행 × cols + 열)의 한 행 안 연속 좌석 묶음을 크기별로 미리 계산.
+    return: [크기] → ((마스크, 행 중심, 열 중심), ...) — 가운데 행·가운데 열에 가까운 순
+    """
+    mid_row, mid_col = (rows - 1) / 2, (cols - 1) / 2
+    table: List[Tuple[Tuple[int, float, float], ...]] = [()]
+    for size in range(1, MAX_BLOCK + 1):
+        blocks = []
+        for r in range(rows):
+            for c in range(cols - size + 1):
+                mask = ((1 << size) - 1) << (r * cols + c)
+                center = c + (size - 1) / 2
+                # 가운데에서 먼 정도 (행/열 거리 제곱 합), 같으면 앞 행 → 왼쪽 열
+                blocks.append(((r - mid_row) ** 2 + (center - mid_col) ** 2, r, c, mask, center))
+        blocks.sort()
+        table.append(tuple((mask, r, center) for _, r, _, mask, center in blocks))
+    return tuple(table)
+
+
+def best_block(taken: int, n: int, rows: int = len(ROWS), cols: int = len(COLS)) -> int:
+    """한 행 안에서 비어 있는 n석 연속 묶음 중 가장 가운데에 가까운 것의 마스크. 없으면 0"""
+    for mask, _, _ in candidate_blocks(rows, cols)[n]:
+        if not taken & mask:
+            return mask
+    return 0
+
+
+def _partitions(n: int, largest: int) -> Iterator[Tuple[int, ...]]:
+    """n을 largest 이하의 자연수 합으로 나누는 방법 (큰 조각 먼저, 조각 수가 적은 것부터는 호출자가 정렬)"""
+    if n == 0:
+        yield ()
+        return
+    for part in range(min(n, largest), 0, -1):
+        for rest in _partitions(n - part, part):
+            yield (part,) + rest
+
+
+def _spread(mask: int, cols: int) -> Tuple[int, int]:
+    """마스크가 차지하는 좌석의 (행 범위, 열 범위)"""
+    rows_used, cols_used = set(), set()
+    while mask:
+        low = mask & -mask
+        r, c = divmod(low.bit_length() - 1, cols)
+        rows_used.add(r)
+        cols_used.add(c)
+        mask ^= low
+    return max(rows_used) - min(rows_used), max(cols_used) - min(cols_used)
+
+
+def auto_assign(taken: int, n: int, rows: int = len(ROWS), cols: int = len(COLS)) -> int:
+    """
+    빈 좌석 n석(1~MAX_BLOCK)을 자동 배정한 마스크. 빈 좌석이 n석보다 적으면 0.
+    - 한 행 안의 n석 연속 묶음이 있으면 가장 가운데에 가까운 묶음 (미리 계산한 후보마다 & 한 번)
+    - 없으면 n을 더 작은 연속 묶음들로 나눔: 첫 묶음은 가장 가운데에 가까운 것, 다음 묶음은 앞 묶음에 가장 가까운 것.
+      나누는 방법마다 배정해 보고 좌석이 퍼진 범위(행 범위 + 열 범위)가 가장 작은 것, 같으면 조각이 적은 것
+    """
+    block = best_block(taken, n, rows, cols)
+    if block:
+        return block
+    table = candidate_blocks(rows, cols)
+    best: Tuple[Tuple[int, int], int] | None = None
+    for parts in sorted(_partitions(n, n - 1), key=len):
+        chosen = 0
+        anchor: Tuple[float, float] | None = None
+        for size in parts:
+            found = None
+            if anchor is None:
+                found = next((b for b in table[size] if not taken & b[0]), None)
+            else:
+                free = [b for b in table[size] if not (taken | chosen) & b[0]]
+                if free:
+                    found = min(free, key=lambda b: abs(b[1] - anchor[0]) + abs(b[2] - anchor[1]))
+            if found is None:
+                break
+            chosen |= found[0]
+            if anchor is None:
+                anchor = (found[1], found[2])
+        else:
+            key = (sum(_spread(chosen, cols)), len(parts))
+            if best is None or key < best[0]:
+                best = (key, chosen)
+    return best[1] if best is not None else 0
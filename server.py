@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 다중 세션 서버 — server.py  (python KUCinema.py --serve [HOST:]PORT)
+
+TCP 연결 하나가 키오스크 하나입니다. 연결마다 콘솔과 똑같은 흐름
+(6.1 날짜 입력 → 6.2 로그인 → 6.3 주 프롬프트와 메뉴 1~4)을 실행하며, nc/telnet으로 접속할 수 있습니다.
+  • 세션 상태 : 연결마다 core.Session을 따로 두므로(contextvars) core.LOGGED_IN_SID / core.CURRENT_DATE_STR가
+                연결끼리 섞이지 않음
+  • 입출력    : 세션 스레드의 input()/print()를 해당 연결로 보냄. 출력은 모아 두었다가 입력을 기다릴 때 한 번에 전송
+  • 데이터    : 모든 세션이 메모리 상의 저장소 하나를 공유 (SharedRepository — 조회는 짧은 잠금 안에서 수행)
+  • 변경      : 회원가입/예매/취소/체크포인트는 단일 기록 태스크(CommitWriter)가 순서대로 확정.
+                대기 중인 변경을 모아 한 트랜잭션(파일 잠금 1회, 변경 확인 1회)으로 처리
+메뉴 코드는 입력을 기다리며 블로킹되므로 세션마다 스레드 하나에서 실행하고,
+연결 수락/소켓 입출력/기록 순서는 asyncio 이벤트 루프 하나가 담당합니다.
+
+Ctrl+C(SIGINT/SIGTERM)를 받으면 새 연결을 받지 않고, 열린 세션을 모두 끝낸 뒤 대기 중인 변경을 확정하고 종료합니다.
+세션에서 데이터 무결성 위배가 발견되면(콘솔에서는 프로그램 종료) 서버 전체를 종료 코드 1로 멈춥니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import queue
+import signal
+import sys
+import threading
+import traceback
+import types
+from collections.abc import MappingView
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from contextvars import ContextVar
+from pathlib import PurePath
+from typing import List, Tuple
+
+import core
+import profiling
+from cinema import info, error, warn, prompt_input_date, login_flow, main_prompt_loop
+from repository import CinemaRepository
+
+DEFAULT_HOST = "127.0.0.1"
+MAX_COMMIT_GROUP = 64          # 한 트랜잭션으로 묶는 최대 변경 수
+OUTPUT_FLUSH_BYTES = 64 * 1024  # 입력을 기다리기 전이라도 출력이 이만큼 쌓이면 전송
+SHUTDOWN_GRACE = 5.0           # 종료 시 세션 스레드가 끝나기를 기다리는 시간(초)
+
+
+def parse_address(text: str) -> Tuple[str, int]:
+    """'PORT' 또는 'HOST:PORT' → (호스트, 포트)"""
+    host, _, port = text.rpartition(":")
+    if not port.isdigit() or not 0 <= int(port) <= 65535:
+        raise ValueError(f"포트 번호가 올바르지 않습니다: {text}")
+    return host.strip("[]") or DEFAULT_HOST, int(port)
+
+
+# ---------------------------------------------------------------
+# 세션 입출력 — 세션 스레드의 input()/print()를 연결로 전달
+# ---------------------------------------------------------------
+class SessionChannel:
+    """세션 스레드 ↔ 이벤트 루프 사이의 입출력 통로 (연결 하나당 하나)"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, writer: asyncio.StreamWriter) -> None:
+        self._loop = loop
+        self._writer = writer
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self._lines: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+
+    # 세션 스레드에서 호출
+    def write(self, text: str) -> int:
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if self._pending_size >= OUTPUT_FLUSH_BYTES:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if self._pending:
+            data = "".join(self._pending).encode("utf-8")
+            self._pending.clear()
+            self._pending_size = 0
+            self._loop.call_soon_threadsafe(self._send, data)
+
+    def readline(self, prompt: str) -> str:
+        """프롬프트까지의 출력을 보내고 다음 입력 행을 기다림. 연결이 끊겼으면 EOFError"""
+        self.write(prompt)
+        self.flush()
+        line = self._lines.get()
+        if line is None:
+            self._lines.put(None)  # 이후의 input()도 계속 EOFError
+            raise EOFError
+        return line
+
+    def close(self) -> None:
+        self.flush()
+        self._loop.call_soon_threadsafe(self._writer.close)
+
+    # 이벤트 루프에서 호출
+    def _send(self, data: bytes) -> None:
+        if not self._writer.is_closing():
+            self._writer.write(data)
+
+    def feed(self, line: str | None) -> None:
+        """받은 입력 행을 세션 스레드에 전달. None은 연결 종료"""
+        self._lines.put(line)
+
+
+_CHANNEL: ContextVar[SessionChannel | None] = ContextVar("kucinema_channel", default=None)
+
+
+class _RoutedStdout:
+    """현재 스레드가 세션 스레드면 그 연결로, 아니면 원래 표준 출력으로 쓰는 sys.stdout 대체"""
+
+    def __init__(self, fallback) -> None:
+        self._fallback = fallback
+
+    def write(self, text: str) -> int:
+        channel = _CHANNEL.get()
+        return (channel or self._fallback).write(text)
+
+    def flush(self) -> None:
+        channel = _CHANNEL.get()
+        if channel is None:
+            self._fallback.flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self._fallback, name)
+
+
+def _install_session_io():
+    """input()/sys.stdout을 세션 경로로 바꾸고, 원래대로 되돌리는 함수를 반환"""
+    real_input, real_stdout = builtins.input, sys.stdout
+
+    def routed_input(prompt: object = "") -> str:
+        channel = _CHANNEL.get()
+        if channel is None:
+            return real_input(prompt)
+        with profiling.waiting():  # --profile: 입력 대기 시간은 구간 시간에서 제외
+            return channel.readline(str(prompt))
+
+    builtins.input = routed_input
+    sys.stdout = _RoutedStdout(real_stdout)
+
+    def restore() -> None:
+        builtins.input = real_input
+        sys.stdout = real_stdout
+    return restore
+
+
+# ---------------------------------------------------------------
+# 공유 저장소 — 조회는 잠금 안에서, 변경은 단일 기록 태스크로
+# ---------------------------------------------------------------
+class _Gate:
+    """저장소 접근을 한 스레드씩으로 제한하는 재진입 가능 잠금 (현재 소유 스레드를 알 수 있음)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._owner: int | None = None
+        self._depth = 0
+
+    def __enter__(self) -> "_Gate":
+        self._lock.acquire()
+        self._owner = threading.get_ident()
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._owner = None
+        self._lock.release()
+
+    def owned(self) -> bool:
+        return self._owner == threading.get_ident()
+
+
+class _ExclusiveSection:
+    """저장소 잠금 + 데이터 파일 잠금 (cinema.run_full_check의 `with repo.lock:`용)"""
+
+    def __init__(self, gate: _Gate, repo: CinemaRepository) -> None:
+        self._gate = gate
+        self._repo = repo
+
+    def __enter__(self) -> "_ExclusiveSection":
+        self._gate.__enter__()
+        self._repo.lock.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._repo.lock.release()
+        self._gate.__exit__(*exc)
+
+
+class CommitWriter:
+    """
+    변경 요청을 하나의 asyncio 태스크가 도착 순서대로 확정.
+    대기 중인 요청을 최대 MAX_COMMIT_GROUP개까지 모아 저장소 트랜잭션 하나로 처리하며,
+    파일 기록은 전용 스레드 하나에서 수행해 이벤트 루프를 막지 않음.
+    """
+
+    def __init__(self, repo: CinemaRepository, gate: _Gate, loop: asyncio.AbstractEventLoop) -> None:
+        self._repo = repo
+        self._gate = gate
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kucinema-writer")
+        self._closed = False
+        self.commits = 0
+        self.groups = 0
+
+    def submit(self, method, *args):
+        """(세션 스레드에서) 변경을 요청하고 확정될 때까지 기다려 결과를 반환. 저장소의 예외는 그대로 전달"""
+        if self._closed:
+            raise RuntimeError("서버가 종료 중입니다.")
+        future: Future = Future()
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (method, args, future))
+        return future.result()
+
+    async def run(self) -> None:
+        while True:
+            group = [await self._queue.get()]
+            while len(group) < MAX_COMMIT_GROUP and not self._queue.empty():
+                group.append(self._queue.get_nowait())
+            stop = None in group
+            group = [item for item in group if item is not None]
+            if group:
+                await self._loop.run_in_executor(self._executor, self._apply, group)
+            if stop:
+                break
+        # 종료 직전에 들어온 요청은 거절
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                item[2].set_exception(RuntimeError("서버가 종료 중입니다."))
+        self._executor.shutdown(wait=True)
+
+    def _apply(self, group: list) -> None:
+        try:
+            with self._gate, self._repo.transaction():
+                for method, args, future in group:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        future.set_result(method(*args))
+                    except Exception as e:
+                        future.set_exception(e)
+            self.commits += len(group)
+            self.groups += 1
+        except Exception as e:
+            # 잠금/파일 상태 확인 자체가 실패 — 아직 처리하지 못한 요청에 같은 오류 전달
+            for _, _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def close(self) -> None:
+        """대기 중인 변경을 모두 확정한 뒤 기록 태스크를 끝냄"""
+        self._closed = True
+        self._queue.put_nowait(None)
+
+
+_PLAIN_VALUES = (str, int, float, bool, bytes, type(None), PurePath)   # 바뀌지 않는 값 — 감싸지 않고 그대로 전달
+
+
+def _copied(result):
+    """조회 결과 복사 — 목록/제너레이터는 잠금 안에서 다 읽어 둠 (다른 세션의 변경과 섞이지 않도록)"""
+    if isinstance(result, types.GeneratorType):
+        return iter(list(result))
+    if isinstance(result, (list, MappingView)):
+        return list(result)
+    return result
+
+
+class _GatedView:
+    """
+    저장소 속성(students, movies, halls, bookings, journal 등)을 감싼 프록시.
+    조회(get, in, [], len, 순회, items/keys/values, 메서드 호출)를 모두 저장소 잠금 안에서 실행하므로,
+    SQLite 저장소의 students(_StudentTable)도 기록 스레드가 트랜잭션을 연 동안에는 연결을 쓰지 않음
+    """
+
+    __slots__ = ("_value", "_gate")
+
+    def __init__(self, value, gate: _Gate) -> None:
+        self._value = value
+        self._gate = gate
+
+    def _call(self, method, *args, **kwargs):
+        with self._gate:
+            return _copied(method(*args, **kwargs))
+
+    def __getattr__(self, name: str):
+        with self._gate:
+            value = getattr(self._value, name)
+        if callable(value):
+            return lambda *args, **kwargs: self._call(value, *args, **kwargs)
+        return value if isinstance(value, _PLAIN_VALUES) else _GatedView(value, self._gate)
+
+    def __contains__(self, key) -> bool:
+        with self._gate:
+            return key in self._value
+
+    def __getitem__(self, key):
+        with self._gate:
+            return self._value[key]
+
+    def __len__(self) -> int:
+        with self._gate:
+            return len(self._value)
+
+    def __iter__(self):
+        with self._gate:
+            return iter(list(self._value))
+
+    def __bool__(self) -> bool:
+        with self._gate:
+            return bool(self._value)
+
+
+class SharedRepository:
+    """
+    세션들이 core.REPO로 쓰는 공유 저장소 프록시.
+    - 변경(COMMIT_METHODS)은 CommitWriter로 보내 확정을 기다림
+      (이미 저장소 잠금을 잡은 스레드, 예: --full-check 중이면 바로 실행)
+    - 조회는 저장소 잠금 안에서 실행하고, 목록/제너레이터 결과는 복사해 반환 (다른 세션의 변경과 섞이지 않도록)
+    - 메서드가 아닌 속성도 잠금 안에서 읽고, 문자열/경로 같은 값이 아니면(students, movies, halls 등)
+      조회마다 잠금을 잡는 _GatedView로 감싸 반환
+    """
+
+    COMMIT_METHODS = frozenset({"add_student", "add_booking", "cancel_booking", "checkpoint", "compact"})
+
+    def __init__(self, repo: CinemaRepository, gate: _Gate, writer: CommitWriter) -> None:
+        self._repo = repo
+        self._gate = gate
+        self._writer = writer
+
+    @property
+    def lock(self) -> _ExclusiveSection:
+        return _ExclusiveSection(self._gate, self._repo)
+
+    def __getattr__(self, name: str):
+        with self._gate:
+            value = getattr(self._repo, name)
+        if not callable(value):
+            return value if isinstance(value, _PLAIN_VALUES) else _GatedView(value, self._gate)
+        if name in self.COMMIT_METHODS:
+            return lambda *args: self._commit(value, args)
+        return lambda *args, **kwargs: self._read(value, args, kwargs)
+
+    def _commit(self, method, args: tuple):
+        if self._gate.owned():
+            return method(*args)
+        return self._writer.submit(method, *args)
+
+    def _read(self, method, args: tuple, kwargs: dict):
+        with self._gate:
+            return _copied(method(*args, **kwargs))
+
+
+# ---------------------------------------------------------------
+# 세션 실행
+# ---------------------------------------------------------------
+def session_flow(repo) -> None:
+    """연결 하나의 흐름 — 콘솔 main()과 같은 6.1 날짜 입력 → 6.2 로그인 → 6.3 주 프롬프트"""
+    core.CURRENT_DATE_STR = prompt_input_date()
+    core.LOGGED_IN_SID = login_flow(repo)
+    main_prompt_loop()
+    info("프로그램을 종료합니다.")
+
+
+def _run_session(session: core.Session, channel: SessionChannel, done) -> None:
+    """세션 스레드 본체. 끝나면 done(상태)를 호출 — 0이 아니면 무결성 위배로 인한 종료"""
+    core.use_session(session)
+    _CHANNEL.set(channel)
+    status = 0
+    try:
+        session_flow(session.REPO)
+    except EOFError:
+        pass  # 연결 끊김
+    except SystemExit as e:
+        status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        _CHANNEL.set(None)
+        error("세션 처리 중 예외가 발생했습니다.")
+        traceback.print_exc()
+    finally:
+        channel.close()
+        done(status)
+
+
+class CinemaServer:
+    """연결 수락, 세션 스레드 관리, 단일 기록 태스크를 묶은 서버"""
+
+    def __init__(self, repo: CinemaRepository) -> None:
+        self.repo = repo
+        self.exit_code = 0
+        self.sessions_total = 0
+        self._channels: set[SessionChannel] = set()
+        self._finished: set[asyncio.Future] = set()
+
+    async def serve(self, host: str, port: int) -> int:
+        loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        gate = _Gate()
+        self.writer = CommitWriter(self.repo, gate, loop)
+        self.shared = SharedRepository(self.repo, gate, self.writer)
+
+        try:
+            server = await asyncio.start_server(self._handle, host, port, backlog=1024)
+        except OSError as e:
+            error(f"서버를 시작할 수 없습니다: {host}:{port} ({e})")
+            return 1
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            with suppress(NotImplementedError, AttributeError):
+                loop.add_signal_handler(sig, self._stop.set)
+
+        writer_task = asyncio.create_task(self.writer.run())
+        bound = ", ".join(f"{s.getsockname()[0]}:{s.getsockname()[1]}" for s in server.sockets)
+        info(f"KUCinema 서버가 {bound}에서 접속을 기다립니다. (종료: Ctrl+C)")
+        sys.stdout.flush()
+        try:
+            await self._stop.wait()
+        finally:
+            server.close()
+            for channel in list(self._channels):
+                channel.feed(None)
+            if self._finished:
+                await asyncio.wait(self._finished, timeout=SHUTDOWN_GRACE)
+            await self.writer.close()
+            await writer_task
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                with suppress(NotImplementedError, AttributeError):
+                    loop.remove_signal_handler(sig)
+
+        info(f"서버를 종료합니다. 세션 {self.sessions_total}개, "
+             f"변경 요청 {self.writer.commits}건을 트랜잭션 {self.writer.groups}번으로 처리했습니다.")
+        return self.exit_code
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        channel = SessionChannel(loop, writer)
+        finished = loop.create_future()
+        session = core.Session(self.shared)
+
+        def done(status: int) -> None:
+            loop.call_soon_threadsafe(self._session_done, finished, status)
+
+        self._channels.add(channel)
+        self._finished.add(finished)
+        self.sessions_total += 1
+        threading.Thread(target=_run_session, args=(session, channel, done), daemon=True,
+                         name=f"kucinema-session-{self.sessions_total}").start()
+        try:
+            while not finished.done():
+                try:
+                    data = await reader.readline()
+                except (ConnectionError, ValueError, asyncio.LimitOverrunError):
+                    break
+                if not data:
+                    break
+                channel.feed(data.decode("utf-8", "replace").rstrip("\r\n"))
+        finally:
+            channel.feed(None)
+            await finished
+            self._channels.discard(channel)
+            self._finished.discard(finished)
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    def _session_done(self, finished: asyncio.Future, status: int) -> None:
+        if not finished.done():
+            finished.set_result(status)
+        if status != 0:
+            warn("세션에서 데이터 무결성 위배가 발견되어 서버를 종료합니다.")
+            self.exit_code = status
+            self._stop.set()
+
+
+def run_server(address: str, repo: CinemaRepository) -> int:
+    """서버를 실행하고 종료 코드를 반환 (0 정상 종료, 1 시작 실패 또는 무결성 위배)"""
+    try:
+        host, port = parse_address(address)
+    except ValueError as e:
+        error(str(e))
+        return 1
+    restore = _install_session_io()
+    try:
+        return asyncio.run(CinemaServer(repo).serve(host, port))
+    finally:
+        restore()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema 검증 상태 캐시 — snapshot.py
+
+무결성 검사를 통과한 데이터 파일의 지문(fingerprint)과 파싱 결과(스냅숏)를 함께 저장해 두고,
+다음 실행 때 지문이 모두 같으면 검사와 파싱을 건너뛰고 스냅숏을 바로 읽습니다.
+  • 캐시 파일 : 홈 경로의 .kucinema.cache
+  • 지문      : 파일마다 (크기, mtime_ns, 내용 해시) — 파일이 없으면 None
+                크기/mtime이 다르면 해시 계산 없이 바로 불일치로 판정
+  • 스냅숏    : 영화/학생/예매 레코드를 튜플로 줄여 marshal로 직렬화
+  • 캐시 파일이 없거나 손상되었거나 지문이 하나라도 다르면 None을 반환하고,
+    호출 측은 전체 무결성 검사로 돌아갑니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+CACHE_FILE = ".kucinema.cache"
+_MAGIC = b"KUCS"
+_FORMAT_VERSION = 2   # 2: 영화 레코드에 상영관번호 추가
+_DIGEST_SIZE = 16
+
+Fingerprint = Tuple[int, int, bytes] | None
+State = Tuple[Dict[str, dict], Dict[str, str], List[dict]]
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=_DIGEST_SIZE).digest()
+
+
+def fingerprint(path: Path) -> Fingerprint:
+    """(크기, mtime_ns, 내용 해시). 파일이 없으면 None"""
+    try:
+        st = path.stat()
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns, _digest(data)
+
+
+def _header() -> bytes:
+    return _MAGIC + bytes([_FORMAT_VERSION, marshal.version])
+
+
+def save_snapshot(cache_path: Path, paths: Sequence[Path], movies: Dict[str, dict],
+                  students: Dict[str, str], bookings: List[dict]) -> None:
+    """
+    검사를 통과한 상태를 현재 파일 지문과 함께 저장 (임시 파일 작성 후 교체).
+    paths의 파일들이 검사 시점과 같은 내용이어야 하므로 데이터 파일 잠금 안에서 호출.
+    """
+    payload = marshal.dumps((
+        [fingerprint(p) for p in paths],
+        [(m["id"], m["title"], m["date"], m["time"], m["seats"], m.get("hall")) for m in movies.values()],
+        students,
+        [(b["sid"], b["movie_id"], b["seats"]) for b in bookings],
+    ))
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(_header() + _digest(payload) + payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # 캐시는 선택 사항 — 기록하지 못해도 다음 실행이 전체 검사를 할 뿐
+
+
+def load_snapshot(cache_path: Path, paths: Sequence[Path]) -> State | None:
+    """저장된 지문이 현재 파일들과 모두 같으면 (영화, 학생, 예매) 레코드를, 아니면 None을 반환"""
+    try:
+        raw = cache_path.read_bytes()
+    except OSError:
+        return None
+    head = _header()
+    body = raw[len(head) + _DIGEST_SIZE:]
+    if raw[:len(head)] != head or raw[len(head):len(head) + _DIGEST_SIZE] != _digest(body):
+        return None
+    try:
+        saved, movie_rows, students, booking_rows = marshal.loads(body)
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    if len(saved) != len(paths):
+        return None
+    for path, fp in zip(paths, saved):
+        if fp is None:
+            if path.exists():
+                return None
+            continue
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        if (st.st_size, st.st_mtime_ns) != (fp[0], fp[1]) or fingerprint(path) != tuple(fp):
+            return None
+
+    movies = {}
+    for mid, title, dstr, tstr, seats, hall in movie_rows:
+        movies[mid] = {"id": mid, "title": title, "date": dstr, "time": tstr, "seats": seats}
+        if hall is not None:
+            movies[mid]["hall"] = hall
+    bookings = [{"sid": sid, "movie_id": mid, "seats": seats} for sid, mid, seats in booking_rows]
+    return movies, students, bookings
@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+"""
+KUCinema SQLite 저장소 — sqlstore.py  (python sqlstore.py import|export [DIR])
+
+홈 경로에 kucinema.db가 있으면 프로그램은 텍스트 데이터 파일 대신 이 데이터베이스를 저장소로 사용합니다.
+메모리에 전체 데이터를 올리지 않고, 메뉴의 조회마다 색인을 타는 질의를 실행합니다.
+  • showings(id, title, date, time, seats) : 영화 레코드 — 색인 (date, id)
+  • students(sid, pw)                      : 학생 레코드
+  • bookings(id, sid, movie_id, seats)     : 예매 레코드 (id = 파일 순서) — 색인 sid, movie_id, (sid, movie_id)
+좌석은 텍스트 저장소와 같은 25비트 정수 마스크이며, 좌석 변경 저널은 쓰지 않습니다
+(예매/취소가 예매 행과 상영 좌석을 트랜잭션 하나로 함께 바꿈). WAL 저널 모드를 사용합니다.
+모든 상영이 기본 상영관(5×5)을 사용합니다 — 상영관을 지정한 상영이 있는 데이터는 가져올 수 없습니다.
+
+CinemaRepository(repository.py)와 같은 조회/변경 메서드를 제공하므로 메뉴 1~4의 프롬프트와 출력은 그대로입니다.
+transaction()은 BEGIN IMMEDIATE(중첩 시 SAVEPOINT)로, 다른 프로세스의 변경은 질의마다 바로 보입니다.
+무결성 검사는 cinema.validate_database가 이 모듈의 검사 질의를 사용해 수행합니다.
+
+텍스트 파일은 교환 형식입니다.
+  python sqlstore.py import [DIR] : 데이터 파일(텍스트 또는 .bin)을 시작 시와 같은 규칙으로 검사한 뒤 kucinema.db 생성
+  python sqlstore.py export [DIR] : kucinema.db → movie-schedule.txt, student-info.txt, booking-info.txt
+텍스트 저장소로 되돌아가려면 export 후 kucinema.db를 지우면 됩니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import profiling
+from locking import FileLock, LOCK_FILE
+from repository import (MAX_SEATS_PER_SHOWING, QuotaExceededError, SeatConflictError, format_booking_line,
+                        format_movie_line)
+from seatmask import DEFAULT_HALL, FULL_MASK, Hall
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS showings (
+    id    TEXT PRIMARY KEY CHECK (length(id) = 12 AND id NOT GLOB '*[^0-9]*'),
+    title TEXT NOT NULL,
+    date  TEXT NOT NULL,
+    time  TEXT NOT NULL,
+    seats INTEGER NOT NULL CHECK (seats BETWEEN 0 AND {FULL_MASK})
+);
+CREATE INDEX IF NOT EXISTS showings_date ON showings (date, id);
+CREATE TABLE IF NOT EXISTS students (
+    sid TEXT PRIMARY KEY CHECK (length(sid) = 2 AND sid NOT GLOB '*[^0-9]*'),
+    pw  TEXT NOT NULL CHECK (length(pw) = 4 AND pw NOT GLOB '*[^0-9]*')
+);
+CREATE TABLE IF NOT EXISTS bookings (
+    id       INTEGER PRIMARY KEY,
+    sid      TEXT NOT NULL REFERENCES students (sid),
+    movie_id TEXT NOT NULL REFERENCES showings (id),
+    seats    INTEGER NOT NULL CHECK (seats BETWEEN 1 AND {FULL_MASK})
+);
+CREATE INDEX IF NOT EXISTS bookings_sid ON bookings (sid);
+CREATE INDEX IF NOT EXISTS bookings_sid_movie ON bookings (sid, movie_id);
+CREATE INDEX IF NOT EXISTS bookings_movie ON bookings (movie_id);
+"""
+
+_MOVIE_COLUMNS = "id, title, date, time, seats"
+_BOOKING_COLUMNS = "sid, movie_id, seats"
+
+
+def _movie_row(_cursor, row) -> dict:
+    return {"id": row[0], "title": row[1], "date": row[2], "time": row[3], "seats": row[4]}
+
+
+def _booking_row(_cursor, row) -> dict:
+    return {"sid": row[0], "movie_id": row[1], "seats": row[2]}
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """자동 커밋 모드(트랜잭션은 직접 BEGIN)로 연결하고 WAL/외래 키를 켬. 서버 모드의 세션 스레드들이 함께 사용"""
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.create_function("popcount", 1, int.bit_count, deterministic=True)
+    return conn
+
+
+class _StudentTable:
+    """repo.students처럼 쓰는 학생 테이블 뷰 (sid in students, students[sid], students.get(sid))"""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def get(self, sid: str, default: str | None = None) -> str | None:
+        row = self._conn.execute("SELECT pw FROM students WHERE sid = ?", (sid,)).fetchone()
+        return default if row is None else row[0]
+
+    def __getitem__(self, sid: str) -> str:
+        pw = self.get(sid)
+        if pw is None:
+            raise KeyError(sid)
+        return pw
+
+    def __contains__(self, sid: object) -> bool:
+        return self._conn.execute("SELECT 1 FROM students WHERE sid = ?", (sid,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (row[0] for row in self._conn.execute("SELECT sid FROM students ORDER BY rowid"))
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+
+    def items(self) -> List[Tuple[str, str]]:
+        return self._conn.execute("SELECT sid, pw FROM students ORDER BY rowid").fetchall()
+
+
+class SqliteRepository:
+    """CinemaRepository와 같은 인터페이스를 SQLite 질의로 제공하는 저장소"""
+
+    backend = "sqlite"
+    validated = False   # 검증 상태 캐시(.kucinema.cache)는 쓰지 않음 — 시작 검사가 질의로 끝나므로
+
+    def __init__(self, path: Path, lock: FileLock | None = None) -> None:
+        self.path = path
+        # 오류 메시지에 쓰는 데이터 파일 경로 — 모두 데이터베이스 파일
+        self.movie_path = self.student_path = self.booking_path = path
+        self.lock = lock if lock is not None else FileLock(path.with_name(LOCK_FILE))
+        self.conn = connect(path)
+        self.students = _StudentTable(self.conn)
+        self.halls: Dict[str, Hall] = {}   # 기본 상영관만 지원
+        self._depth = 0   # transaction() 중첩 깊이
+
+    @classmethod
+    def open(cls, path: Path, lock: FileLock | None = None) -> "SqliteRepository":
+        repo = cls(path, lock)
+        repo.conn.executescript(_SCHEMA)
+        return repo
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _query(self, row_factory, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        cursor = self.conn.cursor()
+        cursor.row_factory = row_factory
+        return cursor.execute(sql, params)
+
+    # -----------------------------------------------------------
+    # 프로세스 간 동기화 — 질의마다 최신 상태를 읽으므로 다시 읽을 것이 없음
+    # -----------------------------------------------------------
+    def refresh(self) -> None:
+        pass
+
+    def reload(self) -> None:
+        pass
+
+    @contextmanager
+    def transaction(self):
+        """
+        가장 바깥은 BEGIN IMMEDIATE(쓰기 잠금을 먼저 잡아 읽은 상태 그대로 확정), 안쪽은 SAVEPOINT.
+        블록에서 예외가 나면 그 단계의 변경만 되돌림.
+        """
+        outermost = self._depth == 0
+        self.conn.execute("BEGIN IMMEDIATE" if outermost else f"SAVEPOINT sp{self._depth}")
+        self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._depth -= 1
+            if outermost:
+                self.conn.execute("ROLLBACK")
+            else:
+                self.conn.execute(f"ROLLBACK TO sp{self._depth}")
+                self.conn.execute(f"RELEASE sp{self._depth}")
+            raise
+        self._depth -= 1
+        self.conn.execute("COMMIT" if outermost else f"RELEASE sp{self._depth}")
+
+    # -----------------------------------------------------------
+    # 조회
+    # -----------------------------------------------------------
+    def get_movie(self, movie_id: str) -> dict | None:
+        return self._query(_movie_row, f"SELECT {_MOVIE_COLUMNS} FROM showings WHERE id = ?", (movie_id,)).fetchone()
+
+    def hall_of(self, movie_id: str) -> Hall:
+        return DEFAULT_HALL
+
+    def iter_movies(self):
+        """영화 레코드를 고유번호 오름차순으로 순회"""
+        return iter(self._query(_movie_row, f"SELECT {_MOVIE_COLUMNS} FROM showings ORDER BY id").fetchall())
+
+    def iter_movies_from(self, date_str: str, inclusive: bool = True):
+        """상영 날짜가 date_str 이후(inclusive=True면 당일 포함)인 영화 레코드를 날짜순(같은 날은 고유번호순)으로 순회"""
+        op = ">=" if inclusive else ">"
+        yield from self._query(_movie_row, f"SELECT {_MOVIE_COLUMNS} FROM showings WHERE date {op} ? "
+                                           f"ORDER BY date, id", (date_str,))
+
+    def movies_on(self, date_str: str) -> List[dict]:
+        """해당 날짜의 영화 레코드 (고유번호순)"""
+        return self._query(_movie_row, f"SELECT {_MOVIE_COLUMNS} FROM showings WHERE date = ? ORDER BY id",
+                           (date_str,)).fetchall()
+
+    def upcoming_dates(self, after_date: str, limit: int, offset: int = 0) -> List[str]:
+        """after_date 다음 날부터 상영이 있는 날짜를 오름차순으로 offset번째부터 최대 limit개"""
+        rows = self.conn.execute("SELECT DISTINCT date FROM showings WHERE date > ? ORDER BY date LIMIT ? OFFSET ?",
+                                 (after_date, limit, offset))
+        return [row[0] for row in rows]
+
+    def count_upcoming_dates(self, after_date: str) -> int:
+        return self.conn.execute("SELECT COUNT(DISTINCT date) FROM showings WHERE date > ?", (after_date,)).fetchone()[0]
+
+    def bookings_of(self, student_id: str) -> List[dict]:
+        """학생의 예매 레코드 (파일 순서)"""
+        return self._query(_booking_row, f"SELECT {_BOOKING_COLUMNS} FROM bookings WHERE sid = ? ORDER BY id",
+                           (student_id,)).fetchall()
+
+    def bookings_with_movies(self, student_id: str) -> List[Tuple[dict, dict]]:
+        """학생의 예매 레코드를 영화 레코드와 조인한 (예매, 영화) 목록 (파일 순서)"""
+        rows = self.conn.execute(
+            "SELECT b.sid, b.movie_id, b.seats, m.id, m.title, m.date, m.time, m.seats "
+            "FROM bookings b JOIN showings m ON m.id = b.movie_id WHERE b.sid = ? ORDER BY b.id", (student_id,))
+        return [(_booking_row(None, row[:3]), _movie_row(None, row[3:])) for row in rows]
+
+    def upcoming_bookings(self, student_id: str, after_date: str, limit: int,
+                          offset: int = 0) -> List[Tuple[dict, dict]]:
+        """고유번호의 날짜가 after_date 다음 날 이후인 학생의 (예매, 영화) 목록 (영화 고유번호순)의 한 페이지"""
+        rows = self.conn.execute(
+            "SELECT b.sid, b.movie_id, b.seats, m.id, m.title, m.date, m.time, m.seats "
+            "FROM bookings b JOIN showings m ON m.id = b.movie_id WHERE b.sid = ? AND b.movie_id > ? "
+            "ORDER BY b.movie_id, b.id LIMIT ? OFFSET ?",
+            (student_id, after_date.replace("-", "") + "9999", limit, offset))
+        return [(_booking_row(None, row[:3]), _movie_row(None, row[3:])) for row in rows]
+
+    def count_upcoming_bookings(self, student_id: str, after_date: str) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM bookings WHERE sid = ? AND movie_id > ?",
+                                 (student_id, after_date.replace("-", "") + "9999")).fetchone()[0]
+
+    def held_seats(self, student_id: str, movie_id: str) -> int:
+        """학생이 해당 상영에서 이미 보유한 좌석 마스크"""
+        held = 0
+        for (seats,) in self.conn.execute("SELECT seats FROM bookings WHERE sid = ? AND movie_id = ?",
+                                          (student_id, movie_id)):
+            held |= seats
+        return held
+
+    def remaining_quota(self, student_id: str, movie_id: str) -> int:
+        """학생이 해당 상영에서 추가로 예매할 수 있는 좌석 수"""
+        return max(0, MAX_SEATS_PER_SHOWING - self.held_seats(student_id, movie_id).bit_count())
+
+    def bookings_for_movie(self, movie_id: str) -> List[dict]:
+        return self._query(_booking_row, f"SELECT {_BOOKING_COLUMNS} FROM bookings WHERE movie_id = ? ORDER BY id",
+                           (movie_id,)).fetchall()
+
+    # -----------------------------------------------------------
+    # 변경 — 각각 트랜잭션 하나
+    # -----------------------------------------------------------
+    def add_student(self, sid: str, pw: str) -> bool:
+        """신규 회원을 등록. 그사이 다른 곳에서 가입된 학번이면 False"""
+        with self.transaction(), profiling.phase("commit:add_student"):
+            cursor = self.conn.execute("INSERT OR IGNORE INTO students (sid, pw) VALUES (?, ?)", (sid, pw))
+            return cursor.rowcount == 1
+
+    def add_booking(self, student_id: str, movie_id: str, booking_seats: int) -> dict:
+        """
+        예매 행을 추가하고 상영 좌석 마스크에 반영 (OR).
+        좌석이 이미 예매되어 있으면 SeatConflictError, 보유 좌석 한도를 넘으면 QuotaExceededError (아무것도 쓰지 않음)
+        """
+        with self.transaction(), profiling.phase("commit:add_booking"):
+            taken = self.conn.execute("SELECT seats FROM showings WHERE id = ?", (movie_id,)).fetchone()[0]
+            taken &= booking_seats
+            if taken:
+                raise SeatConflictError(movie_id, taken)
+            remaining = self.remaining_quota(student_id, movie_id)
+            if booking_seats.bit_count() > remaining:
+                raise QuotaExceededError(student_id, movie_id, remaining)
+
+            self.conn.execute("UPDATE showings SET seats = seats | ? WHERE id = ?", (booking_seats, movie_id))
+            self.conn.execute("INSERT INTO bookings (sid, movie_id, seats) VALUES (?, ?, ?)",
+                              (student_id, movie_id, booking_seats))
+            return {"sid": student_id, "movie_id": movie_id, "seats": booking_seats}
+
+    def cancel_booking(self, student_id: str, movie_id: str, booking_seats: int) -> dict | None:
+        """
+        일치하는 예매 행(가장 먼저 추가된 것)을 삭제하고 상영 좌석 마스크를 복원(AND-NOT).
+        삭제한 레코드를 반환하며, 그사이 다른 곳에서 이미 취소되어 대상이 없으면 None.
+        """
+        with self.transaction(), profiling.phase("commit:cancel_booking"):
+            row = self.conn.execute("SELECT id FROM bookings WHERE sid = ? AND movie_id = ? AND seats = ? "
+                                    "ORDER BY id LIMIT 1", (student_id, movie_id, booking_seats)).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("DELETE FROM bookings WHERE id = ?", row)
+            self.conn.execute("UPDATE showings SET seats = seats & ~? WHERE id = ?", (booking_seats, movie_id))
+            return {"sid": student_id, "movie_id": movie_id, "seats": booking_seats}
+
+    def checkpoint(self) -> None:
+        """WAL 내용을 데이터베이스 파일에 합치고 WAL을 비움 (종료 시 호출)"""
+        with profiling.phase("commit:checkpoint"):
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    # -----------------------------------------------------------
+    # 무결성 검사 질의 (보고/종료는 cinema.validate_database)
+    # -----------------------------------------------------------
+    def structure_problems(self) -> List[str]:
+        """데이터베이스 파일 구조와 제약 조건(CHECK/NOT NULL) 검사. 문제가 없으면 빈 리스트"""
+        rows = [row[0] for row in self.conn.execute("PRAGMA quick_check")]
+        return [] if rows == ["ok"] else rows
+
+    def dangling_bookings(self, table: str) -> List[dict]:
+        """table('students' 또는 'showings')에 없는 학번/영화 고유번호를 참조하는 예매 레코드 (파일 순서)"""
+        column, key = {"students": ("sid", "sid"), "showings": ("movie_id", "id")}[table]
+        return self._query(_booking_row, f"SELECT {_BOOKING_COLUMNS} FROM bookings b WHERE NOT EXISTS "
+                                         f"(SELECT 1 FROM {table} WHERE {key} = b.{column}) ORDER BY id").fetchall()
+
+    def seat_sums_consistent(self) -> bool:
+        """
+        상영마다 예약 마스크끼리 겹치지 않고, 그 합이 상영 좌석 마스크와 같은지.
+        마스크들이 서로 겹치지 않는 것은 합의 비트 수가 비트 수의 합과 같은 것(덧셈에 올림이 없음)과 같으므로
+        예약끼리 짝지어 비교하지 않고 상영별 집계 한 번으로 확인. 텍스트 검사와 같이 예매가 있는 상영만 비교
+        """
+        mismatched = self.conn.execute(
+            "SELECT 1 FROM (SELECT movie_id, SUM(seats) AS total, SUM(popcount(seats)) AS n "
+            "FROM bookings GROUP BY movie_id) b JOIN showings m ON m.id = b.movie_id "
+            "WHERE m.seats != b.total OR popcount(b.total) != b.n LIMIT 1").fetchone()
+        return mismatched is None
+
+    def crowded_dates(self, limit: int) -> List[str]:
+        """상영이 limit개 이상인 날짜"""
+        return [row[0] for row in self.conn.execute(
+            "SELECT date FROM showings GROUP BY date HAVING COUNT(*) >= ?", (limit,))]
+
+
+# ---------------------------------------------------------------
+# 가져오기/내보내기 (텍스트 ↔ SQLite)
+# ---------------------------------------------------------------
+def import_files(data_dir: Path) -> Tuple[int, int, int]:
+    """
+    데이터 디렉터리의 데이터 파일을 시작 시와 같은 규칙으로 검사(위배 시 같은 오류 출력 후 종료)한 뒤
+    새 kucinema.db를 만듦 (임시 파일 작성 후 교체). return: (영화, 학생, 예매) 레코드 수
+    상영관을 지정한 상영이 있으면 ValueError (SQLite 저장소는 기본 상영관만 지원)
+    """
+    from cinema import BOOKING_FILE, DATABASE_FILE, JOURNAL_FILE, MOVIE_FILE, STUDENT_FILE, run_startup_checks
+    import binstore
+
+    binary = (data_dir / binstore.MOVIE_BIN_FILE).exists()
+    movie_path = data_dir / (binstore.MOVIE_BIN_FILE if binary else MOVIE_FILE)
+    booking_path = data_dir / (binstore.BOOKING_BIN_FILE if binary else BOOKING_FILE)
+    student_path = data_dir / STUDENT_FILE
+    for path in (student_path, booking_path):
+        if not path.exists():
+            raise FileNotFoundError(f"데이터 파일이 없습니다: {path}")
+
+    with FileLock(data_dir / LOCK_FILE):
+        movies, students, bookings = run_startup_checks(movie_path, student_path, booking_path,
+                                                        data_dir / JOURNAL_FILE)
+        hall_movies = [m["id"] for m in movies.values() if "hall" in m]
+        if hall_movies:
+            raise ValueError(f"상영관을 지정한 상영은 SQLite 저장소로 가져올 수 없습니다: {', '.join(hall_movies[:5])}")
+        tmp_path = data_dir / (DATABASE_FILE + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+        conn = sqlite3.connect(tmp_path, isolation_level=None)
+        try:
+            conn.executescript(_SCHEMA)
+            conn.execute("BEGIN")
+            conn.executemany("INSERT INTO showings VALUES (?, ?, ?, ?, ?)",
+                             ((m["id"], m["title"], m["date"], m["time"], m["seats"]) for m in movies.values()))
+            conn.executemany("INSERT INTO students VALUES (?, ?)", students.items())
+            conn.executemany("INSERT INTO bookings (sid, movie_id, seats) VALUES (?, ?, ?)",
+                             ((b["sid"], b["movie_id"], b["seats"]) for b in bookings))
+            conn.execute("COMMIT")
+            conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            conn.close()
+        os.replace(tmp_path, data_dir / DATABASE_FILE)
+    return len(movies), len(students), len(bookings)
+
+
+def _write_lines(path: Path, lines) -> int:
+    """행 사이에만 줄바꿈을 넣어 텍스트 파일을 원자적으로 씀 (프로그램이 쓰는 데이터 파일과 같은 모양). return: 행 수"""
+    count = 0
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8", newline="\n") as f:
+        for line in lines:
+            f.write(line if count == 0 else "\n" + line)
+            count += 1
+    os.replace(tmp_path, path)
+    return count
+
+
+def export_files(data_dir: Path) -> Tuple[int, int, int]:
+    """kucinema.db를 텍스트 데이터 파일 세 개로 내보냄 (읽기 트랜잭션 하나의 일관된 상태). return: 레코드 수"""
+    from cinema import BOOKING_FILE, DATABASE_FILE, MOVIE_FILE, STUDENT_FILE
+
+    path = data_dir / DATABASE_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"데이터베이스가 없습니다: {path}")
+    repo = SqliteRepository(path)
+    try:
+        repo.conn.execute("BEGIN")
+        movies = _write_lines(data_dir / MOVIE_FILE, (format_movie_line(m) for m in repo._query(
+            _movie_row, f"SELECT {_MOVIE_COLUMNS} FROM showings ORDER BY id")))
+        students = _write_lines(data_dir / STUDENT_FILE, (f"{sid}/{pw}" for sid, pw in repo.students.items()))
+        bookings = _write_lines(data_dir / BOOKING_FILE, (format_booking_line(b) for b in repo._query(
+            _booking_row, f"SELECT {_BOOKING_COLUMNS} FROM bookings ORDER BY id")))
+        repo.conn.execute("COMMIT")
+    finally:
+        repo.close()
+    return movies, students, bookings
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="sqlstore.py", description="KUCinema SQLite 저장소 가져오기/내보내기")
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("data_dir", nargs="?", type=Path, default=Path.cwd(), help="데이터 디렉터리 (기본: 현재 경로)")
+    args = parser.parse_args(argv)
+    from cinema import DATABASE_FILE
+
+    if args.command == "import" and (args.data_dir / DATABASE_FILE).exists():
+        print(f"!!! 오류: 이미 {args.data_dir / DATABASE_FILE}가 있습니다. 내보낸 뒤 지우고 다시 가져오세요.")
+        return 1
+    try:
+        run = import_files if args.command == "import" else export_files
+        movies, students, bookings = run(args.data_dir)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"!!! 오류: {e}")
+        return 1
+    verb = "가져왔습니다" if args.command == "import" else "내보냈습니다"
+    print(f"영화 레코드 {movies}개, 학생 레코드 {students}개, 예매 레코드 {bookings}개를 {verb}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())